@@ -0,0 +1,187 @@
+"""
+Benchmark of ArrayManager.update_bar and indicator calculation.
+
+The legacy array manager below shifts all arrays by one element for
+every new bar, as the original implementation did.
+"""
+
+from datetime import datetime
+from time import perf_counter
+from timeit import timeit
+
+import numpy as np
+import talib
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData
+from vnpy.trader.utility import ArrayManager
+
+
+BAR_COUNT: int = 20_000
+
+
+class LegacyArrayManager:
+    """
+    Array manager shifting arrays in every update.
+    """
+
+    def __init__(self, size: int = 100) -> None:
+        """"""
+        self.count: int = 0
+        self.size: int = size
+        self.inited: bool = False
+
+        self.open_array: np.ndarray = np.zeros(size)
+        self.high_array: np.ndarray = np.zeros(size)
+        self.low_array: np.ndarray = np.zeros(size)
+        self.close_array: np.ndarray = np.zeros(size)
+        self.volume_array: np.ndarray = np.zeros(size)
+        self.turnover_array: np.ndarray = np.zeros(size)
+        self.open_interest_array: np.ndarray = np.zeros(size)
+
+    def update_bar(self, bar: BarData) -> None:
+        """"""
+        self.count += 1
+        if not self.inited and self.count >= self.size:
+            self.inited = True
+
+        self.open_array[:-1] = self.open_array[1:]
+        self.high_array[:-1] = self.high_array[1:]
+        self.low_array[:-1] = self.low_array[1:]
+        self.close_array[:-1] = self.close_array[1:]
+        self.volume_array[:-1] = self.volume_array[1:]
+        self.turnover_array[:-1] = self.turnover_array[1:]
+        self.open_interest_array[:-1] = self.open_interest_array[1:]
+
+        self.open_array[-1] = bar.open_price
+        self.high_array[-1] = bar.high_price
+        self.low_array[-1] = bar.low_price
+        self.close_array[-1] = bar.close_price
+        self.volume_array[-1] = bar.volume
+        self.turnover_array[-1] = bar.turnover
+        self.open_interest_array[-1] = bar.open_interest
+
+
+def create_bars() -> list[BarData]:
+    """"""
+    prices: np.ndarray = 100 + np.random.randn(BAR_COUNT).cumsum()
+
+    return [
+        BarData(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(),
+            interval=Interval.MINUTE,
+            gateway_name="DB",
+            open_price=price,
+            high_price=price + 1,
+            low_price=price - 1,
+            close_price=price,
+            volume=100,
+            turnover=price * 100,
+        )
+        for price in prices
+    ]
+
+
+def run_indicators(manager: ArrayManager, bars: list[BarData]) -> None:
+    """
+    Update bar and calculate latest indicator values as a strategy does.
+    """
+    for bar in bars:
+        manager.update_bar(bar)
+
+        if not manager.inited:
+            continue
+
+        manager.sma(20)
+        manager.ema(20)
+        manager.boll(20, 2)
+        manager.atr(14)
+        manager.rsi(14)
+        manager.macd(12, 26, 9)
+
+
+def check_incremental(bars: list[BarData]) -> None:
+    """
+    Check recursive incremental indicators are equal to TA-Lib outputs
+    calculated over the whole history, as they are seeded from the first
+    full window.
+    """
+    manager: ArrayManager = ArrayManager(100, incremental=True)
+
+    for i, bar in enumerate(bars[:2000]):
+        manager.update_bar(bar)
+
+        if not manager.inited:
+            continue
+
+        close: np.ndarray = np.array([b.close_price for b in bars[:i + 1]])
+        high: np.ndarray = np.array([b.high_price for b in bars[:i + 1]])
+        low: np.ndarray = np.array([b.low_price for b in bars[:i + 1]])
+
+        macd, signal, hist = talib.MACD(close, 12, 26, 9)
+
+        results: list[tuple] = [
+            (manager.ema(20), talib.EMA(close, 20)[-1]),
+            (manager.atr(14), talib.ATR(high, low, close, 14)[-1]),
+            (manager.rsi(14), talib.RSI(close, 14)[-1]),
+            *zip(manager.macd(12, 26, 9), (macd[-1], signal[-1], hist[-1]), strict=True),
+        ]
+        for value, expected in results:
+            assert np.isclose(value, expected, rtol=1e-9, atol=1e-9), (i, value, expected)
+
+
+def benchmark_indicators(bars: list[BarData]) -> None:
+    """"""
+    print(f"\n{'size':>8}{'talib(us)':>14}{'incremental(us)':>18}")
+
+    for size in [100, 1000, 5000]:
+        results: list[float] = []
+
+        for incremental in [False, True]:
+            manager: ArrayManager = ArrayManager(size, incremental)
+            start: float = perf_counter()
+            run_indicators(manager, bars)
+            seconds: float = perf_counter() - start
+            results.append(seconds / BAR_COUNT * 1_000_000)
+
+        print(f"{size:>8}{results[0]:>14,.2f}{results[1]:>18,.2f}")
+
+
+def main() -> None:
+    """"""
+    bars: list[BarData] = create_bars()
+
+    # Check both managers return the same time series
+    legacy: LegacyArrayManager = LegacyArrayManager(100)
+    current: ArrayManager = ArrayManager(100)
+    for bar in bars[:1000]:
+        legacy.update_bar(bar)
+        current.update_bar(bar)
+    assert np.array_equal(legacy.close_array, current.close)
+
+    check_incremental(bars)
+
+    print(f"{'size':>8}{'legacy(us)':>14}{'current(us)':>14}")
+
+    for size in [100, 1000, 5000, 20000]:
+        results: list[float] = []
+
+        for manager_class in [LegacyArrayManager, ArrayManager]:
+            manager = manager_class(size)
+
+            def run(manager: LegacyArrayManager | ArrayManager = manager) -> None:
+                for bar in bars:
+                    manager.update_bar(bar)
+
+            seconds: float = timeit(run, number=1)
+            results.append(seconds / BAR_COUNT * 1_000_000)
+
+        print(f"{size:>8}{results[0]:>14,.2f}{results[1]:>14,.2f}")
+
+    benchmark_indicators(bars)
+
+
+if __name__ == "__main__":
+    main()
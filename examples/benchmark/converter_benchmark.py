@@ -0,0 +1,123 @@
+"""
+Benchmark of PositionHolding.update_order with many resting close orders.
+
+The legacy holding below recalculates frozen volume from all active
+orders on every order update, as the original implementation did.
+"""
+
+from random import choice, randint, seed
+from time import perf_counter
+
+from vnpy.trader.constant import Direction, Exchange, Offset, Product, Status
+from vnpy.trader.converter import PositionHolding
+from vnpy.trader.object import ContractData, OrderData, PositionData
+
+
+RESTING_COUNT: int = 200
+UPDATE_COUNT: int = 50_000
+
+
+class LegacyPositionHolding(PositionHolding):
+    """
+    Position holding with full recalculation for every order update.
+    """
+
+    def update_order(self, order: OrderData) -> None:
+        """"""
+        if order.is_active():
+            self.active_orders[order.vt_orderid] = order
+        elif order.vt_orderid in self.active_orders:
+            self.active_orders.pop(order.vt_orderid)
+
+        self.calculate_frozen()
+
+
+def create_holding(holding_class: type[PositionHolding]) -> PositionHolding:
+    """"""
+    contract: ContractData = ContractData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        name="rb2501",
+        product=Product.FUTURES,
+        size=10,
+        pricetick=1,
+        gateway_name="BENCH"
+    )
+    holding: PositionHolding = holding_class(contract)
+
+    for direction in [Direction.LONG, Direction.SHORT]:
+        holding.update_position(PositionData(
+            symbol=contract.symbol,
+            exchange=contract.exchange,
+            direction=direction,
+            volume=100_000,
+            yd_volume=50_000,
+            gateway_name=contract.gateway_name
+        ))
+
+    return holding
+
+
+def create_updates() -> list[OrderData]:
+    """
+    Create resting close orders, then random partial fills and cancels.
+    """
+    seed(0)
+
+    orders: list[OrderData] = []
+    for i in range(RESTING_COUNT):
+        orders.append(OrderData(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=choice([Direction.LONG, Direction.SHORT]),
+            offset=choice([Offset.CLOSE, Offset.CLOSETODAY, Offset.CLOSEYESTERDAY]),
+            volume=randint(1, 10),
+            status=Status.NOTTRADED,
+            gateway_name="BENCH"
+        ))
+
+    updates: list[OrderData] = list(orders)
+    for _ in range(UPDATE_COUNT):
+        order: OrderData = choice(orders)
+
+        update: OrderData = OrderData(
+            symbol=order.symbol,
+            exchange=order.exchange,
+            orderid=order.orderid,
+            direction=order.direction,
+            offset=order.offset,
+            volume=order.volume,
+            traded=randint(0, int(order.volume)),
+            status=choice([Status.PARTTRADED, Status.PARTTRADED, Status.CANCELLED]),
+            gateway_name=order.gateway_name
+        )
+        updates.append(update)
+
+    return updates
+
+
+def main() -> None:
+    """"""
+    updates: list[OrderData] = create_updates()
+
+    # Check incremental result with full recalculation
+    PositionHolding.debug = True
+    holding: PositionHolding = create_holding(PositionHolding)
+    for order in updates:
+        holding.update_order(order)
+    PositionHolding.debug = False
+
+    for holding_class in [LegacyPositionHolding, PositionHolding]:
+        holding = create_holding(holding_class)
+
+        start: float = perf_counter()
+        for order in updates:
+            holding.update_order(order)
+        cost: float = perf_counter() - start
+
+        print(f"{holding_class.__name__}: {cost / len(updates) * 1_000_000:.2f} us per update")
+
+
+if __name__ == "__main__":
+    main()
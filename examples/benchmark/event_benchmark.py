@@ -0,0 +1,104 @@
+"""
+Benchmark of EventEngine dispatching throughput and latency.
+
+The legacy engine below reproduces the original one-event-per-get
+processing loop, so that the batched dispatching of the current
+EventEngine can be compared against it.
+"""
+
+from queue import Empty, Queue
+from threading import Event as ThreadEvent
+from time import perf_counter
+
+import numpy as np
+
+from vnpy.event import Event, EventEngine
+
+
+EVENT_TEST: str = "eTest"
+EVENT_COUNT: int = 200_000
+HANDLER_COUNT: int = 3
+
+
+class LegacyEventEngine(EventEngine):
+    """
+    Event engine using the original dispatching loop.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self._queue: Queue = Queue()       # type: ignore
+
+    def _run(self) -> None:
+        """"""
+        while self._active:
+            try:
+                event: Event = self._queue.get(block=True, timeout=1)
+                self._process(event)
+            except Empty:
+                pass
+
+    def _process(self, event: Event) -> None:
+        """"""
+        if event.type in self._handlers:
+            [handler(event) for handler in self._handlers[event.type]]
+
+        if self._general_handlers:
+            [handler(event) for handler in self._general_handlers]
+
+
+def run_benchmark(engine: EventEngine) -> tuple[float, float, float]:
+    """
+    Return events per second, p50 and p99 latency in microseconds.
+    """
+    latencies: np.ndarray = np.zeros(EVENT_COUNT)
+    finished: ThreadEvent = ThreadEvent()
+    count: int = 0
+
+    def record(event: Event) -> None:
+        nonlocal count
+        latencies[count] = perf_counter() - event.data
+        count += 1
+
+        if count == EVENT_COUNT:
+            finished.set()
+
+    def noop(event: Event) -> None:
+        pass
+
+    engine.register(EVENT_TEST, record)
+    for _ in range(HANDLER_COUNT - 1):
+        engine.register(EVENT_TEST, lambda event: noop(event))
+
+    engine.start()
+
+    start: float = perf_counter()
+    for _ in range(EVENT_COUNT):
+        engine.put(Event(EVENT_TEST, perf_counter()))
+    finished.wait()
+    end: float = perf_counter()
+
+    engine.stop()
+
+    throughput: float = EVENT_COUNT / (end - start)
+    p50: float = float(np.percentile(latencies, 50)) * 1_000_000
+    p99: float = float(np.percentile(latencies, 99)) * 1_000_000
+    return throughput, p50, p99
+
+
+def main() -> None:
+    """"""
+    print(f"{'engine':<12}{'events/s':>14}{'p50(us)':>14}{'p99(us)':>14}")
+
+    for name, engine_class in [
+        ("legacy", LegacyEventEngine),
+        ("current", EventEngine),
+    ]:
+        throughput, p50, p99 = run_benchmark(engine_class())
+        print(f"{name:<12}{throughput:>14,.0f}{p50:>14,.1f}{p99:>14,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark of events pushed by BaseGateway.on_tick.
+
+The legacy gateway below always pushes the per-symbol tick event as
+the original implementation did, while the current one only pushes it
+when the vt_symbol is subscribed.
+"""
+
+from datetime import datetime
+from time import perf_counter
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Exchange
+from vnpy.trader.event import EVENT_TICK
+from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.object import CancelRequest, OrderRequest, SubscribeRequest, TickData
+
+
+SYMBOL_COUNT: int = 500
+SUBSCRIBED_COUNT: int = 10
+TICK_COUNT: int = 500_000
+
+
+class CountingEventEngine(EventEngine):
+    """
+    Event engine counting events put, which is not started so that
+    events are only queued.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.count: int = 0
+
+    def put(self, event: Event) -> None:
+        """"""
+        self.count += 1
+        super().put(event)
+
+
+class BenchGateway(BaseGateway):
+    """"""
+
+    default_name: str = "BENCH"
+
+    def connect(self, setting: dict) -> None:
+        """"""
+        pass
+
+    def close(self) -> None:
+        """"""
+        pass
+
+    def subscribe(self, req: SubscribeRequest) -> None:
+        """"""
+        pass
+
+    def send_order(self, req: OrderRequest) -> str:
+        """"""
+        return ""
+
+    def cancel_order(self, req: CancelRequest) -> None:
+        """"""
+        pass
+
+    def query_account(self) -> None:
+        """"""
+        pass
+
+    def query_position(self) -> None:
+        """"""
+        pass
+
+
+class LegacyGateway(BenchGateway):
+    """
+    Gateway pushing per-symbol tick event for every tick.
+    """
+
+    def on_tick(self, tick: TickData) -> None:
+        """"""
+        self.on_event(EVENT_TICK, tick)
+        self.on_event(EVENT_TICK + tick.vt_symbol, tick)
+
+
+def process_event(event: Event) -> None:
+    """"""
+    pass
+
+
+def main() -> None:
+    """"""
+    ticks: list[TickData] = [
+        TickData(
+            symbol=f"s{i}",
+            exchange=Exchange.SSE,
+            datetime=datetime.now(),
+            gateway_name="BENCH"
+        )
+        for i in range(SYMBOL_COUNT)
+    ]
+
+    for gateway_class in [LegacyGateway, BenchGateway]:
+        event_engine: CountingEventEngine = CountingEventEngine()
+        event_engine.register(EVENT_TICK, process_event)
+
+        for tick in ticks[:SUBSCRIBED_COUNT]:
+            event_engine.register(EVENT_TICK + tick.vt_symbol, process_event)
+
+        gateway: BaseGateway = gateway_class(event_engine, "BENCH")
+
+        start: float = perf_counter()
+        for i in range(TICK_COUNT):
+            gateway.on_tick(ticks[i % SYMBOL_COUNT])
+        cost: float = perf_counter() - start
+
+        print(
+            f"{gateway_class.__name__}: {event_engine.count / TICK_COUNT:.3f} events per tick, "
+            f"{cost / TICK_COUNT * 1_000_000:.3f} us per tick"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of construction time and memory cost of data objects.
+
+The legacy classes below format vt_symbol with f-string in every
+construction, as the original data classes did.
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from timeit import timeit
+
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import (
+    TickData,
+    BarData,
+    SlotTickData,
+    SlotBarData
+)
+
+
+OBJECT_COUNT: int = 100_000
+
+
+@dataclass
+class LegacyTickData(TickData):
+    """"""
+
+    def __post_init__(self) -> None:
+        """"""
+        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+
+
+@dataclass
+class LegacyBarData(BarData):
+    """"""
+
+    def __post_init__(self) -> None:
+        """"""
+        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+
+
+def create_objects(data_class: type, count: int) -> list:
+    """"""
+    dt: datetime = datetime.now()
+
+    return [
+        data_class(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=dt,
+            gateway_name="CTP",
+            volume=i,
+            open_interest=i,
+        )
+        for i in range(count)
+    ]
+
+
+def measure_memory(data_class: type) -> float:
+    """
+    Return memory cost per object in bytes.
+    """
+    tracemalloc.start()
+    objects: list = create_objects(data_class, OBJECT_COUNT)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return current / OBJECT_COUNT
+
+
+def measure_time(data_class: type) -> float:
+    """
+    Return construction time per object in nanoseconds.
+    """
+    seconds: float = timeit(lambda: create_objects(data_class, OBJECT_COUNT), number=5)
+    return seconds / OBJECT_COUNT / 5 * 1_000_000_000
+
+
+def main() -> None:
+    """"""
+    print(f"{'class':<16}{'time(ns)':>12}{'memory(B)':>12}")
+
+    for data_class in [
+        LegacyTickData,
+        TickData,
+        SlotTickData,
+        LegacyBarData,
+        BarData,
+        SlotBarData,
+    ]:
+        cost: float = measure_time(data_class)
+        memory: float = measure_memory(data_class)
+        print(f"{data_class.__name__:<16}{cost:>12,.0f}{memory:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
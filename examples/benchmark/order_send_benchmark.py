@@ -0,0 +1,273 @@
+"""
+Benchmark of order sending latency from strategy side to gateway.
+
+Each order goes through the same path as in strategy engines: offset
+conversion by MainEngine.convert_order_request, MainEngine.send_order to
+the gateway and MainEngine.update_order_request. Latency is measured from
+the start of conversion to the gateway receiving the first request.
+
+The legacy converter below recalculates available volumes, checks the
+contract and copies request objects for every order, as the original
+implementation did.
+"""
+
+from copy import copy
+from random import choice, randint, seed
+from time import perf_counter_ns
+
+import numpy as np
+
+from vnpy.event import EventEngine
+from vnpy.trader.constant import Direction, Exchange, Offset, OrderType, Product
+from vnpy.trader.converter import OffsetConverter, PositionHolding
+from vnpy.trader.engine import MainEngine, OmsEngine
+from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.object import (
+    CancelRequest,
+    ContractData,
+    OrderRequest,
+    PositionData,
+    SubscribeRequest
+)
+
+
+ORDER_COUNT: int = 100_000
+
+
+class BenchGateway(BaseGateway):
+    """
+    Gateway recording time when order request received.
+    """
+
+    default_name: str = "BENCH"
+
+    exchanges: list[Exchange] = [Exchange.SHFE, Exchange.DCE]
+
+    def __init__(self, event_engine: EventEngine, gateway_name: str) -> None:
+        """"""
+        super().__init__(event_engine, gateway_name)
+
+        self.count: int = 0
+        self.received: int = 0
+
+    def connect(self, setting: dict) -> None:
+        """"""
+        pass
+
+    def close(self) -> None:
+        """"""
+        pass
+
+    def subscribe(self, req: SubscribeRequest) -> None:
+        """"""
+        pass
+
+    def send_order(self, req: OrderRequest) -> str:
+        """"""
+        if not self.received:
+            self.received = perf_counter_ns()
+
+        self.count += 1
+        return f"{self.gateway_name}.{self.count}"
+
+    def cancel_order(self, req: CancelRequest) -> None:
+        """"""
+        pass
+
+    def query_account(self) -> None:
+        """"""
+        pass
+
+    def query_position(self) -> None:
+        """"""
+        pass
+
+
+class LegacyPositionHolding(PositionHolding):
+    """
+    Position holding with the original request conversion.
+    """
+
+    def convert_order_request_shfe(self, req: OrderRequest) -> list[OrderRequest]:
+        """"""
+        if req.offset == Offset.OPEN:
+            return [req]
+
+        if req.direction == Direction.LONG:
+            pos_available: float = self.short_pos - self.short_pos_frozen
+            td_available: float = self.short_td - self.short_td_frozen
+        else:
+            pos_available = self.long_pos - self.long_pos_frozen
+            td_available = self.long_td - self.long_td_frozen
+
+        if req.volume > pos_available:
+            return []
+        elif req.volume <= td_available:
+            req_td: OrderRequest = copy(req)
+            req_td.offset = Offset.CLOSETODAY
+            return [req_td]
+        else:
+            req_list: list[OrderRequest] = []
+
+            if td_available > 0:
+                req_td = copy(req)
+                req_td.offset = Offset.CLOSETODAY
+                req_td.volume = td_available
+                req_list.append(req_td)
+
+            req_yd: OrderRequest = copy(req)
+            req_yd.offset = Offset.CLOSEYESTERDAY
+            req_yd.volume = req.volume - td_available
+            req_list.append(req_yd)
+
+            return req_list
+
+    def convert_order_request_net(self, req: OrderRequest) -> list[OrderRequest]:
+        """"""
+        if req.direction == Direction.LONG:
+            pos_available: float = self.short_pos - self.short_pos_frozen
+        else:
+            pos_available = self.long_pos - self.long_pos_frozen
+
+        reqs: list[OrderRequest] = []
+        volume_left: float = req.volume
+
+        if pos_available:
+            close_volume: float = min(pos_available, volume_left)
+            volume_left -= pos_available
+
+            close_req: OrderRequest = copy(req)
+            close_req.offset = Offset.CLOSE
+            close_req.volume = close_volume
+            reqs.append(close_req)
+
+        if volume_left > 0:
+            open_req: OrderRequest = copy(req)
+            open_req.offset = Offset.OPEN
+            open_req.volume = volume_left
+            reqs.append(open_req)
+
+        return reqs
+
+
+class LegacyOffsetConverter(OffsetConverter):
+    """
+    Offset converter checking contract for every request.
+    """
+
+    def get_convert_holding(self, vt_symbol: str) -> PositionHolding | None:
+        """"""
+        if not self.is_convert_required(vt_symbol):
+            return None
+
+        holding: PositionHolding | None = self.holdings.get(vt_symbol, None)
+
+        if not holding:
+            contract: ContractData | None = self.get_contract(vt_symbol)
+            if contract:
+                holding = LegacyPositionHolding(contract)
+                self.holdings[vt_symbol] = holding
+
+        return holding
+
+
+def prepare_engine(main_engine: MainEngine, converter_class: type[OffsetConverter]) -> BenchGateway:
+    """
+    Add gateway, contracts and positions of both exchanges.
+    """
+    gateway: BenchGateway = main_engine.add_gateway(BenchGateway)       # type: ignore
+
+    oms_engine: OmsEngine = main_engine.get_engine("oms")               # type: ignore
+    converter: OffsetConverter = converter_class(oms_engine)
+    oms_engine.offset_converters[gateway.gateway_name] = converter
+
+    for symbol, exchange in [("rb2501", Exchange.SHFE), ("m2501", Exchange.DCE)]:
+        contract: ContractData = ContractData(
+            symbol=symbol,
+            exchange=exchange,
+            name=symbol,
+            product=Product.FUTURES,
+            size=10,
+            pricetick=1,
+            gateway_name=gateway.gateway_name
+        )
+        oms_engine.contract_registry.add(contract)
+
+        for direction in [Direction.LONG, Direction.SHORT]:
+            converter.update_position(PositionData(
+                symbol=symbol,
+                exchange=exchange,
+                direction=direction,
+                volume=10_000_000,
+                yd_volume=5_000_000,
+                gateway_name=gateway.gateway_name
+            ))
+
+    return gateway
+
+
+def create_requests() -> list[tuple[OrderRequest, bool]]:
+    """
+    Create random requests and whether to use net mode for each.
+    """
+    seed(0)
+
+    requests: list[tuple[OrderRequest, bool]] = []
+    for _ in range(ORDER_COUNT):
+        symbol, exchange = choice([("rb2501", Exchange.SHFE), ("m2501", Exchange.DCE)])
+
+        req: OrderRequest = OrderRequest(
+            symbol=symbol,
+            exchange=exchange,
+            direction=choice([Direction.LONG, Direction.SHORT]),
+            type=OrderType.LIMIT,
+            volume=randint(1, 5),
+            price=3000,
+            offset=choice([Offset.OPEN, Offset.CLOSE])
+        )
+        requests.append((req, choice([False, True])))
+
+    return requests
+
+
+def run_benchmark(converter_class: type[OffsetConverter], requests: list[tuple[OrderRequest, bool]]) -> np.ndarray:
+    """
+    Return latency of each order in microseconds.
+    """
+    event_engine: EventEngine = EventEngine()
+    main_engine: MainEngine = MainEngine(event_engine)
+    gateway: BenchGateway = prepare_engine(main_engine, converter_class)
+    gateway_name: str = gateway.gateway_name
+
+    latencies: np.ndarray = np.zeros(len(requests))
+
+    for i, (req, net) in enumerate(requests):
+        gateway.received = 0
+        start: int = perf_counter_ns()
+
+        for converted_req in main_engine.convert_order_request(req, gateway_name, False, net):
+            vt_orderid: str = main_engine.send_order(converted_req, gateway_name)
+            main_engine.update_order_request(converted_req, vt_orderid, gateway_name)
+
+        latencies[i] = (gateway.received - start) / 1000
+
+    main_engine.close()
+    return latencies
+
+
+def main() -> None:
+    """"""
+    requests: list[tuple[OrderRequest, bool]] = create_requests()
+
+    for converter_class in [LegacyOffsetConverter, OffsetConverter]:
+        latencies: np.ndarray = run_benchmark(converter_class, requests)
+        p50, p90, p99, p999 = np.percentile(latencies, [50, 90, 99, 99.9])
+
+        print(
+            f"{converter_class.__name__}: p50 {p50:.2f} us, p90 {p90:.2f} us, "
+            f"p99 {p99:.2f} us, p99.9 {p999:.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
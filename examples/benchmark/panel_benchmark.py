@@ -0,0 +1,100 @@
+"""
+Benchmark of PanelArrayManager against one ArrayManager per symbol.
+"""
+
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData
+from vnpy.trader.utility import ArrayManager, PanelArrayManager
+
+
+SYMBOL_COUNT: int = 500
+BAR_COUNT: int = 300
+
+
+def create_bars(vt_symbols: list[str]) -> list[dict[str, BarData]]:
+    """"""
+    prices: np.ndarray = 100 + np.random.randn(BAR_COUNT, len(vt_symbols)).cumsum(axis=0)
+
+    data: list[dict[str, BarData]] = []
+    for row in prices:
+        bars: dict[str, BarData] = {}
+
+        for vt_symbol, price in zip(vt_symbols, row, strict=True):
+            symbol, exchange_str = vt_symbol.split(".")
+
+            bars[vt_symbol] = BarData(
+                symbol=symbol,
+                exchange=Exchange(exchange_str),
+                datetime=datetime.now(),
+                interval=Interval.MINUTE,
+                gateway_name="DB",
+                open_price=price,
+                high_price=price + 1,
+                low_price=price - 1,
+                close_price=price,
+                volume=100
+            )
+
+        data.append(bars)
+
+    return data
+
+
+def run_array(vt_symbols: list[str], data: list[dict[str, BarData]]) -> float:
+    """"""
+    managers: dict[str, ArrayManager] = {
+        vt_symbol: ArrayManager() for vt_symbol in vt_symbols
+    }
+
+    start: float = perf_counter()
+
+    for bars in data:
+        for vt_symbol, bar in bars.items():
+            am: ArrayManager = managers[vt_symbol]
+            am.update_bar(bar)
+
+            am.sma(20)
+            am.boll(20, 2)
+            am.atr(14)
+            am.rsi(14)
+
+    return perf_counter() - start
+
+
+def run_panel(vt_symbols: list[str], data: list[dict[str, BarData]]) -> float:
+    """"""
+    panel: PanelArrayManager = PanelArrayManager(vt_symbols)
+
+    start: float = perf_counter()
+
+    for bars in data:
+        panel.update_bars(bars)
+
+        panel.sma(20)
+        panel.boll(20, 2)
+        panel.atr(14)
+        panel.rsi(14)
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    """"""
+    vt_symbols: list[str] = [f"{600000 + i}.SSE" for i in range(SYMBOL_COUNT)]
+    data: list[dict[str, BarData]] = create_bars(vt_symbols)
+
+    array_time: float = run_array(vt_symbols, data)
+    panel_time: float = run_panel(vt_symbols, data)
+
+    print(f"Symbols: {SYMBOL_COUNT}, bars: {BAR_COUNT}")
+    print(f"ArrayManager per symbol: {array_time / BAR_COUNT * 1000:.2f} ms per bar")
+    print(f"PanelArrayManager: {panel_time / BAR_COUNT * 1000:.2f} ms per bar")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark of RiskEngine.check_order with many active orders.
+
+The legacy check below scans all active orders of the contract for
+every new order, as risk handlers built on get_all_active_orders do.
+"""
+
+from random import choice, randint, seed
+from time import perf_counter_ns
+
+import numpy as np
+
+from vnpy.event import EventEngine
+from vnpy.trader.constant import Direction, Exchange, Offset, OrderType, Product, Status
+from vnpy.trader.engine import MainEngine, OmsEngine, RiskEngine
+from vnpy.trader.object import ContractData, OrderData, OrderRequest
+from vnpy.trader.setting import SETTINGS
+
+
+ACTIVE_COUNT: int = 10_000
+CHECK_COUNT: int = 10_000
+
+
+def legacy_check(main_engine: MainEngine, req: OrderRequest) -> bool:
+    """
+    Check position and self trade by scanning active orders.
+    """
+    pending: float = 0
+    for order in main_engine.get_all_active_orders(req.vt_symbol):
+        remaining: float = order.volume - order.traded
+
+        if order.direction == req.direction:
+            pending += remaining
+        elif req.direction == Direction.LONG and req.price >= order.price:
+            return False
+        elif req.direction == Direction.SHORT and req.price <= order.price:
+            return False
+
+    return pending + req.volume <= 1_000_000
+
+
+def main() -> None:
+    """"""
+    SETTINGS["risk.position_limit"] = 1_000_000
+    SETTINGS["risk.order_flow_limit"] = 0
+
+    event_engine: EventEngine = EventEngine()
+    main_engine: MainEngine = MainEngine(event_engine)
+
+    oms_engine: OmsEngine = main_engine.get_engine("oms")               # type: ignore
+    risk_engine: RiskEngine = main_engine.risk_engine
+
+    oms_engine.contract_registry.add(ContractData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        name="rb2501",
+        product=Product.FUTURES,
+        size=10,
+        pricetick=1,
+        gateway_name="BENCH"
+    ))
+
+    # Resting orders with bid below 3000 and ask above 3100
+    seed(0)
+    for i in range(ACTIVE_COUNT):
+        direction: Direction = choice([Direction.LONG, Direction.SHORT])
+        if direction == Direction.LONG:
+            price: int = randint(2000, 3000)
+        else:
+            price = randint(3100, 4000)
+
+        order: OrderData = OrderData(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=direction,
+            offset=Offset.OPEN,
+            price=price,
+            volume=randint(1, 10),
+            status=Status.NOTTRADED,
+            gateway_name="BENCH"
+        )
+        oms_engine.orders[order.vt_orderid] = order
+        oms_engine.active_orders[order.vt_orderid] = order
+        oms_engine.symbol_active_orders.setdefault(order.vt_symbol, {})[order.vt_orderid] = order
+        risk_engine.update_order(order)
+
+    requests: list[OrderRequest] = [
+        OrderRequest(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            direction=choice([Direction.LONG, Direction.SHORT]),
+            type=OrderType.LIMIT,
+            volume=1,
+            price=randint(3001, 3099),
+            offset=Offset.OPEN
+        )
+        for _ in range(CHECK_COUNT)
+    ]
+
+    for name, func in [
+        ("legacy scan", lambda req: legacy_check(main_engine, req)),
+        ("RiskEngine", lambda req: risk_engine.check_order(req, "BENCH")),
+    ]:
+        latencies: np.ndarray = np.zeros(len(requests))
+
+        for i, req in enumerate(requests):
+            start: int = perf_counter_ns()
+            func(req)
+            latencies[i] = (perf_counter_ns() - start) / 1000
+
+        p50, p99 = np.percentile(latencies, [50, 99])
+        print(f"{name}: p50 {p50:.2f} us, p99 {p99:.2f} us")
+
+    main_engine.close()
+
+
+if __name__ == "__main__":
+    main()
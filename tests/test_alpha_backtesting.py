@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+
+from vnpy.alpha import AlphaLab, AlphaStrategy, BacktestingEngine
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData, TradeData
+
+
+class RecordStrategy(AlphaStrategy):
+    """
+    Strategy recording bars received.
+    """
+
+    def on_init(self) -> None:
+        """"""
+        self.history: list[dict[str, BarData]] = []
+
+    def on_bars(self, bars: dict[str, BarData]) -> None:
+        """"""
+        self.history.append(bars)
+
+    def on_trade(self, trade: TradeData) -> None:
+        """"""
+        pass
+
+
+def create_bars(symbol: str, days: list[int]) -> list[BarData]:
+    """"""
+    return [
+        BarData(
+            symbol=symbol,
+            exchange=Exchange.SSE,
+            datetime=datetime(2025, 1, 1) + timedelta(days=day),
+            interval=Interval.DAILY,
+            gateway_name="DB",
+            open_price=10 + day,
+            high_price=11 + day,
+            low_price=9 + day,
+            close_price=10.5 + day,
+            volume=100 * day,
+        )
+        for day in days
+    ]
+
+
+def test_load_data_from_batch(tmp_path: Path) -> None:
+    """"""
+    lab: AlphaLab = AlphaLab(str(tmp_path))
+
+    history: dict[str, list[BarData]] = {
+        "600000.SSE": create_bars("600000", [0, 1, 2, 3]),
+        "600036.SSE": create_bars("600036", [1, 3]),
+    }
+    for vt_symbol, bars in history.items():
+        lab.save_bar_data(bars)
+        lab.add_contract_setting(vt_symbol, 0, 0, 1, 0.01)
+
+    engine: BacktestingEngine = BacktestingEngine(lab)
+    engine.set_parameters(
+        vt_symbols=list(history),
+        interval=Interval.DAILY,
+        start=datetime(2025, 1, 1),
+        end=datetime(2025, 1, 10)
+    )
+    engine.add_strategy(RecordStrategy, {}, pl.DataFrame())
+    engine.load_data()
+    engine.run_backtesting()
+
+    received: list[dict[str, BarData]] = engine.strategy.history      # type: ignore
+    assert [sorted(bars) for bars in received] == [
+        ["600000.SSE"],
+        ["600000.SSE", "600036.SSE"],
+        ["600000.SSE"],
+        ["600000.SSE", "600036.SSE"],
+    ]
+
+    for vt_symbol, bars in history.items():
+        assert [b[vt_symbol] for b in received if vt_symbol in b] == bars
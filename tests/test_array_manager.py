@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData
+from vnpy.trader.utility import ArrayManager
+
+
+def create_bar(price: float) -> BarData:
+    """"""
+    return BarData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        datetime=datetime.now(),
+        interval=Interval.MINUTE,
+        gateway_name="TEST",
+        open_price=price,
+        high_price=price + 1,
+        low_price=price - 1,
+        close_price=price,
+        volume=100,
+    )
+
+
+def test_time_series_order() -> None:
+    """"""
+    am: ArrayManager = ArrayManager(size=5)
+    for price in range(1, 13):
+        am.update_bar(create_bar(price))
+
+    assert am.close.tolist() == [8, 9, 10, 11, 12]
+    assert am.close_array.tolist() == [8, 9, 10, 11, 12]
+    assert am.high_array.tolist() == [9, 10, 11, 12, 13]
+
+
+def test_array_is_writable_copy() -> None:
+    """"""
+    am: ArrayManager = ArrayManager(size=5)
+    for price in range(1, 6):
+        am.update_bar(create_bar(price))
+
+    close_array: np.ndarray = am.close_array
+    close_array[-1] = 100
+    assert am.close[-1] == 5
+
+    am.update_bar(create_bar(6))
+    assert close_array.tolist() == [1, 2, 3, 4, 100]
+    assert am.close_array.tolist() == [2, 3, 4, 5, 6]
+
+
+def test_view_is_read_only() -> None:
+    """"""
+    am: ArrayManager = ArrayManager(size=5)
+    am.update_bar(create_bar(1))
+
+    with pytest.raises(ValueError):
+        am.close[-1] = 100
+
+
+def test_cache() -> None:
+    """"""
+    am: ArrayManager = ArrayManager(size=30, cache=True)
+    plain: ArrayManager = ArrayManager(size=30)
+
+    prices: np.ndarray = 100 + np.random.default_rng(0).standard_normal(40).cumsum()
+    for price in prices[:35]:
+        am.update_bar(create_bar(price))
+        plain.update_bar(create_bar(price))
+
+    assert am.sma(5) == plain.sma(5)
+    assert am.sma(n=5) == am.sma(5, False) == am.sma(5)
+    assert am.cache_miss == 1
+    assert am.cache_hit == 3
+
+    # Cached array is shared so it is read-only
+    result: np.ndarray = am.sma(5, array=True)
+    assert np.allclose(result, plain.sma(5, array=True), equal_nan=True)
+    with pytest.raises(ValueError):
+        result[-1] = 0
+
+    macd, signal, hist = am.macd(12, 26, 9, array=True)
+    assert not hist.flags.writeable
+
+    # Cache cleared after new bar updated
+    am.update_bar(create_bar(prices[35]))
+    plain.update_bar(create_bar(prices[35]))
+    assert am.sma(5) == plain.sma(5)
+    assert am.cache_miss == 4
+
+    with pytest.raises(TypeError):
+        am.sma(5, window=3)
+
+    # Functions are not wrapped if cache is not enabled
+    assert "sma" not in vars(plain)
@@ -0,0 +1,57 @@
+from threading import get_ident
+from time import sleep
+
+from vnpy.event import Event
+from vnpy.event.async_engine import AsyncEventEngine
+
+
+def wait_until(condition, timeout: float = 3) -> bool:
+    """"""
+    for _ in range(int(timeout * 100)):
+        if condition():
+            return True
+        sleep(0.01)
+    return False
+
+
+def test_timer_in_loop_thread() -> None:
+    """"""
+    engine: AsyncEventEngine = AsyncEventEngine(interval=0.05)
+    threads: list[int] = []
+
+    def on_timer(event: Event) -> None:
+        threads.append(get_ident())
+
+    engine.register("eTimer", on_timer)
+    engine.start()
+    loop_thread: int | None = engine._loop_thread
+
+    calls: list[int] = []
+    engine.call_later(0.05, lambda event: calls.append(get_ident()))
+
+    assert wait_until(lambda: len(threads) >= 3 and calls)
+    engine.stop()
+
+    assert set(threads) == {loop_thread}
+    assert calls == [loop_thread]
+
+
+def test_put_after_stop() -> None:
+    """"""
+    engine: AsyncEventEngine = AsyncEventEngine()
+    received: list[Event] = []
+    engine.register("eTest", received.append)
+
+    engine.start()
+    engine.put(Event("eTest", 1))
+    assert wait_until(lambda: len(received) == 1)
+    engine.stop()
+
+    # Put from gateway thread after stop should not raise
+    engine.put(Event("eTest", 2))
+
+    engine.start()
+    assert wait_until(lambda: len(received) == 2)
+    engine.stop()
+
+    assert [event.data for event in received] == [1, 2]
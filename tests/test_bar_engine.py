@@ -0,0 +1,54 @@
+"""
+Tests of BarEngine subscription.
+"""
+
+from datetime import datetime, time
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.engine import BarEngine, MainEngine
+from vnpy.trader.event import EVENT_TICK
+from vnpy.trader.object import TickData
+
+
+def create_tick(minute: int) -> TickData:
+    """"""
+    return TickData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        datetime=datetime(2025, 1, 6, 9, minute),
+        last_price=3000 + minute,
+        volume=minute,
+        gateway_name="TEST"
+    )
+
+
+def test_subscribe_and_unsubscribe() -> None:
+    """"""
+    main_engine: MainEngine = MainEngine(EventEngine())
+    bar_engine: BarEngine = main_engine.get_engine("bar")      # type: ignore
+
+    day_type: str = main_engine.subscribe_bar("rb2501.SHFE", 1, Interval.DAILY, time(15))
+    night_type: str = main_engine.subscribe_bar("rb2501.SHFE", 1, Interval.DAILY, time(23))
+    main_engine.subscribe_bar("rb2501.SHFE")
+    main_engine.subscribe_bar("rb2501.SHFE")
+
+    assert day_type != night_type
+    assert len(bar_engine.window_generators["rb2501.SHFE"]) == 2
+
+    for minute in range(3):
+        bar_engine.process_tick_event(Event(EVENT_TICK, create_tick(minute)))
+
+    main_engine.unsubscribe_bar("rb2501.SHFE", 1, Interval.DAILY, time(15))
+    main_engine.unsubscribe_bar("rb2501.SHFE", 1, Interval.DAILY, time(23))
+    main_engine.unsubscribe_bar("rb2501.SHFE")
+    assert "rb2501.SHFE" in bar_engine.generators
+
+    main_engine.unsubscribe_bar("rb2501.SHFE")
+    assert not bar_engine.generators
+    assert not bar_engine.window_generators
+
+    # Tick already queued when unsubscribed is ignored
+    bar_engine.process_tick_event(Event(EVENT_TICK, create_tick(3)))
+
+    main_engine.close()
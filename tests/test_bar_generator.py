@@ -0,0 +1,71 @@
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pytest
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData, BarBatch
+from vnpy.trader.utility import BarGenerator
+
+
+def create_bars(count: int) -> list[BarData]:
+    """
+    Create minute bars with random missing minutes and hours.
+    """
+    rng: np.random.Generator = np.random.default_rng(1)
+
+    minutes: np.ndarray = np.arange(count)
+    keep: np.ndarray = rng.random(count) > 0.2
+    keep &= rng.random(count // 60 + 1)[minutes // 60] > 0.1
+    minutes = minutes[keep]
+
+    prices: np.ndarray = 100 + rng.standard_normal(len(minutes)).cumsum()
+
+    bars: list[BarData] = []
+    for minute, price in zip(minutes, prices, strict=True):
+        volume: float = float(rng.integers(0, 100))
+
+        bars.append(BarData(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=datetime(2025, 1, 1) + timedelta(minutes=int(minute)),
+            interval=Interval.MINUTE,
+            gateway_name="TEST",
+            open_price=price + rng.random() - 0.5,
+            high_price=price + 1 + rng.random(),
+            low_price=price - 1 - rng.random(),
+            close_price=price,
+            volume=volume,
+            turnover=volume * price,
+            open_interest=float(rng.integers(1000, 2000)),
+        ))
+
+    return bars
+
+
+@pytest.mark.parametrize("window, interval", [
+    (5, Interval.MINUTE),
+    (15, Interval.MINUTE),
+    (1, Interval.HOUR),
+    (2, Interval.HOUR),
+    (1, Interval.DAILY),
+])
+def test_window_bars_match_streaming(window: int, interval: Interval) -> None:
+    """"""
+    bars: list[BarData] = create_bars(20_000)
+
+    window_bars: list[BarData] = []
+    generator: BarGenerator = BarGenerator(
+        lambda bar: None, window, window_bars.append, interval, time(14, 59)
+    )
+    for bar in bars:
+        generator.update_bar(bar)
+
+    result: BarBatch = generator.generate_window_bars(BarBatch.from_bars(bars))
+
+    assert len(result) == len(window_bars)
+    assert result.datetime.tolist() == [bar.datetime for bar in window_bars]
+
+    for name in BarBatch.array_fields:
+        expected: list[float] = [getattr(bar, name) for bar in window_bars]
+        assert np.allclose(getattr(result, name), expected, rtol=1e-12, atol=0), name
@@ -0,0 +1,293 @@
+"""
+Tests of offset conversion against the original full recalculation.
+"""
+
+from random import Random
+
+import pytest
+
+from vnpy.trader.constant import Direction, Exchange, Offset, OrderType, Product, Status
+from vnpy.trader.converter import PositionHolding
+from vnpy.trader.object import ContractData, OrderData, OrderRequest, PositionData, TradeData
+
+
+CLOSE_YD_EXCHANGES: set[Exchange] = {Exchange.SHFE, Exchange.INE}
+
+
+class ReferenceHolding:
+    """
+    Position state with frozen volume recalculated from all active orders
+    after every update, and requests converted in the same way as before
+    available volume was cached.
+    """
+
+    def __init__(self, exchange: Exchange) -> None:
+        """"""
+        self.exchange: Exchange = exchange
+        self.active_orders: dict[str, OrderData] = {}
+
+        # Today/yesterday volume and frozen of each direction
+        self.td: dict[Direction, float] = {Direction.LONG: 0, Direction.SHORT: 0}
+        self.yd: dict[Direction, float] = {Direction.LONG: 0, Direction.SHORT: 0}
+        self.td_frozen: dict[Direction, float] = {Direction.LONG: 0, Direction.SHORT: 0}
+        self.yd_frozen: dict[Direction, float] = {Direction.LONG: 0, Direction.SHORT: 0}
+
+    def update_position(self, position: PositionData) -> None:
+        """"""
+        self.yd[position.direction] = position.yd_volume
+        self.td[position.direction] = position.volume - position.yd_volume
+        self.calculate_frozen()
+
+    def update_order(self, order: OrderData) -> None:
+        """"""
+        if order.is_active():
+            self.active_orders[order.vt_orderid] = order
+        else:
+            self.active_orders.pop(order.vt_orderid, None)
+
+        self.calculate_frozen()
+
+    def update_trade(self, trade: TradeData) -> None:
+        """"""
+        opposite: Direction = get_opposite(trade.direction)
+
+        if trade.offset == Offset.OPEN:
+            self.td[get_opposite(opposite)] += trade.volume
+        elif trade.offset == Offset.CLOSETODAY:
+            self.td[opposite] -= trade.volume
+        elif trade.offset == Offset.CLOSEYESTERDAY:
+            self.yd[opposite] -= trade.volume
+        elif trade.exchange in CLOSE_YD_EXCHANGES:
+            self.yd[opposite] -= trade.volume
+        else:
+            self.td[opposite] -= trade.volume
+            if self.td[opposite] < 0:
+                self.yd[opposite] += self.td[opposite]
+                self.td[opposite] = 0
+
+        self.calculate_frozen()
+
+    def calculate_frozen(self) -> None:
+        """
+        Loop all active orders. Close orders freeze today position left
+        after close today orders, and their excess freezes yesterday position.
+        """
+        for direction in Direction.LONG, Direction.SHORT:
+            td_frozen: float = 0
+            yd_frozen: float = 0
+            close_frozen: float = 0
+
+            for order in self.active_orders.values():
+                if order.direction == direction:
+                    continue
+
+                frozen: float = order.volume - order.traded
+
+                if order.offset == Offset.CLOSETODAY:
+                    td_frozen += frozen
+                elif order.offset == Offset.CLOSEYESTERDAY:
+                    yd_frozen += frozen
+                elif order.offset == Offset.CLOSE:
+                    close_frozen += frozen
+
+            td_left: float = max(self.td[direction] - td_frozen, 0)
+            td_close: float = min(close_frozen, td_left)
+
+            self.td_frozen[direction] = min(td_frozen + td_close, self.td[direction])
+            self.yd_frozen[direction] = min(yd_frozen + close_frozen - td_close, self.yd[direction])
+
+    def convert(self, req: OrderRequest, mode: str) -> list[tuple[Offset, float]]:
+        """
+        Convert request with mode of shfe, lock or net.
+        """
+        position: Direction = get_opposite(req.direction)
+        td: float = self.td[position]
+        td_available: float = td - self.td_frozen[position]
+        yd_available: float = self.yd[position] - self.yd_frozen[position]
+        pos_available: float = td_available + yd_available
+        close_yd: bool = self.exchange in CLOSE_YD_EXCHANGES
+
+        results: list[tuple[Offset, float]] = []
+
+        if mode == "shfe":
+            if req.offset == Offset.OPEN:
+                return [(req.offset, req.volume)]
+            if req.volume > pos_available:
+                return []
+            if req.volume <= td_available:
+                return [(Offset.CLOSETODAY, req.volume)]
+            if td_available > 0:
+                results.append((Offset.CLOSETODAY, td_available))
+            results.append((Offset.CLOSEYESTERDAY, req.volume - td_available))
+
+        elif mode == "lock":
+            if td and not close_yd:
+                return [(Offset.OPEN, req.volume)]
+            if yd_available:
+                offset: Offset = Offset.CLOSEYESTERDAY if close_yd else Offset.CLOSE
+                results.append((offset, min(req.volume, yd_available)))
+            if req.volume > yd_available:
+                results.append((Offset.OPEN, req.volume - yd_available))
+
+        else:
+            left: float = req.volume
+            if close_yd:
+                for offset, available in [(Offset.CLOSETODAY, td_available), (Offset.CLOSEYESTERDAY, yd_available)]:
+                    if left and available:
+                        volume: float = min(available, left)
+                        left -= volume
+                        results.append((offset, volume))
+            elif pos_available:
+                results.append((Offset.CLOSE, min(pos_available, left)))
+                left -= pos_available
+            if left > 0:
+                results.append((Offset.OPEN, left))
+
+        return results
+
+
+def get_opposite(direction: Direction | None) -> Direction:
+    """"""
+    if direction == Direction.LONG:
+        return Direction.SHORT
+    return Direction.LONG
+
+
+def convert(holding: PositionHolding, req: OrderRequest, mode: str) -> list[tuple[Offset, float]]:
+    """"""
+    if mode == "shfe":
+        reqs: list[OrderRequest] = holding.convert_order_request_shfe(req)
+    elif mode == "lock":
+        reqs = holding.convert_order_request_lock(req)
+    else:
+        reqs = holding.convert_order_request_net(req)
+
+    return [(r.offset, r.volume) for r in reqs]
+
+
+@pytest.mark.parametrize("exchange", [Exchange.SHFE, Exchange.DCE])
+def test_convert_matches_reference(exchange: Exchange) -> None:
+    """
+    Apply random positions, orders and trades, and compare converted
+    requests after every update.
+    """
+    rng: Random = Random(exchange.value)
+
+    contract: ContractData = ContractData(
+        symbol="test",
+        exchange=exchange,
+        name="test",
+        product=Product.FUTURES,
+        size=10,
+        pricetick=1,
+        gateway_name="TEST"
+    )
+    holding: PositionHolding = PositionHolding(contract)
+    reference: ReferenceHolding = ReferenceHolding(exchange)
+
+    directions: list[Direction] = [Direction.LONG, Direction.SHORT]
+    offsets: list[Offset] = [Offset.OPEN, Offset.CLOSE, Offset.CLOSETODAY, Offset.CLOSEYESTERDAY]
+    orders: dict[str, OrderData] = {}
+
+    def create_order(order: OrderData) -> OrderData:
+        return OrderData(
+            symbol=order.symbol,
+            exchange=order.exchange,
+            orderid=order.orderid,
+            direction=order.direction,
+            offset=order.offset,
+            volume=order.volume,
+            traded=order.traded,
+            status=order.status,
+            gateway_name=order.gateway_name
+        )
+
+    for i in range(3000):
+        action: float = rng.random()
+
+        if action < 0.05:
+            volume: int = rng.randint(0, 20)
+            position: PositionData = PositionData(
+                symbol="test",
+                exchange=exchange,
+                direction=rng.choice(directions),
+                volume=volume,
+                yd_volume=rng.randint(0, volume),
+                gateway_name="TEST"
+            )
+            holding.update_position(position)
+            reference.update_position(position)
+
+        elif action < 0.5 or not orders:
+            order: OrderData = OrderData(
+                symbol="test",
+                exchange=exchange,
+                orderid=str(i),
+                direction=rng.choice(directions),
+                offset=rng.choice(offsets),
+                volume=rng.randint(1, 10),
+                status=Status.NOTTRADED,
+                gateway_name="TEST"
+            )
+            orders[order.vt_orderid] = order
+
+            holding.update_order(create_order(order))
+            reference.update_order(create_order(order))
+
+        else:
+            order = orders[rng.choice(list(orders))]
+
+            # Position closed cannot exceed position held
+            tradable: float = order.volume - order.traded
+            if order.offset != Offset.OPEN:
+                position_direction: Direction = get_opposite(order.direction)
+                td: float = reference.td[position_direction]
+                yd: float = reference.yd[position_direction]
+
+                if order.offset == Offset.CLOSETODAY:
+                    tradable = min(tradable, td)
+                elif order.offset == Offset.CLOSEYESTERDAY or exchange in CLOSE_YD_EXCHANGES:
+                    tradable = min(tradable, yd)
+                else:
+                    tradable = min(tradable, td + yd)
+
+            if rng.random() < 0.3 or tradable <= 0:
+                order.status = Status.CANCELLED
+            else:
+                volume = rng.randint(1, int(tradable))
+                order.traded += volume
+                order.status = Status.ALLTRADED if order.traded == order.volume else Status.PARTTRADED
+
+                trade: TradeData = TradeData(
+                    symbol="test",
+                    exchange=exchange,
+                    orderid=order.orderid,
+                    tradeid=str(i),
+                    direction=order.direction,
+                    offset=order.offset,
+                    volume=volume,
+                    gateway_name="TEST"
+                )
+                holding.update_trade(trade)
+                reference.update_trade(trade)
+
+            holding.update_order(create_order(order))
+            reference.update_order(create_order(order))
+
+            if not order.is_active():
+                orders.pop(order.vt_orderid)
+
+        for direction in directions:
+            for offset in [Offset.OPEN, Offset.CLOSE]:
+                req: OrderRequest = OrderRequest(
+                    symbol="test",
+                    exchange=exchange,
+                    direction=direction,
+                    type=OrderType.LIMIT,
+                    volume=rng.randint(1, 30),
+                    price=100,
+                    offset=offset
+                )
+
+                for mode in ["shfe", "lock", "net"]:
+                    assert convert(holding, req, mode) == reference.convert(req, mode), (i, mode, req)
@@ -0,0 +1,72 @@
+from threading import Thread
+from time import sleep
+
+from vnpy.event import Event, EventEngine
+from vnpy.event.engine import EventQueue
+
+
+def test_event_queue() -> None:
+    """"""
+    queue: EventQueue = EventQueue()
+    assert not queue.get_all(0.01)
+
+    def put() -> None:
+        for i in range(1000):
+            queue.put(i)
+
+    threads: list[Thread] = [Thread(target=put) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(queue) == 4000
+    assert sorted(queue.get_all(1)) == sorted(list(range(1000)) * 4)
+    assert not queue
+
+
+def test_event_order() -> None:
+    """"""
+    engine: EventEngine = EventEngine()
+    received: list[int] = []
+    engine.register("eTest", lambda event: received.append(event.data))
+
+    engine.start()
+    for i in range(10000):
+        engine.put(Event("eTest", i))
+
+    for _ in range(300):
+        if len(received) == 10000:
+            break
+        sleep(0.01)
+    engine.stop()
+
+    assert received == list(range(10000))
+
+
+def test_is_subscribed() -> None:
+    """"""
+    engine: EventEngine = EventEngine()
+
+    def handler(event: Event) -> None:
+        pass
+
+    assert not engine.is_subscribed("eTick.", "rb2501.SHFE")
+
+    # Registry created when first queried is updated with handlers
+    engine.register("eTick.rb2501.SHFE", handler)
+    assert engine.is_subscribed("eTick.", "rb2501.SHFE")
+    assert not engine.is_subscribed("eTick.", "hc2501.SHFE")
+
+    engine.register("eTick.hc2501.SHFE", handler)
+    assert engine.is_subscribed("eTick.", "hc2501.SHFE")
+
+    engine.unregister("eTick.rb2501.SHFE", handler)
+    assert not engine.is_subscribed("eTick.", "rb2501.SHFE")
+
+    # Event of any type is processed by general handler
+    engine.register_general(handler)
+    assert engine.is_subscribed("eTick.", "rb2501.SHFE")
+
+    engine.unregister_general(handler)
+    assert not engine.is_subscribed("eTick.", "rb2501.SHFE")
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Exchange
+from vnpy.trader.event import EVENT_TICK
+from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.object import (
+    CancelRequest,
+    OrderRequest,
+    SubscribeRequest,
+    TickData
+)
+
+
+class FakeGateway(BaseGateway):
+    """"""
+
+    default_name: str = "TEST"
+    exchanges: list[Exchange] = [Exchange.SHFE]
+
+    def connect(self, setting: dict) -> None:
+        """"""
+        pass
+
+    def close(self) -> None:
+        """"""
+        pass
+
+    def subscribe(self, req: SubscribeRequest) -> None:
+        """"""
+        pass
+
+    def send_order(self, req: OrderRequest) -> str:
+        """"""
+        return ""
+
+    def cancel_order(self, req: CancelRequest) -> None:
+        """"""
+        pass
+
+    def query_account(self) -> None:
+        """"""
+        pass
+
+    def query_position(self) -> None:
+        """"""
+        pass
+
+
+class RecordEngine(EventEngine):
+    """
+    Event engine recording types of events put.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.types: list[str] = []
+
+    def put(self, event: Event) -> None:
+        """"""
+        self.types.append(event.type)
+
+
+def create_tick(symbol: str) -> TickData:
+    """"""
+    return TickData(
+        symbol=symbol,
+        exchange=Exchange.SHFE,
+        datetime=datetime.now(),
+        gateway_name="TEST"
+    )
+
+
+def test_tick_event_gated_by_subscription() -> None:
+    """"""
+    engine: RecordEngine = RecordEngine()
+    gateway: FakeGateway = FakeGateway(engine, "TEST")
+
+    engine.register(EVENT_TICK + "rb2501.SHFE", lambda event: None)
+
+    gateway.on_tick(create_tick("rb2501"))
+    gateway.on_tick(create_tick("hc2501"))
+
+    assert engine.types == [EVENT_TICK, EVENT_TICK + "rb2501.SHFE", EVENT_TICK]
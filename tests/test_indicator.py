@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import numpy as np
+import talib
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.indicator import EmaIndicator
+from vnpy.trader.object import BarData
+from vnpy.trader.utility import ArrayManager
+
+
+def create_bars(count: int) -> list[BarData]:
+    """"""
+    rng: np.random.Generator = np.random.default_rng(2)
+    prices: np.ndarray = 100 + rng.standard_normal(count).cumsum()
+
+    return [
+        BarData(
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(),
+            interval=Interval.MINUTE,
+            gateway_name="TEST",
+            open_price=price,
+            high_price=price + rng.random() * 2,
+            low_price=price - rng.random() * 2,
+            close_price=price,
+            volume=100,
+        )
+        for price in prices
+    ]
+
+
+def test_incremental_matches_talib() -> None:
+    """
+    Recursive indicators seeded from the first full window are equal to
+    TA-Lib outputs over the whole history, and window indicators are
+    equal to TA-Lib outputs over the array manager window.
+    """
+    bars: list[BarData] = create_bars(500)
+    incremental: ArrayManager = ArrayManager(100, incremental=True)
+    plain: ArrayManager = ArrayManager(100)
+
+    for i, bar in enumerate(bars):
+        incremental.update_bar(bar)
+        plain.update_bar(bar)
+
+        if not incremental.inited:
+            assert incremental.get_indicator(EmaIndicator, 20) is None
+            continue
+
+        close: np.ndarray = np.array([b.close_price for b in bars[:i + 1]])
+        high: np.ndarray = np.array([b.high_price for b in bars[:i + 1]])
+        low: np.ndarray = np.array([b.low_price for b in bars[:i + 1]])
+
+        macd, signal, hist = talib.MACD(close, 12, 26, 9)
+
+        results: list[tuple] = [
+            (incremental.ema(20), talib.EMA(close, 20)[-1]),
+            (incremental.atr(14), talib.ATR(high, low, close, 14)[-1]),
+            (incremental.rsi(14), talib.RSI(close, 14)[-1]),
+            *zip(incremental.macd(12, 26, 9), (macd[-1], signal[-1], hist[-1]), strict=True),
+            (incremental.sma(20), plain.sma(20)),
+            (incremental.std(20), plain.std(20)),
+            *zip(incremental.boll(20, 2), plain.boll(20, 2), strict=True),
+        ]
+        for value, expected in results:
+            assert np.isclose(value, expected, rtol=1e-9, atol=1e-9), (i, value, expected)
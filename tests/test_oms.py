@@ -0,0 +1,110 @@
+"""
+Tests of OmsEngine retention and archive.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Direction, Exchange, Status
+from vnpy.trader.engine import MainEngine, OmsEngine
+from vnpy.trader.event import EVENT_ORDER, EVENT_TRADE
+from vnpy.trader.object import OrderData, TradeData
+from vnpy.trader.setting import SETTINGS
+from vnpy.trader.utility import get_folder_path
+
+
+def create_order(orderid: str, status: Status, symbol: str = "rb2501") -> OrderData:
+    """"""
+    return OrderData(
+        symbol=symbol,
+        exchange=Exchange.SHFE,
+        orderid=orderid,
+        direction=Direction.LONG,
+        price=3000,
+        volume=1,
+        status=status,
+        gateway_name="TEST"
+    )
+
+
+def create_trade(tradeid: str, orderid: str, symbol: str = "rb2501") -> TradeData:
+    """"""
+    return TradeData(
+        symbol=symbol,
+        exchange=Exchange.SHFE,
+        orderid=orderid,
+        tradeid=tradeid,
+        direction=Direction.LONG,
+        price=3000,
+        volume=1,
+        gateway_name="TEST"
+    )
+
+
+@pytest.fixture
+def retention(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[MainEngine, OmsEngine]]:
+    """
+    Main engine with retention of 10 finished data, event engine is not
+    started so that events are processed by calling handlers directly.
+    """
+    monkeypatch.setitem(SETTINGS, "oms.retention_count", 10)
+
+    main_engine: MainEngine = MainEngine(EventEngine())
+    oms_engine: OmsEngine = main_engine.get_engine("oms")      # type: ignore
+
+    yield main_engine, oms_engine
+
+    main_engine.close()
+
+
+def test_retention_and_archive(retention: tuple[MainEngine, OmsEngine]) -> None:
+    """
+    Finished data out of retention are moved into archive, and can
+    still be loaded by id.
+    """
+    main_engine, oms_engine = retention
+
+    for i in range(30):
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order(str(i), Status.NOTTRADED)))
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order(str(i), Status.ALLTRADED)))
+        oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade(str(i), str(i))))
+
+    assert len(oms_engine.orders) == 10
+    assert len(oms_engine.trades) == 10
+    assert len(oms_engine.symbol_trades["rb2501.SHFE"]) == 10
+    assert not oms_engine.active_orders
+
+    for i in range(30):
+        order: OrderData | None = main_engine.get_order(f"TEST.{i}")
+        assert order and order.status == Status.ALLTRADED
+
+        trade: TradeData | None = main_engine.get_trade(f"TEST.{i}")
+        assert trade and trade.orderid == str(i)
+
+
+def test_active_orders_kept(retention: tuple[MainEngine, OmsEngine]) -> None:
+    """
+    Active orders are never archived.
+    """
+    main_engine, oms_engine = retention
+
+    for i in range(30):
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order(str(i), Status.NOTTRADED)))
+
+    assert len(oms_engine.orders) == 30
+    assert len(main_engine.get_all_active_orders()) == 30
+
+
+def test_archive_file_removed(retention: tuple[MainEngine, OmsEngine]) -> None:
+    """
+    No archive file is left on disk after close.
+    """
+    main_engine, oms_engine = retention
+
+    for i in range(30):
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order(str(i), Status.ALLTRADED)))
+
+    oms_engine.order_archive.close()
+    assert not list(get_folder_path("archive").glob("order_*.pkl"))
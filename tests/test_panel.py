@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+import talib
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarData
+from vnpy.trader.utility import PanelArrayManager
+
+
+VT_SYMBOLS: list[str] = ["rb2501.SHFE", "hc2501.SHFE", "i2501.DCE"]
+
+
+def create_panel(size: int) -> PanelArrayManager:
+    """"""
+    panel: PanelArrayManager = PanelArrayManager(VT_SYMBOLS, size)
+
+    prices: np.ndarray = 100 + np.random.default_rng(0).standard_normal((size, len(VT_SYMBOLS))).cumsum(axis=0)
+    for row in prices:
+        bars: dict[str, BarData] = {}
+
+        for vt_symbol, price in zip(VT_SYMBOLS, row, strict=True):
+            symbol, exchange_str = vt_symbol.split(".")
+
+            bars[vt_symbol] = BarData(
+                symbol=symbol,
+                exchange=Exchange(exchange_str),
+                datetime=datetime.now(),
+                interval=Interval.MINUTE,
+                gateway_name="TEST",
+                open_price=price,
+                high_price=price + 1,
+                low_price=price - 2,
+                close_price=price,
+                volume=100
+            )
+
+        panel.update_bars(bars)
+
+    return panel
+
+
+@pytest.mark.parametrize("size", [100, 2000])
+@pytest.mark.parametrize("n", [1, 2, 14])
+def test_smooth_matches_talib(size: int, n: int) -> None:
+    """"""
+    panel: PanelArrayManager = create_panel(size)
+
+    for i in range(len(VT_SYMBOLS)):
+        high: np.ndarray = panel.high[i].copy()
+        low: np.ndarray = panel.low[i].copy()
+        close: np.ndarray = panel.close[i].copy()
+
+        expected: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = [
+            (panel.ema(n, True)[i], panel.ema(n)[i], talib.EMA(close, n)),
+            (panel.atr(n, True)[i], panel.atr(n)[i], talib.ATR(high, low, close, n)),
+        ]
+        if n > 1:
+            expected.append((panel.rsi(n, True)[i], panel.rsi(n)[i], talib.RSI(close, n)))
+
+        for result_array, result_value, talib_array in expected:
+            assert np.allclose(result_array, talib_array, equal_nan=True)
+            assert np.isclose(result_value, talib_array[-1])
+
+
+def test_arrays() -> None:
+    """"""
+    panel: PanelArrayManager = create_panel(10)
+
+    close: np.ndarray = panel.get_array(3)
+    close[:, -1] = 0
+    assert (panel.close[:, -1] != 0).all()
+
+    with pytest.raises(ValueError):
+        panel.close[:, -1] = 0
+
+
+def test_unknown_symbol() -> None:
+    """"""
+    panel: PanelArrayManager = create_panel(10)
+
+    bar: BarData = BarData(
+        symbol="j2501",
+        exchange=Exchange.DCE,
+        datetime=datetime.now(),
+        interval=Interval.MINUTE,
+        gateway_name="TEST"
+    )
+    with pytest.raises(ValueError, match="j2501.DCE"):
+        panel.update_bars({bar.vt_symbol: bar})
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from vnpy.trader.constant import Exchange, OptionType, Product
+from vnpy.trader.object import ContractData
+from vnpy.trader.registry import ContractRegistry
+
+
+def create_contract(symbol: str, exchange: Exchange = Exchange.SHFE, **kwargs) -> ContractData:
+    """"""
+    return ContractData(
+        symbol=symbol,
+        exchange=exchange,
+        name=symbol,
+        product=kwargs.pop("product", Product.FUTURES),
+        size=10,
+        pricetick=1,
+        gateway_name="TEST",
+        **kwargs
+    )
+
+
+def test_search() -> None:
+    """"""
+    registry: ContractRegistry = ContractRegistry()
+    for symbol in ["rb2501", "rb2505", "hc2501", "ru2501"]:
+        registry.add(create_contract(symbol))
+    registry.add(create_contract("IF2501", Exchange.CFFEX))
+
+    assert registry.search_prefix("rb") == ["rb2501.SHFE", "rb2505.SHFE"]
+    assert registry.search_keyword("2501") == [
+        "IF2501.CFFEX", "hc2501.SHFE", "rb2501.SHFE", "ru2501.SHFE"
+    ]
+    assert registry.search_keyword("2501.SH") == ["hc2501.SHFE", "rb2501.SHFE", "ru2501.SHFE"]
+    assert registry.search_keyword("05") == ["rb2505.SHFE"]
+    assert registry.search_keyword("2509") == []
+
+    # Replaced contract is not indexed twice
+    registry.add(create_contract("rb2501"))
+    assert registry.search_keyword("rb25") == ["rb2501.SHFE", "rb2505.SHFE"]
+
+    result: list[ContractData] = registry.query(exchange=Exchange.SHFE, keyword="250")
+    assert [c.vt_symbol for c in result] == [
+        "hc2501.SHFE", "rb2501.SHFE", "rb2505.SHFE", "ru2501.SHFE"
+    ]
+
+
+def test_option_chain() -> None:
+    """"""
+    registry: ContractRegistry = ContractRegistry()
+
+    expiry: datetime = datetime(2025, 1, 24, 15, tzinfo=ZoneInfo("Asia/Shanghai"))
+    for i, strike in enumerate([3100, 3000]):
+        for option_type in [OptionType.PUT, OptionType.CALL]:
+            registry.add(create_contract(
+                f"rb2502{option_type.name[0]}{strike}",
+                product=Product.OPTION,
+                option_underlying="rb2502.SHFE",
+                option_strike=strike,
+                option_type=option_type,
+                option_expiry=expiry + timedelta(days=i * 30)
+            ))
+
+    # Option without expiry is sorted first
+    registry.add(create_contract(
+        "rb2502C2900",
+        product=Product.OPTION,
+        option_underlying="rb2502.SHFE",
+        option_strike=2900,
+        option_type=OptionType.CALL
+    ))
+
+    chain: list[ContractData] = registry.get_option_chain("rb2502.SHFE")
+    assert [c.symbol for c in chain] == [
+        "rb2502C2900", "rb2502C3100", "rb2502P3100", "rb2502C3000", "rb2502P3000"
+    ]
@@ -0,0 +1,214 @@
+"""
+Tests of RiskEngine limits.
+"""
+
+from collections.abc import Iterator
+from itertools import count
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Direction, Exchange, Offset, OrderType, Status
+from vnpy.trader.engine import MainEngine, RiskEngine
+from vnpy.trader.event import EVENT_ORDER, EVENT_POSITION
+from vnpy.trader.gateway import BaseGateway
+from vnpy.trader.object import CancelRequest, OrderData, OrderRequest, PositionData, SubscribeRequest
+from vnpy.trader.setting import SETTINGS
+
+
+VT_SYMBOL: str = "rb2501.SHFE"
+
+
+class FakeGateway(BaseGateway):
+    """
+    Gateway accepting all orders after a short delay.
+    """
+
+    default_name: str = "TEST"
+    exchanges: list[Exchange] = [Exchange.SHFE]
+
+    def __init__(self, event_engine: EventEngine, gateway_name: str) -> None:
+        """"""
+        super().__init__(event_engine, gateway_name)
+
+        self.orderids: count = count(1)
+
+    def connect(self, setting: dict) -> None:
+        """"""
+        pass
+
+    def close(self) -> None:
+        """"""
+        pass
+
+    def subscribe(self, req: SubscribeRequest) -> None:
+        """"""
+        pass
+
+    def send_order(self, req: OrderRequest) -> str:
+        """"""
+        sleep(0.01)
+        order: OrderData = req.create_order_data(str(next(self.orderids)), self.gateway_name)
+        return order.vt_orderid
+
+    def cancel_order(self, req: CancelRequest) -> None:
+        """"""
+        pass
+
+    def query_account(self) -> None:
+        """"""
+        pass
+
+    def query_position(self) -> None:
+        """"""
+        pass
+
+
+@pytest.fixture
+def main_engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[MainEngine]:
+    """
+    Main engine with risk engine active and limits disabled.
+    """
+    monkeypatch.setitem(SETTINGS, "risk.active", True)
+    monkeypatch.setitem(SETTINGS, "risk.order_flow_limit", 0)
+    monkeypatch.setitem(SETTINGS, "risk.cancel_flow_limit", 0)
+    monkeypatch.setitem(SETTINGS, "risk.order_size_limit", 0)
+    monkeypatch.setitem(SETTINGS, "risk.self_trade_check", False)
+
+    main_engine: MainEngine = MainEngine(EventEngine())
+    main_engine.add_gateway(FakeGateway)
+
+    yield main_engine
+
+    main_engine.close()
+
+
+def create_request(
+    direction: Direction = Direction.LONG,
+    price: float = 3000,
+    volume: float = 1
+) -> OrderRequest:
+    """"""
+    return OrderRequest(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        direction=direction,
+        type=OrderType.LIMIT,
+        volume=volume,
+        price=price,
+        offset=Offset.OPEN
+    )
+
+
+def test_order_limits(main_engine: MainEngine) -> None:
+    """"""
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.order_size_limit = 10
+    risk_engine.order_notional_limit = 50000
+
+    assert risk_engine.check_order(create_request(volume=10), "TEST")
+    assert not risk_engine.check_order(create_request(volume=11), "TEST")
+    assert not risk_engine.check_order(create_request(price=6000, volume=10), "TEST")
+
+
+def test_position_limit(main_engine: MainEngine) -> None:
+    """"""
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.position_limit = 5
+
+    position: PositionData = PositionData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        direction=Direction.LONG,
+        volume=3,
+        gateway_name="TEST"
+    )
+    risk_engine.process_position_event(Event(EVENT_POSITION, position))
+
+    assert main_engine.send_order(create_request(volume=2), "TEST")
+    assert not main_engine.send_order(create_request(volume=1), "TEST")
+    assert main_engine.send_order(create_request(Direction.SHORT, volume=8), "TEST")
+
+    # Pending volume released after order cancelled
+    order: OrderData = risk_engine.active_orders["TEST.1"]
+    cancelled: OrderData = OrderData(
+        symbol=order.symbol,
+        exchange=order.exchange,
+        orderid=order.orderid,
+        direction=order.direction,
+        offset=order.offset,
+        price=order.price,
+        volume=order.volume,
+        status=Status.CANCELLED,
+        gateway_name="TEST"
+    )
+    risk_engine.process_order_event(Event(EVENT_ORDER, cancelled))
+
+    assert risk_engine.long_pending[VT_SYMBOL] == 0
+    assert main_engine.send_order(create_request(volume=2), "TEST")
+
+
+def test_self_trade_check(main_engine: MainEngine) -> None:
+    """"""
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.self_trade_check = True
+
+    assert main_engine.send_order(create_request(Direction.SHORT, price=3010), "TEST")
+    assert main_engine.send_order(create_request(Direction.LONG, price=3000), "TEST")
+    assert not main_engine.send_order(create_request(Direction.LONG, price=3010), "TEST")
+    assert not main_engine.send_order(create_request(Direction.SHORT, price=3000), "TEST")
+
+
+def test_order_flow_counts_rejected(main_engine: MainEngine) -> None:
+    """"""
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.order_flow_limit = 3
+    risk_engine.order_size_limit = 10
+    risk_engine.flow_seconds = 60
+
+    assert not main_engine.send_order(create_request(volume=20), "TEST")
+    assert not main_engine.send_order(create_request(volume=20), "TEST")
+    assert main_engine.send_order(create_request(volume=1), "TEST")
+    assert not main_engine.send_order(create_request(volume=1), "TEST")
+
+
+def test_concurrent_orders(main_engine: MainEngine) -> None:
+    """
+    Orders sent from several threads cannot exceed limit together.
+    """
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.position_limit = 5
+
+    vt_orderids: list[str] = []
+
+    def send() -> None:
+        vt_orderid: str = main_engine.send_order(create_request(volume=1), "TEST")
+        if vt_orderid:
+            vt_orderids.append(vt_orderid)
+
+    threads: list[Thread] = [Thread(target=send) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(vt_orderids) == 5
+    assert risk_engine.long_pending[VT_SYMBOL] == 5
+    assert len(risk_engine.active_orders) == 5
+
+
+def test_finished_orders_bounded(main_engine: MainEngine) -> None:
+    """"""
+    risk_engine: RiskEngine = main_engine.risk_engine
+    risk_engine.finished_limit = 10
+
+    for _ in range(30):
+        vt_orderid: str = main_engine.send_order(create_request(), "TEST")
+        order: OrderData = risk_engine.active_orders[vt_orderid]
+        order.status = Status.ALLTRADED
+        risk_engine.update_order(order)
+
+    assert len(risk_engine.finished_orders) == 10
+    assert not risk_engine.active_orders
@@ -0,0 +1,122 @@
+"""
+Tests of ShardedEventEngine.
+"""
+
+from threading import Lock
+from time import sleep
+
+import pytest
+
+from vnpy.event import Event, ShardedEventEngine, shard_key
+from vnpy.trader.constant import Direction, Exchange, Status
+from vnpy.trader.engine import MainEngine, OmsEngine
+from vnpy.trader.event import EVENT_ORDER
+from vnpy.trader.object import OrderData
+
+
+class Data:
+    """"""
+
+    def __init__(self, vt_symbol: str, seq: int) -> None:
+        """"""
+        self.vt_symbol: str = vt_symbol
+        self.seq: int = seq
+
+
+def wait_empty(engine: ShardedEventEngine) -> None:
+    """
+    Wait until all worker queues are processed.
+    """
+    for _ in range(500):
+        if not any(engine._queues):
+            break
+        sleep(0.01)
+    sleep(0.05)
+
+
+def test_invalid_worker_count() -> None:
+    """"""
+    with pytest.raises(ValueError):
+        ShardedEventEngine(worker_count=0)
+
+
+def test_same_key_order() -> None:
+    """
+    Events with the same key are processed in order.
+    """
+    engine: ShardedEventEngine = ShardedEventEngine(worker_count=4)
+
+    received: dict[str, list[int]] = {}
+    lock: Lock = Lock()
+
+    @shard_key("vt_symbol")
+    def process(event: Event) -> None:
+        with lock:
+            received.setdefault(event.data.vt_symbol, []).append(event.data.seq)
+
+    engine.register("eTest", process)
+    engine.start()
+
+    for seq in range(2000):
+        for i in range(8):
+            engine.put(Event("eTest", Data(f"s{i}.SSE", seq)))
+
+    wait_empty(engine)
+    engine.stop()
+
+    assert len(received) == 8
+    for seqs in received.values():
+        assert seqs == list(range(2000))
+
+
+def test_undecorated_handler_serial() -> None:
+    """
+    Handlers without shard key are all processed in the first worker.
+    """
+    engine: ShardedEventEngine = ShardedEventEngine(worker_count=4)
+
+    order: list[int] = []
+
+    def process(event: Event) -> None:
+        order.append(event.data.seq)
+
+    engine.register("eTest", process)
+    engine.start()
+
+    for seq in range(1000):
+        engine.put(Event("eTest", Data(f"s{seq % 10}.SSE", seq)))
+
+    wait_empty(engine)
+    engine.stop()
+
+    assert order == list(range(1000))
+
+
+def test_oms_consistency() -> None:
+    """
+    OMS state is consistent with 4 workers.
+    """
+    event_engine: ShardedEventEngine = ShardedEventEngine(worker_count=4)
+    main_engine: MainEngine = MainEngine(event_engine)
+    oms_engine: OmsEngine = main_engine.get_engine("oms")      # type: ignore
+
+    for i in range(2000):
+        for status in (Status.NOTTRADED, Status.ALLTRADED if i % 2 else Status.NOTTRADED):
+            order: OrderData = OrderData(
+                symbol=f"s{i % 50}",
+                exchange=Exchange.SSE,
+                orderid=str(i),
+                direction=Direction.LONG,
+                volume=1,
+                status=status,
+                gateway_name="TEST"
+            )
+            event_engine.put(Event(EVENT_ORDER, order))
+
+    wait_empty(event_engine)
+
+    assert len(oms_engine.orders) == 2000
+    assert len(oms_engine.active_orders) == 1000
+    assert sum(len(orders) for orders in oms_engine.symbol_active_orders.values()) == 1000
+
+    main_engine.close()
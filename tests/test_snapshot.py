@@ -0,0 +1,202 @@
+"""
+Tests of OmsEngine snapshot restore and reconcile.
+"""
+
+from collections.abc import Iterator
+from datetime import date, datetime
+from time import sleep
+from typing import Any
+
+import pytest
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Direction, Exchange, Offset, Product, Status
+from vnpy.trader.engine import MainEngine, OmsEngine, RiskEngine, get_trading_day
+from vnpy.trader.event import EVENT_CONTRACT, EVENT_ORDER, EVENT_POSITION, EVENT_TRADE
+from vnpy.trader.object import ContractData, OrderData, PositionData, TradeData
+from vnpy.trader.setting import SETTINGS
+from vnpy.trader.snapshot import SnapshotStore
+
+
+VT_SYMBOL: str = "rb2501.SHFE"
+
+
+@pytest.fixture
+def snapshot_setting(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """
+    Enable snapshot and risk engine, and remove snapshot files.
+    """
+    monkeypatch.setitem(SETTINGS, "oms.snapshot_interval", 1000)
+    monkeypatch.setitem(SETTINGS, "risk.active", True)
+    monkeypatch.setitem(SETTINGS, "risk.order_flow_limit", 0)
+
+    store: SnapshotStore = SnapshotStore("oms")
+    store.snapshot_path.unlink(missing_ok=True)
+    store.journal_path.unlink(missing_ok=True)
+
+    yield
+
+    store.snapshot_path.unlink(missing_ok=True)
+    store.journal_path.unlink(missing_ok=True)
+
+
+def create_engine() -> tuple[MainEngine, OmsEngine]:
+    """"""
+    main_engine: MainEngine = MainEngine(EventEngine())
+    oms_engine: OmsEngine = main_engine.get_engine("oms")      # type: ignore
+    return main_engine, oms_engine
+
+
+def prepare_state(oms_engine: OmsEngine) -> None:
+    """
+    Contract, long position of 5, active close order of 2 and a trade.
+    """
+    contract: ContractData = ContractData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        name="rb2501",
+        product=Product.FUTURES,
+        size=10,
+        pricetick=1,
+        gateway_name="TEST"
+    )
+    oms_engine.process_contract_event(Event(EVENT_CONTRACT, contract))
+
+    position: PositionData = PositionData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        direction=Direction.LONG,
+        volume=5,
+        yd_volume=5,
+        gateway_name="TEST"
+    )
+    oms_engine.process_position_event(Event(EVENT_POSITION, position))
+
+    order: OrderData = OrderData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        orderid="1",
+        direction=Direction.SHORT,
+        offset=Offset.CLOSE,
+        price=3000,
+        volume=2,
+        status=Status.NOTTRADED,
+        gateway_name="TEST"
+    )
+    oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+    oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade()))
+
+
+def create_trade() -> TradeData:
+    """"""
+    return TradeData(
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        orderid="0",
+        tradeid="0",
+        direction=Direction.LONG,
+        offset=Offset.OPEN,
+        price=3000,
+        volume=1,
+        gateway_name="TEST"
+    )
+
+
+def test_restore_and_reconcile(snapshot_setting: None) -> None:
+    """"""
+    main_engine, oms_engine = create_engine()
+    prepare_state(oms_engine)
+    long_pos: float = oms_engine.offset_converters["TEST"].holdings[VT_SYMBOL].long_pos
+    main_engine.close()
+
+    main_engine, oms_engine = create_engine()
+    risk_engine: RiskEngine = main_engine.risk_engine
+
+    assert "TEST.1" in oms_engine.active_orders
+    assert risk_engine.short_pending[VT_SYMBOL] == 2
+    assert risk_engine.net_positions[VT_SYMBOL] == 5
+
+    # Trade replayed by gateway is not applied to offset converter again
+    oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade()))
+    holding = oms_engine.offset_converters["TEST"].holdings[VT_SYMBOL]
+    assert holding.long_pos == long_pos
+
+    # Nothing else confirmed by gateway
+    oms_engine.reconcile_snapshot("TEST")
+
+    assert not oms_engine.active_orders
+    assert not oms_engine.positions
+    assert not holding.active_orders
+    assert holding.long_pos == 0
+    assert holding.long_pos_frozen == 0
+    assert risk_engine.short_pending[VT_SYMBOL] == 0
+    assert risk_engine.net_positions[VT_SYMBOL] == 0
+
+    main_engine.close()
+
+
+def test_trade_without_snapshot() -> None:
+    """
+    Every trade is applied to offset converter if not restored.
+    """
+    main_engine, oms_engine = create_engine()
+    prepare_state(oms_engine)
+
+    holding = oms_engine.offset_converters["TEST"].holdings[VT_SYMBOL]
+    long_pos: float = holding.long_pos
+
+    oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade()))
+    assert holding.long_pos == long_pos + 1
+
+    main_engine.close()
+
+
+def test_old_trading_day_ignored(snapshot_setting: None) -> None:
+    """"""
+    main_engine, oms_engine = create_engine()
+    prepare_state(oms_engine)
+    main_engine.close()
+
+    store: SnapshotStore = SnapshotStore("oms")
+    state, _ = store.load()
+    state["trading_day"] = date(2020, 1, 2)
+    store.save_snapshot(state)
+    store.close()
+
+    main_engine, oms_engine = create_engine()
+    assert not oms_engine.orders
+    main_engine.close()
+
+
+def test_trading_day() -> None:
+    """"""
+    # 2025-01-03 is Friday
+    assert get_trading_day(datetime(2025, 1, 3, 10), 17) == date(2025, 1, 3)
+    assert get_trading_day(datetime(2025, 1, 3, 22), 17) == date(2025, 1, 6)
+    assert get_trading_day(datetime(2025, 1, 4, 1), 17) == date(2025, 1, 6)
+    assert get_trading_day(datetime(2025, 1, 6, 16, 59), 17) == date(2025, 1, 6)
+    assert get_trading_day(datetime(2025, 1, 6, 21), 17) == date(2025, 1, 7)
+    assert get_trading_day(datetime(2025, 1, 7, 0, 30), 17) == date(2025, 1, 7)
+
+
+def test_store_task_failure(snapshot_setting: None) -> None:
+    """
+    Failed task does not stop the writer thread, and tasks after close
+    are ignored.
+    """
+    store: SnapshotStore = SnapshotStore("oms")
+
+    def fail(data: Any) -> None:
+        raise ValueError(data)
+
+    store.put_task(fail, "test")
+    store.save_snapshot({"value": 1})
+    sleep(0.1)
+    store.close()
+
+    state, _ = store.load()
+    assert state == {"value": 1}
+
+    store.save_snapshot({"value": 2})
+    store.write_journal("eTest", 1)
@@ -8,7 +8,7 @@ from functools import lru_cache
 
 import polars as pl
 
-from vnpy.trader.object import BarData
+from vnpy.trader.object import BarData, BarBatch
 from vnpy.trader.constant import Interval
 from vnpy.trader.utility import extract_vt_symbol
 
@@ -48,37 +48,50 @@ class AlphaLab:
             if not path.exists():
                 path.mkdir(parents=True)
 
-    def save_bar_data(self, bars: list[BarData]) -> None:
+    def save_bar_data(self, bars: list[BarData] | BarBatch) -> None:
         """Save bar data"""
-        if not bars:
+        if not len(bars):
             return
 
         # Get file path
-        bar: BarData = bars[0]
-
-        if bar.interval == Interval.DAILY:
-            file_path: Path = self.daily_path.joinpath(f"{bar.vt_symbol}.parquet")
-        elif bar.interval == Interval.MINUTE:
-            file_path = self.minute_path.joinpath(f"{bar.vt_symbol}.parquet")
-        elif bar.interval:
-            logger.error(f"Unsupported interval {bar.interval.value}")
-            return
+        if isinstance(bars, BarBatch):
+            vt_symbol: str = bars.vt_symbol
+            interval: Interval | None = bars.interval
+        else:
+            vt_symbol = bars[0].vt_symbol
+            interval = bars[0].interval
 
-        data: list = []
-        for bar in bars:
-            bar_data: dict = {
-                "datetime": bar.datetime.replace(tzinfo=None),
-                "open": bar.open_price,
-                "high": bar.high_price,
-                "low": bar.low_price,
-                "close": bar.close_price,
-                "volume": bar.volume,
-                "turnover": bar.turnover,
-                "open_interest": bar.open_interest
-            }
-            data.append(bar_data)
+        if interval == Interval.DAILY:
+            file_path: Path = self.daily_path.joinpath(f"{vt_symbol}.parquet")
+        elif interval == Interval.MINUTE:
+            file_path = self.minute_path.joinpath(f"{vt_symbol}.parquet")
+        elif interval:
+            logger.error(f"Unsupported interval {interval.value}")
+            return
 
-        new_df: pl.DataFrame = pl.DataFrame(data)
+        if isinstance(bars, BarBatch):
+            new_df: pl.DataFrame = bars.to_polars().rename({
+                "open_price": "open",
+                "high_price": "high",
+                "low_price": "low",
+                "close_price": "close"
+            })
+        else:
+            data: list = []
+            for bar in bars:
+                bar_data: dict = {
+                    "datetime": bar.datetime.replace(tzinfo=None),
+                    "open": bar.open_price,
+                    "high": bar.high_price,
+                    "low": bar.low_price,
+                    "close": bar.close_price,
+                    "volume": bar.volume,
+                    "turnover": bar.turnover,
+                    "open_interest": bar.open_interest
+                }
+                data.append(bar_data)
+
+            new_df = pl.DataFrame(data)
 
         # If file exists, read and merge
         if file_path.exists():
@@ -101,6 +114,20 @@ class AlphaLab:
         end: datetime | str
     ) -> list[BarData]:
         """Load bar data"""
+        batch: BarBatch | None = self.load_bar_batch(vt_symbol, interval, start, end)
+        if not batch:
+            return []
+
+        return batch.to_bars()
+
+    def load_bar_batch(
+        self,
+        vt_symbol: str,
+        interval: Interval | str,
+        start: datetime | str,
+        end: datetime | str
+    ) -> BarBatch | None:
+        """Load bar data in columnar format"""
         # Convert types
         if isinstance(interval, str):
             interval = Interval(interval)
@@ -115,13 +142,13 @@ class AlphaLab:
             folder_path = self.minute_path
         else:
             logger.error(f"Unsupported interval {interval.value}")
-            return []
+            return None
 
         # Check if file exists
         file_path: Path = folder_path.joinpath(f"{vt_symbol}.parquet")
         if not file_path.exists():
             logger.error(f"File {file_path} does not exist")
-            return []
+            return None
 
         # Open file
         df: pl.DataFrame = pl.read_parquet(file_path)
@@ -129,29 +156,23 @@ class AlphaLab:
         # Filter by date range
         df = df.filter((pl.col("datetime") >= start) & (pl.col("datetime") <= end))
 
-        # Convert to BarData objects
-        bars: list[BarData] = []
-
+        # Convert to columnar bar data
         symbol, exchange = extract_vt_symbol(vt_symbol)
 
-        for row in df.iter_rows(named=True):
-            bar = BarData(
-                symbol=symbol,
-                exchange=exchange,
-                datetime=row["datetime"],
-                interval=interval,
-                open_price=row["open"],
-                high_price=row["high"],
-                low_price=row["low"],
-                close_price=row["close"],
-                volume=row["volume"],
-                turnover=row["turnover"],
-                open_interest=row["open_interest"],
-                gateway_name="DB"
-            )
-            bars.append(bar)
-
-        return bars
+        batch: BarBatch = BarBatch.from_polars(
+            df.with_columns(pl.col("datetime").cast(pl.Datetime("us"))),
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            gateway_name="DB",
+            columns={
+                "open_price": "open",
+                "high_price": "high",
+                "low_price": "low",
+                "close_price": "close"
+            }
+        )
+        return batch
 
     def load_bar_df(
         self,
@@ -11,7 +11,7 @@ from plotly.subplots import make_subplots       # type: ignore
 from tqdm import tqdm
 
 from vnpy.trader.constant import Direction, Offset, Interval, Status
-from vnpy.trader.object import OrderData, TradeData, BarData
+from vnpy.trader.object import OrderData, TradeData, BarData, BarBatch
 from vnpy.trader.utility import round_to, extract_vt_symbol
 
 from ..logger import logger
@@ -47,7 +47,8 @@ class BacktestingEngine:
         self.datetime: datetime | None = None
 
         self.interval: Interval
-        self.history_data: dict[tuple, BarData] = {}
+        self.history_data: dict[str, BarBatch] = {}
+        self.history_rows: dict[tuple[datetime, str], int] = {}
         self.dts: set[datetime] = set()
 
         self.limit_order_count: int = 0
@@ -122,25 +123,32 @@ class BacktestingEngine:
 
         # Clear previously loaded historical data
         self.history_data.clear()
+        self.history_rows.clear()
         self.dts.clear()
 
-        # Load historical data for each symbol
+        # Load historical data for each symbol, bar data is only created
+        # from batch row when replayed
         empty_symbols: list[str] = []
         for vt_symbol in tqdm(self.vt_symbols, total=len(self.vt_symbols)):
-            data: list[BarData] = self.lab.load_bar_data(
+            batch: BarBatch | None = self.lab.load_bar_batch(
                 vt_symbol,
                 self.interval,
                 self.start,
                 self.end
             )
 
-            for bar in data:
-                self.dts.add(bar.datetime)
-                self.history_data[(bar.datetime, vt_symbol)] = bar
-
-            data_count = len(data)
-            if not data_count:
+            if not batch:
                 empty_symbols.append(vt_symbol)
+                continue
+
+            self.history_data[vt_symbol] = batch
+
+            dts: list[datetime] = batch.datetime.tolist()
+            if batch.tzinfo:
+                dts = [dt.replace(tzinfo=batch.tzinfo) for dt in dts]
+
+            self.dts.update(dts)
+            self.history_rows.update({(dt, vt_symbol): row for row, dt in enumerate(dts)})
 
         if empty_symbols:
             logger.info(f"部分合约历史数据为空：{empty_symbols}")
@@ -587,7 +595,11 @@ class BacktestingEngine:
                 if last_bar.close_price:
                     self.pre_closes[vt_symbol] = last_bar.close_price
 
-            bar: BarData | None = self.history_data.get((dt, vt_symbol), None)
+            bar: BarData | None = None
+
+            row: int | None = self.history_rows.get((dt, vt_symbol), None)
+            if row is not None:
+                bar = self.history_data[vt_symbol][row]
 
             # Check if historical data for the specified time of the contract is obtained
             if bar:
@@ -3,7 +3,7 @@ from abc import abstractmethod
 import pyqtgraph as pg      # type: ignore
 
 from vnpy.trader.ui import QtCore, QtGui, QtWidgets
-from vnpy.trader.object import BarData
+from vnpy.trader.object import BarData, BarBatch
 
 from .base import BLACK_COLOR, UP_COLOR, DOWN_COLOR, PEN_WIDTH, BAR_WIDTH
 from .manager import BarManager
@@ -71,15 +71,13 @@ class ChartItem(pg.GraphicsObject):
         """
         pass
 
-    def update_history(self, history: list[BarData]) -> None:
+    def update_history(self, history: list[BarData] | BarBatch) -> None:
         """
         Update a list of bar data.
         """
         self._bar_picutures.clear()
 
-        bars: list[BarData] = self._manager.get_all_bars()
-
-        for ix, _ in enumerate(bars):
+        for ix in range(self._manager.get_count()):
             self._bar_picutures[ix] = None
 
         self.update()
@@ -1,30 +1,42 @@
 from datetime import datetime
 from _collections_abc import dict_keys
 
-from vnpy.trader.object import BarData
+import numpy as np
+
+from vnpy.trader.object import BarData, BarBatch
 
 from .base import to_int
 
 
 class BarManager:
-    """"""
+    """
+    Bars of history updated in BarBatch are only created when accessed,
+    and their price and volume ranges are calculated on batch columns.
+    """
 
     def __init__(self) -> None:
         """"""
-        self._bars: dict[datetime, BarData] = {}
+        # Bar is None if not created yet from row of batch
+        self._bars: dict[datetime, BarData | None] = {}
+        self._batch: BarBatch | None = None
+        self._batch_rows: dict[datetime, int] = {}
+
         self._datetime_index_map: dict[datetime, int] = {}
         self._index_datetime_map: dict[int, datetime] = {}
 
         self._price_ranges: dict[tuple[int, int], tuple[float, float]] = {}
         self._volume_ranges: dict[tuple[int, int], tuple[float, float]] = {}
 
-    def update_history(self, history: list[BarData]) -> None:
+    def update_history(self, history: list[BarData] | BarBatch) -> None:
         """
         Update a list of bar data.
         """
-        # Put all new bars into dict
-        for bar in history:
-            self._bars[bar.datetime] = bar
+        if isinstance(history, BarBatch):
+            self._update_batch(history)
+        else:
+            # Put all new bars into dict
+            for bar in history:
+                self._bars[bar.datetime] = bar
 
         # Sort bars dict according to bar.datetime
         self._bars = dict(sorted(self._bars.items(), key=lambda tp: tp[0]))
@@ -39,6 +51,67 @@ class BarManager:
         # Clear data range cache
         self._clear_cache()
 
+    def _update_batch(self, batch: BarBatch) -> None:
+        """
+        Put rows of batch into dict without creating bar data.
+        """
+        # Only rows of the latest batch are kept lazily
+        if self._batch:
+            self._create_all()
+
+        dts: list[datetime] = batch.datetime.tolist()
+        if batch.tzinfo:
+            dts = [dt.replace(tzinfo=batch.tzinfo) for dt in dts]
+
+        self._batch = batch
+        self._batch_rows = dict(zip(dts, range(len(dts)), strict=True))
+        self._bars.update(dict.fromkeys(dts))
+
+    def _create_bar(self, dt: datetime) -> BarData:
+        """
+        Get bar data of datetime, which is created from batch if not yet.
+        """
+        bar: BarData | None = self._bars[dt]
+        if bar is None and self._batch:
+            bar = self._batch[self._batch_rows[dt]]
+            self._bars[dt] = bar
+        return bar                                      # type: ignore
+
+    def _create_all(self) -> None:
+        """
+        Create all bar data not created yet from batch.
+        """
+        for dt, bar in self._bars.items():
+            if bar is None:
+                self._create_bar(dt)
+
+    def _get_range_data(
+        self,
+        min_ix: int,
+        max_ix: int,
+        names: tuple[str, ...]
+    ) -> tuple[list[BarData], list[np.ndarray]]:
+        """
+        Get bars created and batch columns of rows not created within
+        index range.
+        """
+        items: list[tuple[datetime, BarData | None]] = list(self._bars.items())[min_ix:max_ix + 1]
+
+        bars: list[BarData] = []
+        rows: list[int] = []
+
+        for dt, bar in items:
+            if bar is None:
+                rows.append(self._batch_rows[dt])
+            else:
+                bars.append(bar)
+
+        columns: list[np.ndarray] = []
+        if rows and self._batch:
+            columns = [getattr(self._batch, name)[rows] for name in names]
+
+        return bars, columns
+
     def update_bar(self, bar: BarData) -> None:
         """
         Update one single bar data.
@@ -82,13 +155,14 @@ class BarManager:
         if not dt:
             return None
 
-        return self._bars[dt]
+        return self._create_bar(dt)
 
     def get_all_bars(self) -> list[BarData]:
         """
         Get all bar data.
         """
-        return list(self._bars.values())
+        self._create_all()
+        return list(self._bars.values())                # type: ignore
 
     def get_price_range(self, min_ix: float | None = None, max_ix: float | None = None) -> tuple[float, float]:
         """
@@ -109,12 +183,18 @@ class BarManager:
         if buf:
             return buf
 
-        bar_list: list[BarData] = list(self._bars.values())[min_ix:max_ix + 1]
-        first_bar: BarData = bar_list[0]
-        max_price: float = first_bar.high_price
-        min_price: float = first_bar.low_price
+        bar_list, columns = self._get_range_data(min_ix, max_ix, ("high_price", "low_price"))
 
-        for bar in bar_list[1:]:
+        if columns:
+            high, low = columns
+            max_price: float = float(high.max())
+            min_price: float = float(low.min())
+        else:
+            first_bar: BarData = bar_list[0]
+            max_price = first_bar.high_price
+            min_price = first_bar.low_price
+
+        for bar in bar_list:
             max_price = max(max_price, bar.high_price)
             min_price = min(min_price, bar.low_price)
 
@@ -140,13 +220,15 @@ class BarManager:
         if buf:
             return buf
 
-        bar_list: list[BarData] = list(self._bars.values())[min_ix:max_ix + 1]
+        bar_list, columns = self._get_range_data(min_ix, max_ix, ("volume",))
 
-        first_bar: BarData = bar_list[0]
-        max_volume = first_bar.volume
-        min_volume = 0
+        if columns:
+            max_volume: float = float(columns[0].max())
+        else:
+            max_volume = bar_list[0].volume
+        min_volume: float = 0
 
-        for bar in bar_list[1:]:
+        for bar in bar_list:
             max_volume = max(max_volume, bar.volume)
 
         self._volume_ranges[(min_ix, max_ix)] = (min_volume, max_volume)
@@ -164,6 +246,8 @@ class BarManager:
         Clear all data in manager.
         """
         self._bars.clear()
+        self._batch = None
+        self._batch_rows.clear()
         self._datetime_index_map.clear()
         self._index_datetime_map.clear()
 
@@ -3,7 +3,7 @@ from datetime import datetime
 import pyqtgraph as pg      # type: ignore
 
 from vnpy.trader.ui import QtGui, QtWidgets, QtCore
-from vnpy.trader.object import BarData
+from vnpy.trader.object import BarData, BarBatch
 
 from .manager import BarManager
 from .base import (
@@ -152,7 +152,7 @@ class ChartWidget(pg.PlotWidget):
         if self._cursor:
             self._cursor.clear_all()
 
-    def update_history(self, history: list[BarData]) -> None:
+    def update_history(self, history: list[BarData] | BarBatch) -> None:
         """
         Update a list of bar data.
         """
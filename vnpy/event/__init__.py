@@ -1,8 +1,22 @@
 from .engine import Event, EventEngine, EVENT_TIMER
+from .profiler import EventProfiler, LatencyHistogram, EVENT_PROFILE
+from .async_engine import AsyncEventEngine
+from .priority import PriorityEventEngine, EventLane, LaneStats, get_default_lanes
+from .sharded import ShardedEventEngine, shard_key
 
 
 __all__ = [
     "Event",
     "EventEngine",
     "EVENT_TIMER",
+    "EventProfiler",
+    "LatencyHistogram",
+    "EVENT_PROFILE",
+    "AsyncEventEngine",
+    "PriorityEventEngine",
+    "EventLane",
+    "LaneStats",
+    "get_default_lanes",
+    "ShardedEventEngine",
+    "shard_key",
 ]
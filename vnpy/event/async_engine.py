@@ -0,0 +1,208 @@
+"""
+Asyncio based event engine for fully asynchronous deployments.
+"""
+
+from asyncio import AbstractEventLoop, Event as AsyncEvent, Task, TimerHandle, get_running_loop, new_event_loop
+from collections import deque
+from inspect import isawaitable
+from threading import Thread, get_ident
+from time import monotonic
+from typing import Any
+
+from .engine import Event, EventEngine, HandlerType
+
+
+class AsyncEventEngine(EventEngine):
+    """
+    Event engine which distributes events on an asyncio event loop.
+
+    Handlers can be either normal functions or coroutine functions, the
+    latter are awaited one by one so that the processing order of events
+    is kept. The put function is thread-safe and can be called by legacy
+    gateways running in other threads.
+
+    The engine can either run inside an existing loop (call start within
+    the loop, or await run) or create its own loop in a background thread.
+    Timer events, named timers and delayed calls are fired by the timer
+    service driven with call_at of the loop, so no timer thread is used.
+    Events put after the engine stopped are kept until it runs again.
+    """
+
+    def __init__(self, interval: float = 1) -> None:
+        """"""
+        super().__init__(interval)
+
+        self._loop: AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._task: Task | None = None
+        self._events: deque = deque()
+        self._wakeup: AsyncEvent | None = None
+        self._timer_handle: TimerHandle | None = None
+
+    async def run(self) -> None:
+        """
+        Process events and generate timer events until engine stopped.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        self._loop = loop
+        self._loop_thread = get_ident()
+        self._active = True
+
+        # Asyncio event is bound to the loop, so create a new one for each run
+        wakeup: AsyncEvent = AsyncEvent()
+        self._wakeup = wakeup
+
+        self._timer_service.set_listener(self._notify_timer)
+        self._process_timer()
+
+        try:
+            await self._run_async(wakeup)
+        finally:
+            self._loop_thread = None
+            self._timer_service.set_listener(None)
+
+            if self._timer_handle:
+                self._timer_handle.cancel()
+                self._timer_handle = None
+
+    async def _run_async(self, wakeup: AsyncEvent) -> None:
+        """
+        Get events from buffer and then process them.
+        """
+        while self._active:
+            if not self._events:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            events: deque = self._events
+            self._events = deque()
+
+            for event in events:
+                await self._process_async(event)
+
+    async def _process_async(self, event: Event) -> None:
+        """
+        Distribute event to handlers, and await the result of coroutine handlers.
+        """
+        handlers: tuple[HandlerType, ...] | None = self._dispatch_table.get(event.type, None)
+        if handlers:
+            for handler in handlers:
+                result: Any = handler(event)
+                if result is not None and isawaitable(result):
+                    await result
+
+        for handler in self._general_dispatch:
+            result = handler(event)
+            if result is not None and isawaitable(result):
+                await result
+
+    def _process_timer(self) -> None:
+        """
+        Fire due timer tasks and schedule call for the next deadline.
+        """
+        if self._timer_handle:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+        if not self._active or not self._loop:
+            return
+
+        deadline: float | None = self._timer_service.process()
+        if deadline is not None:
+            delay: float = max(deadline - monotonic(), 0)
+            self._timer_handle = self._loop.call_later(delay, self._process_timer)
+
+    def _notify_timer(self) -> None:
+        """
+        Reschedule timer processing after new timer task added.
+        """
+        if get_ident() == self._loop_thread:
+            self._process_timer()
+        else:
+            self._call_threadsafe(self._process_timer)
+
+    def _call_threadsafe(self, func: Any, *args: Any) -> bool:
+        """
+        Call function in the loop thread, return False if loop not running.
+        """
+        loop: AbstractEventLoop | None = self._loop
+        if not self._active or not loop or loop.is_closed():
+            return False
+
+        try:
+            loop.call_soon_threadsafe(func, *args)
+        except RuntimeError:
+            # Loop closed after the check above
+            return False
+        return True
+
+    def _run(self) -> None:
+        """
+        Run event loop in background thread.
+        """
+        if self._loop:
+            self._loop.run_until_complete(self.run())
+            self._loop.close()
+
+    def start(self) -> None:
+        """
+        Start event engine.
+
+        If called inside a running event loop, the engine runs as a task
+        of this loop. Otherwise a new loop is created in background thread.
+        """
+        self._active = True
+
+        try:
+            loop: AbstractEventLoop = get_running_loop()
+        except RuntimeError:
+            self._loop = new_event_loop()
+            self._thread = Thread(target=self._run)
+            self._thread.start()
+            self._loop_thread = self._thread.ident
+        else:
+            self._loop = loop
+            self._loop_thread = get_ident()
+            self._task = loop.create_task(self.run())
+
+    def stop(self) -> None:
+        """
+        Stop event engine, and wait for background thread if there is one.
+        """
+        if not self._loop:
+            return
+
+        if get_ident() == self._loop_thread:
+            self._stop_nowait()
+        else:
+            self._call_threadsafe(self._stop_nowait)
+
+            if self._thread.is_alive():
+                self._thread.join()
+
+    def _stop_nowait(self) -> None:
+        """"""
+        self._active = False
+
+        if self._wakeup:
+            self._wakeup.set()
+
+    def put(self, event: Event) -> None:
+        """
+        Put an event object into event engine, can be called from any thread.
+        """
+        if get_ident() == self._loop_thread:
+            self.put_nowait(event)
+        elif not self._call_threadsafe(self.put_nowait, event):
+            # Keep event in buffer like the base engine when loop not running
+            self._events.append(event)
+
+    def put_nowait(self, event: Event) -> None:
+        """
+        Put an event object from inside the event loop thread.
+        """
+        self._events.append(event)
+
+        if self._active and self._wakeup:
+            self._wakeup.set()
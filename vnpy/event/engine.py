@@ -2,13 +2,16 @@
 Event-driven framework of VeighNa framework.
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
-from queue import Empty, Queue
-from threading import Thread
-from time import sleep
+from datetime import time
+from itertools import count
+from threading import Condition, Lock, Thread
 from typing import Any
 
+from .profiler import EventProfiler, EVENT_PROFILE
+from .timer import TimerService
+
 
 EVENT_TIMER = "eTimer"
 
@@ -20,6 +23,9 @@ class Event:
     object which contains the real data.
     """
 
+    # Time when event is put into queue, only marked when profiling
+    put_time: int = 0
+
     def __init__(self, type: str, data: Any = None) -> None:
         """"""
         self.type: str = type
@@ -30,38 +36,96 @@ class Event:
 HandlerType = Callable[[Event], None]
 
 
+class EventQueue:
+    """
+    Unbounded FIFO queue consumed by a single thread, which takes out all
+    items waiting in one go instead of paying the lock and condition cost
+    of Queue.get for every single item.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self._items: deque = deque()
+        self._condition: Condition = Condition()
+
+    def __len__(self) -> int:
+        """"""
+        return len(self._items)
+
+    def put(self, item: Any) -> None:
+        """
+        Put an item into queue, can be called from any thread.
+        """
+        with self._condition:
+            self._items.append(item)
+            self._condition.notify()
+
+    def get_all(self, timeout: float) -> deque:
+        """
+        Take out all items waiting, block at most timeout seconds if the
+        queue is empty.
+        """
+        with self._condition:
+            if not self._items:
+                self._condition.wait(timeout)
+
+            items: deque = self._items
+            self._items = deque()
+
+        return items
+
+
 class EventEngine:
     """
     Event engine distributes event object based on its type
     to those handlers registered.
 
     It also generates timer event by every interval seconds,
-    which can be used for timing purpose.
+    which can be used for timing purpose. Additional named timers,
+    scheduled timers and delayed callbacks are provided by the timer
+    service, and only generate events when handlers registered.
     """
 
-    def __init__(self, interval: int = 1) -> None:
+    def __init__(self, interval: float = 1) -> None:
         """
         Timer event is generated every 1 second by default, if
         interval not specified.
         """
-        self._interval: int = interval
-        self._queue: Queue = Queue()
+        self._interval: float = interval
+        self._queue: EventQueue = EventQueue()
         self._active: bool = False
         self._thread: Thread = Thread(target=self._run)
         self._timer: Thread = Thread(target=self._run_timer)
         self._handlers: defaultdict = defaultdict(list)
         self._general_handlers: list = []
 
+        # Immutable handler tuples used for dispatching, which are only
+        # rebuilt when handlers are registered or unregistered.
+        self._dispatch_table: dict[str, tuple[HandlerType, ...]] = {}
+        self._general_dispatch: tuple[HandlerType, ...] = ()
+
+        # Registry of subscribed keys of types with specific prefix, which
+        # is created when first queried and updated with handlers.
+        self._subscriptions: dict[str, frozenset[str]] = {}
+        self._subscription_lock: Lock = Lock()
+
+        # Optional profiler, only enabled when required
+        self._profiler: EventProfiler | None = None
+        self._profile_interval: int = 0
+        self._profile_count: int = 0
+
+        # Timer service for timer event and other timer tasks
+        self._timer_service: TimerService = TimerService(self._put_timer)
+        self._timer_service.add_interval(EVENT_TIMER, interval)
+        self._once_count: count = count(1)
+
     def _run(self) -> None:
         """
-        Get event from queue and then process it.
+        Get all events waiting in queue and then process them.
         """
         while self._active:
-            try:
-                event: Event = self._queue.get(block=True, timeout=1)
+            for event in self._queue.get_all(1):
                 self._process(event)
-            except Empty:
-                pass
 
     def _process(self, event: Event) -> None:
         """
@@ -71,20 +135,140 @@ class EventEngine:
         Then distribute event to those general handlers which listens
         to all types.
         """
-        if event.type in self._handlers:
-            [handler(event) for handler in self._handlers[event.type]]
+        if self._profiler:
+            self._process_profiled(event, self._profiler)
+            return
+
+        handlers: tuple[HandlerType, ...] | None = self._dispatch_table.get(event.type, None)
+        if handlers:
+            for handler in handlers:
+                handler(event)
 
-        if self._general_handlers:
-            [handler(event) for handler in self._general_handlers]
+        for handler in self._general_dispatch:
+            handler(event)
+
+    def _process_profiled(self, event: Event, profiler: EventProfiler) -> None:
+        """
+        Process event with time recorded.
+        """
+        handlers: tuple[HandlerType, ...] = self._dispatch_table.get(event.type, ())
+        profiler.process(event, handlers, self._general_dispatch)
+
+        self._publish_profile(event, profiler)
+
+    def _publish_profile(self, event: Event, profiler: EventProfiler) -> None:
+        """
+        Publish profiling result every publish interval timer events.
+        """
+        if event.type == EVENT_TIMER and self._profile_interval:
+            self._profile_count += 1
+
+            if self._profile_count >= self._profile_interval:
+                self._profile_count = 0
+                self.put(Event(EVENT_PROFILE, profiler.get_report()))
+
+    def _update_dispatch(self, type: str) -> None:
+        """
+        Rebuild handler tuple of a specific event type.
+        """
+        handler_list: list | None = self._handlers.get(type, None)
+
+        if handler_list:
+            self._dispatch_table[type] = tuple(handler_list)
+        else:
+            self._dispatch_table.pop(type, None)
+
+        with self._subscription_lock:
+            for prefix, keys in self._subscriptions.items():
+                if not type.startswith(prefix):
+                    continue
+
+                key: str = type[len(prefix):]
+                if handler_list:
+                    self._subscriptions[prefix] = keys | {key}
+                else:
+                    self._subscriptions[prefix] = keys - {key}
+
+    def _update_general_dispatch(self) -> None:
+        """
+        Rebuild general handler tuple.
+        """
+        self._general_dispatch = tuple(self._general_handlers)
 
     def _run_timer(self) -> None:
         """
-        Sleep by interval second(s) and then generate a timer event.
+        Run timer service to generate timer events.
         """
-        while self._active:
-            sleep(self._interval)
-            event: Event = Event(EVENT_TIMER)
-            self.put(event)
+        self._timer_service.run()
+
+    def _put_timer(self, type: str) -> None:
+        """
+        Put timer event, named timer events are skipped if no handler
+        registered for the type.
+        """
+        if type == EVENT_TIMER or type in self._dispatch_table:
+            self.put(Event(type))
+
+    def add_timer(self, name: str, interval: float) -> str:
+        """
+        Add a named timer which generates event every interval seconds,
+        sub-second interval is supported.
+
+        Return event type of the timer, which is EVENT_TIMER.name
+        """
+        type: str = f"{EVENT_TIMER}.{name}"
+        self._timer_service.add_interval(type, interval)
+        return type
+
+    def add_schedule(
+        self,
+        name: str,
+        times: list[time],
+        weekdays: set[int] | None = None
+    ) -> str:
+        """
+        Add a named timer which generates event at given times of day,
+        for example at session open and close. Weekdays are integers
+        used by datetime.weekday (Monday is 0), None for every day.
+
+        Return event type of the timer, which is EVENT_TIMER.name
+        """
+        type: str = f"{EVENT_TIMER}.{name}"
+        self._timer_service.add_schedule(type, times, weekdays)
+        return type
+
+    def remove_timer(self, name: str) -> None:
+        """
+        Remove a named timer.
+        """
+        self._timer_service.remove(f"{EVENT_TIMER}.{name}")
+
+    def call_later(self, delay: float, handler: HandlerType) -> str:
+        """
+        Call handler once in event processing thread after delay seconds.
+
+        Return event type of the delayed call, which can be used to
+        cancel it with cancel_call.
+        """
+        type: str = f"{EVENT_TIMER}.once.{next(self._once_count)}"
+
+        # Result is returned so that coroutine handler can be awaited
+        def process_once(event: Event) -> Any:
+            self.unregister(type, process_once)
+            return handler(event)
+
+        self.register(type, process_once)
+        self._timer_service.add_once(type, delay)
+        return type
+
+    def cancel_call(self, type: str) -> None:
+        """
+        Cancel a delayed call which is not fired yet.
+        """
+        self._timer_service.remove(type)
+
+        for handler in list(self._handlers.get(type, [])):
+            self.unregister(type, handler)
 
     def start(self) -> None:
         """
@@ -92,6 +276,8 @@ class EventEngine:
         """
         self._active = True
         self._thread.start()
+
+        self._timer_service.start()
         self._timer.start()
 
     def stop(self) -> None:
@@ -99,6 +285,8 @@ class EventEngine:
         Stop event engine.
         """
         self._active = False
+
+        self._timer_service.stop()
         self._timer.join()
         self._thread.join()
 
@@ -106,6 +294,9 @@ class EventEngine:
         """
         Put an event object into event queue.
         """
+        if self._profiler:
+            self._profiler.mark(event)
+
         self._queue.put(event)
 
     def register(self, type: str, handler: HandlerType) -> None:
@@ -117,6 +308,8 @@ class EventEngine:
         if handler not in handler_list:
             handler_list.append(handler)
 
+        self._update_dispatch(type)
+
     def unregister(self, type: str, handler: HandlerType) -> None:
         """
         Unregister an existing handler function from event engine.
@@ -129,6 +322,27 @@ class EventEngine:
         if not handler_list:
             self._handlers.pop(type)
 
+        self._update_dispatch(type)
+
+    def is_subscribed(self, prefix: str, key: str) -> bool:
+        """
+        Check if event of type prefix + key will be processed by any
+        handler, including general handlers, without creating the type
+        string, e.g. is_subscribed(EVENT_TICK, vt_symbol).
+        """
+        if self._general_dispatch:
+            return True
+
+        keys: frozenset[str] | None = self._subscriptions.get(prefix, None)
+        if keys is None:
+            with self._subscription_lock:
+                keys = frozenset(
+                    type[len(prefix):] for type in list(self._dispatch_table) if type.startswith(prefix)
+                )
+                self._subscriptions[prefix] = keys
+
+        return key in keys
+
     def register_general(self, handler: HandlerType) -> None:
         """
         Register a new handler function for all event types. Every
@@ -137,9 +351,48 @@ class EventEngine:
         if handler not in self._general_handlers:
             self._general_handlers.append(handler)
 
+        self._update_general_dispatch()
+
     def unregister_general(self, handler: HandlerType) -> None:
         """
         Unregister an existing general handler function.
         """
         if handler in self._general_handlers:
             self._general_handlers.remove(handler)
+
+        self._update_general_dispatch()
+
+    def enable_profiling(self, budget: float = 0.01, publish_interval: int = 0) -> None:
+        """
+        Start recording queue wait time of each event type and execution
+        time of each handler. Handlers running longer than budget seconds
+        are flagged as slow.
+
+        If publish_interval is given, profiling result is published as
+        EVENT_PROFILE event every publish_interval timer events.
+        """
+        self._profile_interval = publish_interval
+        self._profile_count = 0
+        self._profiler = EventProfiler(budget)
+
+    def disable_profiling(self) -> None:
+        """
+        Stop profiling.
+        """
+        self._profiler = None
+
+    def get_profile(self) -> dict:
+        """
+        Get profiling result, empty if profiling not enabled.
+        """
+        if not self._profiler:
+            return {}
+        return self._profiler.get_report()
+
+    def get_slow_handlers(self) -> dict[str, int]:
+        """
+        Get handlers exceeded time budget, empty if profiling not enabled.
+        """
+        if not self._profiler:
+            return {}
+        return self._profiler.get_slow_handlers()
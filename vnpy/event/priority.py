@@ -0,0 +1,239 @@
+"""
+Priority event engine which processes events from several priority lanes.
+"""
+
+from collections import deque, OrderedDict
+from dataclasses import dataclass
+from threading import Condition
+
+from .engine import Event, EventEngine
+
+
+# Max number of event types in lane cache, per-symbol and per-order
+# event types are unbounded so the cache is cleared when full
+LANE_CACHE_SIZE: int = 10_000
+
+
+@dataclass
+class LaneStats:
+    """
+    Statistics of an event lane.
+    """
+
+    name: str
+    depth: int = 0
+    max_depth: int = 0
+    put_count: int = 0
+    drop_count: int = 0
+
+
+class EventLane:
+    """
+    Event lane holds events whose type starts with any of its prefixes.
+
+    A lane with maxlen drops its oldest events when full. A coalescing
+    lane keeps only the latest event of each (type, vt_symbol), which is
+    useful for market data where only the latest tick matters.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        prefixes: tuple[str, ...] = (),
+        maxlen: int = 0,
+        coalesce: bool = False
+    ) -> None:
+        """
+        Lane without prefixes accepts all events not matched by other lanes.
+        """
+        self.name: str = name
+        self.prefixes: tuple[str, ...] = prefixes
+        self.maxlen: int = maxlen
+        self.coalesce: bool = coalesce
+
+        self.events: deque = deque()
+        self.latest: OrderedDict = OrderedDict()
+
+        self.stats: LaneStats = LaneStats(name)
+
+    def __len__(self) -> int:
+        """"""
+        if self.coalesce:
+            return len(self.latest)
+        else:
+            return len(self.events)
+
+    def match(self, type: str) -> bool:
+        """
+        Check if event type belongs to this lane.
+        """
+        if not self.prefixes:
+            return True
+        return type.startswith(self.prefixes)
+
+    def put(self, event: Event) -> None:
+        """
+        Put event into lane, dropping or coalescing events if necessary.
+        """
+        self.stats.put_count += 1
+
+        if self.coalesce:
+            vt_symbol: str | None = getattr(event.data, "vt_symbol", None)
+            key: tuple = (event.type, vt_symbol if vt_symbol else id(event))
+
+            if key in self.latest:
+                self.stats.drop_count += 1
+            elif self.maxlen and len(self.latest) >= self.maxlen:
+                self.latest.popitem(last=False)
+                self.stats.drop_count += 1
+
+            self.latest[key] = event
+        else:
+            if self.maxlen and len(self.events) >= self.maxlen:
+                self.events.popleft()
+                self.stats.drop_count += 1
+
+            self.events.append(event)
+
+        depth: int = len(self)
+        self.stats.depth = depth
+        self.stats.max_depth = max(self.stats.max_depth, depth)
+
+    def pop(self, count: int) -> list[Event]:
+        """
+        Take out at most count events from lane.
+        """
+        events: list[Event] = []
+
+        if self.coalesce:
+            latest: OrderedDict = self.latest
+            for _ in range(min(count, len(latest))):
+                events.append(latest.popitem(last=False)[1])
+        else:
+            queue: deque = self.events
+            for _ in range(min(count, len(queue))):
+                events.append(queue.popleft())
+
+        self.stats.depth = len(self)
+        return events
+
+
+def get_default_lanes(tick_maxlen: int = 0, tick_coalesce: bool = False) -> list[EventLane]:
+    """
+    Create default lanes for the trading platform:
+    trade/order/quote > position/account/contract > tick > others.
+
+    Prefixes are the event type strings defined in vnpy.trader.event.
+    """
+    return [
+        EventLane("trade", ("eTrade.", "eOrder.", "eQuote.")),
+        EventLane("position", ("ePosition.", "eAccount.", "eContract.")),
+        EventLane("tick", ("eTick.",), tick_maxlen, tick_coalesce),
+        EventLane("other"),
+    ]
+
+
+class PriorityEventEngine(EventEngine):
+    """
+    Event engine with priority lanes.
+
+    Events are put into the first lane matching their type, and the
+    processing thread always takes events from the highest priority
+    non-empty lane, so that fills and order updates are not delayed by
+    a flood of ticks or logs.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1,
+        lanes: list[EventLane] | None = None,
+        batch_size: int = 100
+    ) -> None:
+        """
+        Lanes are ordered from highest to lowest priority. Events matching
+        no lane are put into the last one.
+        """
+        super().__init__(interval)
+
+        if not lanes:
+            lanes = get_default_lanes()
+
+        self._lanes: list[EventLane] = lanes
+        self._batch_size: int = batch_size
+        self._lane_map: dict[str, EventLane] = {}
+        self._condition: Condition = Condition()
+
+    def _run(self) -> None:
+        """
+        Get events from the highest priority lane and then process them.
+        """
+        while self._active:
+            with self._condition:
+                events: list[Event] = self._pop_events()
+
+                if not events:
+                    self._condition.wait(1)
+                    events = self._pop_events()
+
+            for event in events:
+                self._process(event)
+
+    def _pop_events(self) -> list[Event]:
+        """
+        Take out a batch of events from the highest priority non-empty lane.
+        """
+        for lane in self._lanes:
+            if len(lane):
+                return lane.pop(self._batch_size)
+        return []
+
+    def _get_lane(self, type: str) -> EventLane:
+        """
+        Get lane of event type, the result is cached.
+        """
+        lane: EventLane | None = self._lane_map.get(type, None)
+
+        # Lane defines __len__, so empty lane is falsy
+        if lane is None:
+            lane = self._lanes[-1]
+
+            for n in self._lanes:
+                if n.match(type):
+                    lane = n
+                    break
+
+            if len(self._lane_map) >= LANE_CACHE_SIZE:
+                self._lane_map.clear()
+            self._lane_map[type] = lane
+
+        return lane
+
+    def put(self, event: Event) -> None:
+        """
+        Put an event object into its lane.
+        """
+        if self._profiler:
+            self._profiler.mark(event)
+
+        lane: EventLane = self._get_lane(event.type)
+
+        with self._condition:
+            lane.put(event)
+            self._condition.notify()
+
+    def get_lane_stats(self) -> list[LaneStats]:
+        """
+        Get statistics of all lanes, from highest to lowest priority.
+        """
+        with self._condition:
+            return [
+                LaneStats(
+                    lane.stats.name,
+                    len(lane),
+                    lane.stats.max_depth,
+                    lane.stats.put_count,
+                    lane.stats.drop_count
+                )
+                for lane in self._lanes
+            ]
+
@@ -0,0 +1,247 @@
+"""
+Profiler for measuring event queue lag and handler execution time.
+"""
+
+from collections import Counter, defaultdict
+from threading import Lock
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import Event, HandlerType
+
+
+EVENT_PROFILE = "eProfile"
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram for recording latency in nanoseconds.
+
+    Similar to HDR histogram, every power of two range is divided into
+    a fixed number of sub buckets, so that recording is O(1) and the
+    relative error of percentiles is bounded by 1 / sub bucket count.
+    """
+
+    def __init__(self, sub_bits: int = 4) -> None:
+        """"""
+        self.sub_bits: int = sub_bits
+        self.sub_count: int = 1 << sub_bits
+
+        self.buckets: defaultdict[int, int] = defaultdict(int)
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = 0
+        self.max: int = 0
+
+    def record(self, value: int) -> None:
+        """
+        Record one value.
+        """
+        value = max(value, 0)
+
+        shift: int = max(value.bit_length() - self.sub_bits, 0)
+        index: int = (shift << self.sub_bits) + (value >> shift)
+        self.buckets[index] += 1
+
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self.count += 1
+        self.total += value
+
+    def get_bucket_value(self, index: int) -> int:
+        """
+        Get upper bound value of a bucket.
+        """
+        shift: int = index >> self.sub_bits
+        sub: int = index - (shift << self.sub_bits)
+        return ((sub + 1) << shift) - 1
+
+    def percentile(self, q: float) -> int:
+        """
+        Get value at percentile q (0-100).
+        """
+        if not self.count:
+            return 0
+
+        target: float = self.count * q / 100
+        accumulated: int = 0
+
+        for index in sorted(self.buckets):
+            accumulated += self.buckets[index]
+            if accumulated >= target:
+                return min(self.get_bucket_value(index), self.max)
+
+        return self.max
+
+    def mean(self) -> float:
+        """
+        Get mean of recorded values.
+        """
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+    def reset(self) -> None:
+        """
+        Clear all recorded values.
+        """
+        self.buckets.clear()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def to_dict(self) -> dict:
+        """
+        Get summary of histogram in microseconds.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean() / 1000,
+            "min": self.min / 1000,
+            "p50": self.percentile(50) / 1000,
+            "p90": self.percentile(90) / 1000,
+            "p99": self.percentile(99) / 1000,
+            "p999": self.percentile(99.9) / 1000,
+            "max": self.max / 1000,
+        }
+
+
+def get_handler_name(handler: "HandlerType") -> str:
+    """
+    Get readable name of handler function, bound method is prefixed
+    with class name of its owner object.
+    """
+    name: str = getattr(handler, "__qualname__", "")
+    if not name:
+        return repr(handler)
+
+    owner: object = getattr(handler, "__self__", None)
+    if owner is not None:
+        name = f"{type(owner).__name__}.{handler.__name__}"
+
+    return name
+
+
+def get_handler_names(handlers: list["HandlerType"]) -> dict["HandlerType", str]:
+    """
+    Get unique names of handlers. Handlers with the same name, e.g.
+    lambdas or methods of different objects of one class, are
+    distinguished by their ids.
+    """
+    names: dict[HandlerType, str] = {handler: get_handler_name(handler) for handler in handlers}
+    counts: Counter = Counter(names.values())
+
+    for handler, name in names.items():
+        if counts[name] > 1:
+            names[handler] = f"{name}#{id(handler):x}"
+
+    return names
+
+
+class EventProfiler:
+    """
+    Records queue wait time per event type and execution time per
+    handler, and flags handlers which exceed the time budget.
+    """
+
+    def __init__(self, budget: float = 0.01) -> None:
+        """
+        Budget is the maximum expected execution time of a handler in seconds.
+        """
+        self.budget: int = int(budget * 1_000_000_000)
+
+        self.wait_histograms: defaultdict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.handler_histograms: defaultdict[HandlerType, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.slow_counts: defaultdict[HandlerType, int] = defaultdict(int)
+
+        self.start_time: int = perf_counter_ns()
+
+        # Events may be processed by several worker threads
+        self.lock: Lock = Lock()
+
+    def mark(self, event: "Event") -> None:
+        """
+        Mark the time when event is put into queue.
+        """
+        event.put_time = perf_counter_ns()
+
+    def process(
+        self,
+        event: "Event",
+        handlers: tuple["HandlerType", ...],
+        general_handlers: tuple["HandlerType", ...]
+    ) -> None:
+        """
+        Distribute event to handlers and record time spent.
+        """
+        start: int = perf_counter_ns()
+
+        if event.put_time:
+            with self.lock:
+                self.wait_histograms[event.type].record(start - event.put_time)
+
+        for handler in handlers + general_handlers:
+            handler(event)
+
+            end: int = perf_counter_ns()
+            cost: int = end - start
+            start = end
+
+            with self.lock:
+                self.handler_histograms[handler].record(cost)
+
+                if cost > self.budget:
+                    self.slow_counts[handler] += 1
+
+    def get_report(self) -> dict:
+        """
+        Get profiling result with only builtin types, so that it can be
+        published to UI or over RPC.
+        """
+        elapsed: float = (perf_counter_ns() - self.start_time) / 1_000_000_000
+
+        with self.lock:
+            events: dict[str, dict] = {}
+            for type, histogram in self.wait_histograms.items():
+                data: dict = histogram.to_dict()
+                data["rate"] = histogram.count / elapsed if elapsed else 0
+                events[type] = data
+
+            names: dict[HandlerType, str] = get_handler_names(list(self.handler_histograms))
+
+            handlers: dict[str, dict] = {}
+            for handler, histogram in self.handler_histograms.items():
+                data = histogram.to_dict()
+                data["slow_count"] = self.slow_counts.get(handler, 0)
+                handlers[names[handler]] = data
+
+        return {
+            "elapsed": elapsed,
+            "budget": self.budget / 1000,
+            "events": events,
+            "handlers": handlers,
+        }
+
+    def get_slow_handlers(self) -> dict[str, int]:
+        """
+        Get handlers which exceeded the budget and their exceeded counts.
+        """
+        with self.lock:
+            names: dict[HandlerType, str] = get_handler_names(list(self.slow_counts))
+            return {names[handler]: count for handler, count in self.slow_counts.items()}
+
+    def reset(self) -> None:
+        """
+        Clear all recorded data.
+        """
+        with self.lock:
+            self.wait_histograms.clear()
+            self.handler_histograms.clear()
+            self.slow_counts.clear()
+
+        self.start_time = perf_counter_ns()
@@ -0,0 +1,177 @@
+"""
+Sharded event engine which processes events in multiple worker threads.
+"""
+
+from collections.abc import Callable
+from threading import Thread
+
+from .engine import Event, EventEngine, EventQueue, HandlerType
+from .profiler import EventProfiler
+
+
+# Routing of one event type: tuples of (shard key, handlers using the key)
+RouteType = tuple[tuple[str, tuple[HandlerType, ...]], ...]
+
+
+def shard_key(key: str) -> Callable[[HandlerType], HandlerType]:
+    """
+    Decorator for declaring which attribute of event data is used for
+    routing events to the handler in ShardedEventEngine.
+
+    Use empty string to have all events processed by the first worker.
+    """
+    def decorator(handler: HandlerType) -> HandlerType:
+        handler.shard_key = key                 # type: ignore
+        return handler
+
+    return decorator
+
+
+class ShardedEventEngine(EventEngine):
+    """
+    Event engine distributes events to several worker threads.
+
+    Each event is routed by the value of a shard key attribute of its
+    data object, so that events with the same key are always processed
+    in order by the same worker, while events of unrelated keys are
+    processed in parallel.
+
+    Only handlers declaring their shard key with the shard_key decorator
+    are processed in parallel. Other handlers (e.g. OmsEngine ones which
+    share state among all contracts) use the default key, which is empty
+    so that they are processed serially by the first worker, as in the
+    base engine. Events whose data has no shard key attribute are also
+    processed by the first worker.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1,
+        worker_count: int = 4,
+        default_key: str = ""
+    ) -> None:
+        """"""
+        if worker_count < 1:
+            raise ValueError(f"Worker count must be positive: {worker_count}")
+
+        super().__init__(interval)
+
+        self._worker_count: int = worker_count
+        self._default_key: str = default_key
+
+        # Queue and thread of base engine are used by the first worker
+        self._queues: list[EventQueue] = [self._queue] + [EventQueue() for _ in range(worker_count - 1)]
+        self._workers: list[Thread] = [self._thread] + [
+            Thread(target=self._run_worker, args=(queue,)) for queue in self._queues[1:]
+        ]
+
+        self._routes: dict[str, RouteType] = {}
+        self._general_routes: RouteType = ()
+
+    def _run(self) -> None:
+        """
+        Run the first worker in thread of base engine.
+        """
+        self._run_worker(self._queue)
+
+    def _run_worker(self, queue: EventQueue) -> None:
+        """
+        Get events and their handlers from worker queue and then process them.
+        """
+        while self._active:
+            for event, handlers in queue.get_all(1):
+                self._process_route(event, handlers)
+
+    def _process_route(self, event: Event, handlers: tuple[HandlerType, ...]) -> None:
+        """
+        Distribute event to handlers of one shard key.
+        """
+        if self._profiler:
+            self._profiler.process(event, handlers, ())
+            return
+
+        for handler in handlers:
+            handler(event)
+
+    def _get_key(self, handler: HandlerType) -> str:
+        """
+        Get shard key declared by handler.
+        """
+        return getattr(handler, "shard_key", self._default_key)
+
+    def _create_routes(self, handlers: tuple[HandlerType, ...]) -> RouteType:
+        """
+        Group handlers by their shard keys.
+        """
+        groups: dict[str, list[HandlerType]] = {}
+
+        for handler in handlers:
+            key: str = self._get_key(handler)
+            groups.setdefault(key, []).append(handler)
+
+        return tuple((key, tuple(group)) for key, group in groups.items())
+
+    def _update_dispatch(self, type: str) -> None:
+        """"""
+        super()._update_dispatch(type)
+
+        handlers: tuple[HandlerType, ...] | None = self._dispatch_table.get(type, None)
+        if handlers:
+            self._routes[type] = self._create_routes(handlers + self._general_dispatch)
+        else:
+            self._routes.pop(type, None)
+
+    def _update_general_dispatch(self) -> None:
+        """"""
+        super()._update_general_dispatch()
+
+        self._general_routes = self._create_routes(self._general_dispatch)
+
+        for type, handlers in self._dispatch_table.items():
+            self._routes[type] = self._create_routes(handlers + self._general_dispatch)
+
+    def start(self) -> None:
+        """
+        Start worker threads and timer.
+        """
+        self._active = True
+
+        for worker in self._workers:
+            worker.start()
+
+        self._timer_service.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        """
+        Stop worker threads and timer.
+        """
+        self._active = False
+
+        self._timer_service.stop()
+        self._timer.join()
+
+        for worker in self._workers:
+            worker.join()
+
+    def put(self, event: Event) -> None:
+        """
+        Route event to worker queues according to shard keys of its handlers.
+        """
+        profiler: EventProfiler | None = self._profiler
+        if profiler:
+            profiler.mark(event)
+            self._publish_profile(event, profiler)
+
+        routes: RouteType = self._routes.get(event.type, self._general_routes)
+        data: object = event.data
+
+        for key, handlers in routes:
+            value: object = getattr(data, key, None) if key else None
+
+            if value is None:
+                index: int = 0
+            else:
+                index = hash(value) % self._worker_count
+
+            self._queues[index].put((event, handlers))
@@ -0,0 +1,222 @@
+"""
+Timer service generating timer events on monotonic deadlines.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
+from heapq import heappush, heappop
+from math import floor
+from threading import Condition
+from time import monotonic
+
+
+class TimerTask:
+    """
+    Timer task of a specific event type.
+
+    * interval task: repeated every interval seconds
+    * schedule task: fired at given times of day on given weekdays
+    * once task: fired only once after delay seconds
+    """
+
+    def __init__(
+        self,
+        type: str,
+        interval: float = 0,
+        times: list[time] | None = None,
+        weekdays: set[int] | None = None,
+        once: bool = False
+    ) -> None:
+        """"""
+        self.type: str = type
+        self.interval: float = interval
+        self.times: list[time] = sorted(times) if times else []
+        self.weekdays: set[int] | None = weekdays
+        self.once: bool = once
+
+        self.scheduled: datetime | None = None
+        self.cancelled: bool = False
+
+    def get_next_schedule(self, after: datetime) -> datetime:
+        """
+        Get next scheduled datetime strictly after the given one.
+        """
+        for days in range(8):
+            date: datetime = after + timedelta(days=days)
+
+            if self.weekdays is not None and date.weekday() not in self.weekdays:
+                continue
+
+            for t in self.times:
+                dt: datetime = datetime.combine(date.date(), t)
+                if dt > after:
+                    return dt
+
+        raise ValueError(f"No schedule time available: {self.times}, {self.weekdays}")
+
+
+class TimerService:
+    """
+    Timer service keeps all timer tasks in a heap ordered by their
+    monotonic deadlines, and calls callback with event type of the task
+    when deadline reached.
+
+    Interval tasks are rescheduled based on their previous deadline
+    instead of the time they were fired, so there is no cumulative drift.
+
+    The service is either run in a timer thread with run, or driven by
+    an event loop calling process at the returned deadlines, with the
+    listener notified when new task added.
+    """
+
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        """"""
+        self._callback: Callable[[str], None] = callback
+        self._listener: Callable[[], None] | None = None
+
+        self._active: bool = False
+        self._condition: Condition = Condition()
+        self._heap: list[tuple[float, int, TimerTask]] = []
+        self._tasks: dict[str, TimerTask] = {}
+        self._count: int = 0
+
+    def _push(self, deadline: float, task: TimerTask) -> None:
+        """
+        Push task into heap, the count is used to keep insertion order.
+        """
+        self._count += 1
+        heappush(self._heap, (deadline, self._count, task))
+        self._condition.notify()
+
+    def _add_task(self, task: TimerTask, deadline: float) -> None:
+        """"""
+        with self._condition:
+            old_task: TimerTask | None = self._tasks.get(task.type, None)
+            if old_task:
+                old_task.cancelled = True
+
+            self._tasks[task.type] = task
+            self._push(deadline, task)
+
+        if self._listener:
+            self._listener()
+
+    def add_interval(self, type: str, interval: float) -> None:
+        """
+        Add task fired every interval seconds.
+        """
+        if interval <= 0:
+            raise ValueError(f"Timer interval must be positive: {interval}")
+
+        task: TimerTask = TimerTask(type, interval=interval)
+        self._add_task(task, monotonic() + interval)
+
+    def add_schedule(
+        self,
+        type: str,
+        times: list[time],
+        weekdays: set[int] | None = None
+    ) -> None:
+        """
+        Add task fired at given times of day. Weekdays are integers
+        used by datetime.weekday (Monday is 0), None for every day.
+        """
+        task: TimerTask = TimerTask(type, times=times, weekdays=weekdays)
+        self._add_task(task, self._get_schedule_deadline(task, datetime.now()))
+
+    def add_once(self, type: str, delay: float) -> None:
+        """
+        Add task fired only once after delay seconds.
+        """
+        task: TimerTask = TimerTask(type, once=True)
+        self._add_task(task, monotonic() + delay)
+
+    def remove(self, type: str) -> None:
+        """
+        Remove task of event type.
+        """
+        with self._condition:
+            task: TimerTask | None = self._tasks.pop(type, None)
+            if task:
+                task.cancelled = True
+
+    def _get_schedule_deadline(self, task: TimerTask, after: datetime) -> float:
+        """
+        Convert next scheduled wall clock time into monotonic deadline.
+        """
+        task.scheduled = task.get_next_schedule(after)
+        return monotonic() + (task.scheduled - datetime.now()).total_seconds()
+
+    def _reschedule(self, task: TimerTask, deadline: float, now: float) -> None:
+        """
+        Calculate next deadline of task after fired.
+        """
+        if task.once:
+            self._tasks.pop(task.type, None)
+        elif task.interval:
+            missed: int = floor((now - deadline) / task.interval)
+            self._push(deadline + (missed + 1) * task.interval, task)
+        elif task.scheduled:
+            self._push(self._get_schedule_deadline(task, task.scheduled), task)
+
+    def set_listener(self, listener: Callable[[], None] | None) -> None:
+        """
+        Set function called when new task added, e.g. for waking up the
+        event loop driving the service.
+        """
+        self._listener = listener
+
+    def _fire(self) -> float | None:
+        """
+        Fire tasks reached deadlines, return next deadline if any.
+        """
+        now: float = monotonic()
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, task = heappop(self._heap)
+            if task.cancelled:
+                continue
+
+            self._callback(task.type)
+            self._reschedule(task, deadline, now)
+
+        if self._heap:
+            return self._heap[0][0]
+        return None
+
+    def process(self) -> float | None:
+        """
+        Fire tasks reached deadlines and return next monotonic deadline,
+        used when the service is driven by an event loop.
+        """
+        with self._condition:
+            return self._fire()
+
+    def run(self) -> None:
+        """
+        Wait until deadlines and fire tasks, until stopped.
+        """
+        with self._condition:
+            while self._active:
+                deadline: float | None = self._fire()
+
+                if deadline is None:
+                    self._condition.wait()
+                else:
+                    timeout: float = deadline - monotonic()
+                    if timeout > 0:
+                        self._condition.wait(timeout)
+
+    def start(self) -> None:
+        """
+        Mark service active, run should be called in timer thread afterwards.
+        """
+        self._active = True
+
+    def stop(self) -> None:
+        """
+        Stop the service and wake up timer thread.
+        """
+        with self._condition:
+            self._active = False
+            self._condition.notify_all()
@@ -0,0 +1,76 @@
+"""
+Append-only archive of data objects on disk.
+"""
+
+import pickle
+from pathlib import Path
+from tempfile import TemporaryFile
+from threading import Lock
+from typing import Any, BinaryIO
+
+from .utility import get_folder_path
+
+
+class DataArchive:
+    """
+    Append-only log of pickled data objects on disk. Only the file
+    offset of each record is kept in memory for random access by id.
+
+    Archive only extends memory of one run. File is created as temporary
+    file when the first record is put, which is deleted when closed or
+    when the process exits, so no file is left on disk after restart.
+    """
+
+    def __init__(self, name: str) -> None:
+        """"""
+        self.name: str = name
+        self.file: BinaryIO | None = None
+
+        self.offsets: dict[str, int] = {}
+        self.flushed: bool = True
+        self.lock: Lock = Lock()
+
+    def put(self, vt_id: str, data: Any) -> None:
+        """
+        Append data into archive. If the same id is put again, the latest
+        record is returned by get.
+        """
+        with self.lock:
+            if not self.file:
+                self.file = self.open_file()
+
+            self.file.seek(0, 2)
+            self.offsets[vt_id] = self.file.tell()
+
+            pickle.dump(data, self.file, pickle.HIGHEST_PROTOCOL)
+            self.flushed = False
+
+    def get(self, vt_id: str) -> Any:
+        """
+        Load data from archive, return None if not found.
+        """
+        offset: int | None = self.offsets.get(vt_id, None)
+        if offset is None or not self.file:
+            return None
+
+        with self.lock:
+            if not self.flushed:
+                self.file.flush()
+                self.flushed = True
+
+            self.file.seek(offset)
+            return pickle.load(self.file)
+
+    def open_file(self) -> BinaryIO:
+        """"""
+        folder_path: Path = get_folder_path("archive")
+        return TemporaryFile("w+b", prefix=f"{self.name}_", suffix=".pkl", dir=folder_path)
+
+    def close(self) -> None:
+        """"""
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+            self.offsets.clear()
@@ -8,22 +8,51 @@ from .object import (
     PositionData,
     OrderRequest
 )
-from .constant import Direction, Offset, Exchange
+from .constant import Direction, Offset, Exchange, Status
 
 if TYPE_CHECKING:
     from .engine import OmsEngine
 
 
+# Exchanges which close yesterday position with close offset
+CLOSE_YD_EXCHANGES: set[Exchange] = {Exchange.SHFE, Exchange.INE}
+
+# Keys of frozen volume sums, enum values are used for faster hashing
+LONG_CLOSETODAY: tuple = (Direction.LONG.value, Offset.CLOSETODAY.value)
+LONG_CLOSEYESTERDAY: tuple = (Direction.LONG.value, Offset.CLOSEYESTERDAY.value)
+LONG_CLOSE: tuple = (Direction.LONG.value, Offset.CLOSE.value)
+SHORT_CLOSETODAY: tuple = (Direction.SHORT.value, Offset.CLOSETODAY.value)
+SHORT_CLOSEYESTERDAY: tuple = (Direction.SHORT.value, Offset.CLOSEYESTERDAY.value)
+SHORT_CLOSE: tuple = (Direction.SHORT.value, Offset.CLOSE.value)
+
+
 class PositionHolding:
-    """"""
+    """
+    Frozen volumes are maintained incrementally: remaining volume of each
+    active close order is recorded, and only the change is applied to the
+    sum of its direction and offset when order is updated.
+
+    In debug mode, the result is checked against full recalculation from
+    all active orders after every order update.
+
+    Volumes available to close are updated together with frozen volumes,
+    so that no calculation is needed when converting order request.
+    """
+
+    debug: bool = False
 
     def __init__(self, contract: ContractData) -> None:
         """"""
         self.vt_symbol: str = contract.vt_symbol
         self.exchange: Exchange = contract.exchange
+        self.close_yd: bool = contract.exchange in CLOSE_YD_EXCHANGES
 
         self.active_orders: dict[str, OrderData] = {}
 
+        # Remaining volume of active close orders, and sum by direction/offset
+        self.order_frozen: dict[str, float] = {}
+        self.frozen_sums: dict[tuple, float] = {}
+
         self.long_pos: float = 0
         self.long_yd: float = 0
         self.long_td: float = 0
@@ -40,6 +69,25 @@ class PositionHolding:
         self.short_yd_frozen: float = 0
         self.short_td_frozen: float = 0
 
+        self.long_pos_available: float = 0
+        self.long_yd_available: float = 0
+        self.long_td_available: float = 0
+
+        self.short_pos_available: float = 0
+        self.short_yd_available: float = 0
+        self.short_td_available: float = 0
+
+    def copy(self) -> "PositionHolding":
+        """
+        Copy holding with its own order dicts, which can be used in
+        another thread while this one is updated.
+        """
+        holding: PositionHolding = copy(self)
+        holding.active_orders = self.active_orders.copy()
+        holding.order_frozen = self.order_frozen.copy()
+        holding.frozen_sums = self.frozen_sums.copy()
+        return holding
+
     def update_position(self, position: PositionData) -> None:
         """"""
         if position.direction == Direction.LONG:
@@ -51,15 +99,43 @@ class PositionHolding:
             self.short_yd = position.yd_volume
             self.short_td = self.short_pos - self.short_yd
 
+        # Update frozen and available volume with new position
+        self.apply_frozen()
+
     def update_order(self, order: OrderData) -> None:
         """"""
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
+            frozen: float = order.volume - order.traded
         else:
             if order.vt_orderid in self.active_orders:
                 self.active_orders.pop(order.vt_orderid)
+            frozen = 0
+
+        # Position open orders are ignored
+        if order.offset == Offset.OPEN or order.offset == Offset.NONE:
+            return
+
+        if frozen:
+            previous: float = self.order_frozen.get(order.vt_orderid, 0)
+            self.order_frozen[order.vt_orderid] = frozen
+        else:
+            previous = self.order_frozen.pop(order.vt_orderid, 0)
+
+        if frozen == previous:
+            return
+
+        # Reset sums when no order left to avoid accumulated float error
+        if not self.order_frozen:
+            self.frozen_sums.clear()
+        else:
+            key: tuple = (order.direction.value, order.offset.value)     # type: ignore
+            self.frozen_sums[key] = self.frozen_sums.get(key, 0) + frozen - previous
+
+        self.apply_frozen()
 
-        self.calculate_frozen()
+        if self.debug:
+            self.check_frozen()
 
     def update_order_request(self, req: OrderRequest, vt_orderid: str) -> None:
         """"""
@@ -78,7 +154,7 @@ class PositionHolding:
             elif trade.offset == Offset.CLOSEYESTERDAY:
                 self.short_yd -= trade.volume
             elif trade.offset == Offset.CLOSE:
-                if trade.exchange in {Exchange.SHFE, Exchange.INE}:
+                if self.close_yd:
                     self.short_yd -= trade.volume
                 else:
                     self.short_td -= trade.volume
@@ -94,7 +170,7 @@ class PositionHolding:
             elif trade.offset == Offset.CLOSEYESTERDAY:
                 self.long_yd -= trade.volume
             elif trade.offset == Offset.CLOSE:
-                if trade.exchange in {Exchange.SHFE, Exchange.INE}:
+                if self.close_yd:
                     self.long_yd -= trade.volume
                 else:
                     self.long_td -= trade.volume
@@ -106,53 +182,76 @@ class PositionHolding:
         self.long_pos = self.long_td + self.long_yd
         self.short_pos = self.short_td + self.short_yd
 
-        # Update frozen volume to ensure no more than total volume
-        self.sum_pos_frozen()
+        # Update frozen volume with new position
+        self.apply_frozen()
 
     def calculate_frozen(self) -> None:
-        """"""
-        self.long_pos_frozen = 0
-        self.long_yd_frozen = 0
-        self.long_td_frozen = 0
+        """
+        Recalculate frozen volume from all active orders.
+        """
+        self.order_frozen, self.frozen_sums = self.sum_active_orders()
+        self.apply_frozen()
 
-        self.short_pos_frozen = 0
-        self.short_yd_frozen = 0
-        self.short_td_frozen = 0
+    def sum_active_orders(self) -> tuple[dict[str, float], dict[tuple, float]]:
+        """
+        Sum remaining volume of active close orders by direction/offset.
+        """
+        order_frozen: dict[str, float] = {}
+        frozen_sums: dict[tuple, float] = {}
 
         for order in self.active_orders.values():
             # Ignore position open orders
-            if order.offset == Offset.OPEN:
+            if order.offset == Offset.OPEN or order.offset == Offset.NONE:
                 continue
 
             frozen: float = order.volume - order.traded
+            if not frozen:
+                continue
 
-            if order.direction == Direction.LONG:
-                if order.offset == Offset.CLOSETODAY:
-                    self.short_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.short_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.short_td_frozen += frozen
-
-                    if self.short_td_frozen > self.short_td:
-                        self.short_yd_frozen += (self.short_td_frozen
-                                                 - self.short_td)
-                        self.short_td_frozen = self.short_td
-            elif order.direction == Direction.SHORT:
-                if order.offset == Offset.CLOSETODAY:
-                    self.long_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.long_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.long_td_frozen += frozen
-
-                    if self.long_td_frozen > self.long_td:
-                        self.long_yd_frozen += (self.long_td_frozen
-                                                - self.long_td)
-                        self.long_td_frozen = self.long_td
+            order_frozen[order.vt_orderid] = frozen
+
+            key: tuple = (order.direction.value, order.offset.value)     # type: ignore
+            frozen_sums[key] = frozen_sums.get(key, 0) + frozen
+
+        return order_frozen, frozen_sums
+
+    def apply_frozen(self) -> None:
+        """
+        Calculate frozen volume of positions from sum of close orders.
+        """
+        sums: dict[tuple, float] = self.frozen_sums
+
+        # Long close orders freeze short position
+        self.short_td_frozen, self.short_yd_frozen = allocate_frozen(
+            sums.get(LONG_CLOSETODAY, 0),
+            sums.get(LONG_CLOSEYESTERDAY, 0),
+            sums.get(LONG_CLOSE, 0),
+            self.short_td
+        )
+
+        # Short close orders freeze long position
+        self.long_td_frozen, self.long_yd_frozen = allocate_frozen(
+            sums.get(SHORT_CLOSETODAY, 0),
+            sums.get(SHORT_CLOSEYESTERDAY, 0),
+            sums.get(SHORT_CLOSE, 0),
+            self.long_td
+        )
 
         self.sum_pos_frozen()
 
+    def check_frozen(self) -> None:
+        """
+        Check incremental frozen volume against full recalculation.
+        """
+        order_frozen, frozen_sums = self.sum_active_orders()
+
+        if order_frozen != self.order_frozen:
+            raise AssertionError(f"Frozen order volume mismatch of {self.vt_symbol}")
+
+        for key in set(frozen_sums) | set(self.frozen_sums):
+            if abs(frozen_sums.get(key, 0) - self.frozen_sums.get(key, 0)) > 1e-9:
+                raise AssertionError(f"Frozen volume sum mismatch of {self.vt_symbol}: {key}")
+
     def sum_pos_frozen(self) -> None:
         """"""
         # Frozen volume should be no more than total volume
@@ -165,37 +264,37 @@ class PositionHolding:
         self.long_pos_frozen = self.long_td_frozen + self.long_yd_frozen
         self.short_pos_frozen = self.short_td_frozen + self.short_yd_frozen
 
+        self.long_td_available = self.long_td - self.long_td_frozen
+        self.long_yd_available = self.long_yd - self.long_yd_frozen
+        self.long_pos_available = self.long_pos - self.long_pos_frozen
+
+        self.short_td_available = self.short_td - self.short_td_frozen
+        self.short_yd_available = self.short_yd - self.short_yd_frozen
+        self.short_pos_available = self.short_pos - self.short_pos_frozen
+
     def convert_order_request_shfe(self, req: OrderRequest) -> list[OrderRequest]:
         """"""
         if req.offset == Offset.OPEN:
             return [req]
 
         if req.direction == Direction.LONG:
-            pos_available: float = self.short_pos - self.short_pos_frozen
-            td_available: float = self.short_td - self.short_td_frozen
+            pos_available: float = self.short_pos_available
+            td_available: float = self.short_td_available
         else:
-            pos_available = self.long_pos - self.long_pos_frozen
-            td_available = self.long_td - self.long_td_frozen
+            pos_available = self.long_pos_available
+            td_available = self.long_td_available
 
         if req.volume > pos_available:
             return []
         elif req.volume <= td_available:
-            req_td: OrderRequest = copy(req)
-            req_td.offset = Offset.CLOSETODAY
-            return [req_td]
+            return [convert_request(req, Offset.CLOSETODAY, req.volume)]
         else:
             req_list: list[OrderRequest] = []
 
             if td_available > 0:
-                req_td = copy(req)
-                req_td.offset = Offset.CLOSETODAY
-                req_td.volume = td_available
-                req_list.append(req_td)
+                req_list.append(convert_request(req, Offset.CLOSETODAY, td_available))
 
-            req_yd: OrderRequest = copy(req)
-            req_yd.offset = Offset.CLOSEYESTERDAY
-            req_yd.volume = req.volume - td_available
-            req_list.append(req_yd)
+            req_list.append(convert_request(req, Offset.CLOSEYESTERDAY, req.volume - td_available))
 
             return req_list
 
@@ -203,18 +302,14 @@ class PositionHolding:
         """"""
         if req.direction == Direction.LONG:
             td_volume: float = self.short_td
-            yd_available: float = self.short_yd - self.short_yd_frozen
+            yd_available: float = self.short_yd_available
         else:
             td_volume = self.long_td
-            yd_available = self.long_yd - self.long_yd_frozen
-
-        close_yd_exchanges: set[Exchange] = {Exchange.SHFE, Exchange.INE}
+            yd_available = self.long_yd_available
 
         # If there is td_volume, we can only lock position
-        if td_volume and self.exchange not in close_yd_exchanges:
-            req_open: OrderRequest = copy(req)
-            req_open.offset = Offset.OPEN
-            return [req_open]
+        if td_volume and not self.close_yd:
+            return [convert_request(req, Offset.OPEN, req.volume)]
         # If no td_volume, we close opposite yd position first
         # then open new position
         else:
@@ -223,88 +318,86 @@ class PositionHolding:
             req_list: list[OrderRequest] = []
 
             if yd_available:
-                req_yd: OrderRequest = copy(req)
-                if self.exchange in close_yd_exchanges:
-                    req_yd.offset = Offset.CLOSEYESTERDAY
+                if self.close_yd:
+                    close_offset: Offset = Offset.CLOSEYESTERDAY
                 else:
-                    req_yd.offset = Offset.CLOSE
-                req_yd.volume = close_volume
-                req_list.append(req_yd)
+                    close_offset = Offset.CLOSE
+                req_list.append(convert_request(req, close_offset, close_volume))
 
             if open_volume:
-                req_open = copy(req)
-                req_open.offset = Offset.OPEN
-                req_open.volume = open_volume
-                req_list.append(req_open)
+                req_list.append(convert_request(req, Offset.OPEN, open_volume))
 
             return req_list
 
     def convert_order_request_net(self, req: OrderRequest) -> list[OrderRequest]:
         """"""
         if req.direction == Direction.LONG:
-            pos_available: float = self.short_pos - self.short_pos_frozen
-            td_available: float = self.short_td - self.short_td_frozen
-            yd_available: float = self.short_yd - self.short_yd_frozen
+            pos_available: float = self.short_pos_available
+            td_available: float = self.short_td_available
+            yd_available: float = self.short_yd_available
         else:
-            pos_available = self.long_pos - self.long_pos_frozen
-            td_available = self.long_td - self.long_td_frozen
-            yd_available = self.long_yd - self.long_yd_frozen
+            pos_available = self.long_pos_available
+            td_available = self.long_td_available
+            yd_available = self.long_yd_available
 
-        # Split close order to close today/yesterday for SHFE/INE exchange
-        if req.exchange in {Exchange.SHFE, Exchange.INE}:
-            reqs: list[OrderRequest] = []
-            volume_left: float = req.volume
+        reqs: list[OrderRequest] = []
+        volume_left: float = req.volume
 
+        # Split close order to close today/yesterday for SHFE/INE exchange
+        if self.close_yd:
             if td_available:
                 td_volume: float = min(td_available, volume_left)
                 volume_left -= td_volume
-
-                td_req: OrderRequest = copy(req)
-                td_req.offset = Offset.CLOSETODAY
-                td_req.volume = td_volume
-                reqs.append(td_req)
+                reqs.append(convert_request(req, Offset.CLOSETODAY, td_volume))
 
             if volume_left and yd_available:
                 yd_volume: float = min(yd_available, volume_left)
                 volume_left -= yd_volume
-
-                yd_req: OrderRequest = copy(req)
-                yd_req.offset = Offset.CLOSEYESTERDAY
-                yd_req.volume = yd_volume
-                reqs.append(yd_req)
-
-            if volume_left > 0:
-                open_volume: float = volume_left
-
-                open_req: OrderRequest = copy(req)
-                open_req.offset = Offset.OPEN
-                open_req.volume = open_volume
-                reqs.append(open_req)
-
-            return reqs
+                reqs.append(convert_request(req, Offset.CLOSEYESTERDAY, yd_volume))
         # Just use close for other exchanges
         else:
-            reqs = []
-            volume_left = req.volume
-
             if pos_available:
                 close_volume: float = min(pos_available, volume_left)
                 volume_left -= pos_available
+                reqs.append(convert_request(req, Offset.CLOSE, close_volume))
+
+        if volume_left > 0:
+            reqs.append(convert_request(req, Offset.OPEN, volume_left))
+
+        return reqs
 
-                close_req: OrderRequest = copy(req)
-                close_req.offset = Offset.CLOSE
-                close_req.volume = close_volume
-                reqs.append(close_req)
 
-            if volume_left > 0:
-                open_volume = volume_left
+def convert_request(req: OrderRequest, offset: Offset, volume: float) -> OrderRequest:
+    """
+    Get request with offset and volume. The original request is reused
+    if already the same, otherwise a copy is created.
+    """
+    if req.offset == offset and req.volume == volume:
+        return req
 
-                open_req = copy(req)
-                open_req.offset = Offset.OPEN
-                open_req.volume = open_volume
-                reqs.append(open_req)
+    # Shallow copy of attributes, much faster than copy function
+    new_req: OrderRequest = object.__new__(type(req))
+    new_req.__dict__.update(req.__dict__)
 
-            return reqs
+    new_req.offset = offset
+    new_req.volume = volume
+    return new_req
+
+
+def allocate_frozen(
+    td_frozen: float,
+    yd_frozen: float,
+    close_frozen: float,
+    td_volume: float
+) -> tuple[float, float]:
+    """
+    Allocate frozen volume of close orders to today and yesterday position.
+    Close orders freeze today position first, and the part exceeding today
+    position left after close today orders freezes yesterday position.
+    """
+    td_total: float = td_frozen + close_frozen
+    overflow: float = min(close_frozen, max(td_total - td_volume, 0))
+    return td_total - overflow, yd_frozen + overflow
 
 
 class OffsetConverter:
@@ -314,44 +407,51 @@ class OffsetConverter:
         """"""
         self.holdings: dict[str, PositionHolding] = {}
 
+        # Holdings of contracts checked to require convert
+        self.convert_holdings: dict[str, PositionHolding] = {}
+
         self.get_contract = oms_engine.get_contract
 
     def update_position(self, position: PositionData) -> None:
         """"""
-        if not self.is_convert_required(position.vt_symbol):
-            return
-
-        holding: PositionHolding | None = self.get_position_holding(position.vt_symbol)
+        holding: PositionHolding | None = self.get_convert_holding(position.vt_symbol)
         if holding:
             holding.update_position(position)
 
     def update_trade(self, trade: TradeData) -> None:
         """"""
-        if not self.is_convert_required(trade.vt_symbol):
-            return
-
-        holding: PositionHolding | None = self.get_position_holding(trade.vt_symbol)
+        holding: PositionHolding | None = self.get_convert_holding(trade.vt_symbol)
         if holding:
             holding.update_trade(trade)
 
     def update_order(self, order: OrderData) -> None:
         """"""
-        if not self.is_convert_required(order.vt_symbol):
-            return
-
-        holding: PositionHolding | None = self.get_position_holding(order.vt_symbol)
+        holding: PositionHolding | None = self.get_convert_holding(order.vt_symbol)
         if holding:
             holding.update_order(order)
 
     def update_order_request(self, req: OrderRequest, vt_orderid: str) -> None:
         """"""
-        if not self.is_convert_required(req.vt_symbol):
-            return
-
-        holding: PositionHolding | None = self.get_position_holding(req.vt_symbol)
+        holding: PositionHolding | None = self.get_convert_holding(req.vt_symbol)
         if holding:
             holding.update_order_request(req, vt_orderid)
 
+    def get_convert_holding(self, vt_symbol: str) -> PositionHolding | None:
+        """
+        Get position holding of contract which needs offset convert.
+        """
+        holding: PositionHolding | None = self.convert_holdings.get(vt_symbol, None)
+        if holding:
+            return holding
+
+        if not self.is_convert_required(vt_symbol):
+            return None
+
+        holding = self.get_position_holding(vt_symbol)
+        if holding:
+            self.convert_holdings[vt_symbol] = holding
+        return holding
+
     def get_position_holding(self, vt_symbol: str) -> PositionHolding | None:
         """"""
         holding: PositionHolding | None = self.holdings.get(vt_symbol, None)
@@ -371,10 +471,7 @@ class OffsetConverter:
         net: bool = False
     ) -> list[OrderRequest]:
         """"""
-        if not self.is_convert_required(req.vt_symbol):
-            return [req]
-
-        holding: PositionHolding | None = self.get_position_holding(req.vt_symbol)
+        holding: PositionHolding | None = self.get_convert_holding(req.vt_symbol)
 
         if not holding:
             return [req]
@@ -382,11 +479,53 @@ class OffsetConverter:
             return holding.convert_order_request_lock(req)
         elif net:
             return holding.convert_order_request_net(req)
-        elif req.exchange in {Exchange.SHFE, Exchange.INE}:
+        elif holding.close_yd:
             return holding.convert_order_request_shfe(req)
         else:
             return [req]
 
+    def convert_order_requests(
+        self,
+        reqs: list[OrderRequest],
+        lock: bool,
+        net: bool = False
+    ) -> list[list[OrderRequest]]:
+        """
+        Convert a batch of order requests. Volume converted for a request
+        is frozen temporarily when converting later requests of the same
+        contract, so that the batch never closes more than available.
+        """
+        counts: dict[str, int] = {}
+        for req in reqs:
+            counts[req.vt_symbol] = counts.get(req.vt_symbol, 0) + 1
+
+        results: list[list[OrderRequest]] = []
+        temp_orders: list[tuple[PositionHolding, OrderData]] = []
+
+        for i, req in enumerate(reqs):
+            converted: list[OrderRequest] = self.convert_order_request(req, lock, net)
+            results.append(converted)
+
+            counts[req.vt_symbol] -= 1
+            if not counts[req.vt_symbol]:
+                continue
+
+            holding: PositionHolding | None = self.convert_holdings.get(req.vt_symbol, None)
+            if not holding:
+                continue
+
+            for j, converted_req in enumerate(converted):
+                order: OrderData = converted_req.create_order_data(f"{i}_{j}", "BATCH")
+                holding.update_order(order)
+                temp_orders.append((holding, order))
+
+        # Release volume frozen by temporary orders
+        for holding, order in temp_orders:
+            order.status = Status.CANCELLED
+            holding.update_order(order)
+
+        return results
+
     def is_convert_required(self, vt_symbol: str) -> bool:
         """
         Check if the contract needs offset convert.
@@ -2,7 +2,7 @@ from types import ModuleType
 from collections.abc import Callable
 from importlib import import_module
 
-from .object import HistoryRequest, TickData, BarData
+from .object import HistoryRequest, TickData, BarData, BarBatch, TickBatch
 from .setting import SETTINGS
 from .locale import _
 
@@ -32,6 +32,26 @@ class BaseDatafeed:
         output(_("查询Tick数据失败：没有正确配置数据服务"))
         return []
 
+    def query_bar_batch(self, req: HistoryRequest, output: Callable = print) -> BarBatch | None:
+        """
+        Query history bar data in columnar format, datafeed can override
+        this function to avoid creating bar data objects.
+        """
+        bars: list[BarData] = self.query_bar_history(req, output)
+        if not bars:
+            return None
+        return BarBatch.from_bars(bars)
+
+    def query_tick_batch(self, req: HistoryRequest, output: Callable = print) -> TickBatch | None:
+        """
+        Query history tick data in columnar format, datafeed can override
+        this function to avoid creating tick data objects.
+        """
+        ticks: list[TickData] = self.query_tick_history(req, output)
+        if not ticks:
+            return None
+        return TickBatch.from_ticks(ticks)
+
 
 datafeed: BaseDatafeed | None = None
 
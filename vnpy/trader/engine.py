@@ -1,14 +1,20 @@
 import smtplib
 import os
 import traceback
+from time import monotonic
+from copy import copy
 from abc import ABC, abstractmethod
 from email.message import EmailMessage
+from collections import OrderedDict, deque
+from datetime import date, datetime, time, timedelta
+from heapq import heapify, heappop, heappush
+from functools import partial
 from queue import Empty, Queue
-from threading import Thread
-from typing import TypeVar
+from threading import RLock, Thread
+from typing import Any, TypeVar
 from collections.abc import Callable
 
-from vnpy.event import Event, EventEngine
+from vnpy.event import Event, EventEngine, EVENT_TIMER
 from .app import BaseApp
 from .event import (
     EVENT_TICK,
@@ -18,7 +24,9 @@ from .event import (
     EVENT_ACCOUNT,
     EVENT_CONTRACT,
     EVENT_LOG,
-    EVENT_QUOTE
+    EVENT_QUOTE,
+    EVENT_BAR,
+    EVENT_CONFLATED_TICK
 )
 from .gateway import BaseGateway
 from .object import (
@@ -38,9 +46,13 @@ from .object import (
     ContractData,
     Exchange
 )
+from .constant import Direction, Interval, OrderType, Product, Status
 from .setting import SETTINGS
-from .utility import TRADER_DIR
-from .converter import OffsetConverter
+from .utility import TRADER_DIR, BarGenerator
+from .converter import OffsetConverter, PositionHolding
+from .archive import DataArchive
+from .snapshot import SnapshotStore
+from .registry import ContractRegistry
 from .logger import logger, DEBUG, INFO, WARNING, ERROR, CRITICAL
 from .locale import _
 
@@ -48,6 +60,48 @@ from .locale import _
 EngineType = TypeVar("EngineType", bound="BaseEngine")
 
 
+def add_index(index: dict[str, dict[str, Any]], key: str, vt_id: str, data: Any) -> None:
+    """
+    Add data into secondary index of OmsEngine.
+    """
+    data_map: dict[str, Any] | None = index.get(key, None)
+
+    if data_map is None:
+        index[key] = {vt_id: data}
+    else:
+        data_map[vt_id] = data
+
+
+def get_trading_day(dt: datetime, switch_hour: int) -> date:
+    """
+    Get trading day of datetime. Time after switch hour (e.g. night
+    session) belongs to the next trading day, and weekend belongs to
+    the next Monday. Holidays are not considered.
+    """
+    day: date = dt.date()
+    if dt.hour >= switch_hour:
+        day += timedelta(days=1)
+
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+
+    return day
+
+
+def remove_index(index: dict[str, dict[str, Any]], key: str, vt_id: str) -> None:
+    """
+    Remove data from secondary index of OmsEngine.
+    """
+    data_map: dict[str, Any] | None = index.get(key, None)
+    if data_map is None:
+        return
+
+    data_map.pop(vt_id, None)
+
+    if not data_map:
+        index.pop(key)
+
+
 class BaseEngine(ABC):
     """
     Abstract class for implementing a function engine.
@@ -143,16 +197,30 @@ class MainEngine:
         self.get_quote: Callable[[str], QuoteData | None] = oms_engine.get_quote
         self.get_all_ticks: Callable[[], list[TickData]] = oms_engine.get_all_ticks
         self.get_all_orders: Callable[[], list[OrderData]] = oms_engine.get_all_orders
-        self.get_all_trades: Callable[[], list[TradeData]] = oms_engine.get_all_trades
-        self.get_all_positions: Callable[[], list[PositionData]] = oms_engine.get_all_positions
+        self.get_all_trades: Callable[..., list[TradeData]] = oms_engine.get_all_trades
+        self.get_all_positions: Callable[..., list[PositionData]] = oms_engine.get_all_positions
         self.get_all_accounts: Callable[[], list[AccountData]] = oms_engine.get_all_accounts
         self.get_all_contracts: Callable[[], list[ContractData]] = oms_engine.get_all_contracts
+        self.query_contracts: Callable[..., list[ContractData]] = oms_engine.query_contracts
+        self.get_option_chain: Callable[..., list[ContractData]] = oms_engine.get_option_chain
         self.get_all_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_quotes
-        self.get_all_active_orders: Callable[[], list[OrderData]] = oms_engine.get_all_active_orders
+        self.get_all_active_orders: Callable[..., list[OrderData]] = oms_engine.get_all_active_orders
         self.get_all_active_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_active_quotes
         self.update_order_request: Callable[[OrderRequest, str, str], None] = oms_engine.update_order_request
         self.convert_order_request: Callable[[OrderRequest, str, bool, bool], list[OrderRequest]] = oms_engine.convert_order_request
+        self.update_order_requests: Callable[[list[OrderRequest], list[str], str], None] = oms_engine.update_order_requests
+        self.convert_order_requests: Callable[..., list[list[OrderRequest]]] = oms_engine.convert_order_requests
         self.get_converter: Callable[[str], OffsetConverter | None] = oms_engine.get_converter
+        self.schedule_reconcile: Callable[[str], None] = oms_engine.schedule_reconcile
+
+        bar_engine: BarEngine = self.add_engine(BarEngine)
+        self.subscribe_bar: Callable[..., str] = bar_engine.subscribe_bar
+        self.unsubscribe_bar: Callable[..., None] = bar_engine.unsubscribe_bar
+
+        self.risk_engine: RiskEngine = self.add_engine(RiskEngine)
+
+        conflation_engine: ConflationEngine = self.add_engine(ConflationEngine)
+        self.subscribe_conflated_tick: Callable[[float], str] = conflation_engine.subscribe_tick
 
         email_engine: EmailEngine = self.add_engine(EmailEngine)
         self.send_email: Callable[[str, str, str | None], None] = email_engine.send_email
@@ -217,6 +285,7 @@ class MainEngine:
         gateway: BaseGateway | None = self.get_gateway(gateway_name)
         if gateway:
             gateway.connect(setting)
+            self.schedule_reconcile(gateway_name)
 
     def subscribe(self, req: SubscribeRequest, gateway_name: str) -> None:
         """
@@ -231,18 +300,78 @@ class MainEngine:
         Send new order request to a specific gateway.
         """
         gateway: BaseGateway | None = self.get_gateway(gateway_name)
-        if gateway:
+        if not gateway:
+            return ""
+
+        risk_engine: RiskEngine = self.risk_engine
+        if not risk_engine.active:
             return gateway.send_order(req)
-        else:
+
+        # Reserve limits before sending, so that orders sent from other
+        # threads at the same time are checked with this one counted
+        reserved_id: str = risk_engine.reserve_order(req, gateway_name)
+        if not reserved_id:
             return ""
 
+        vt_orderid: str = gateway.send_order(req)
+        risk_engine.release_order(reserved_id, req, vt_orderid, gateway_name)
+        return vt_orderid
+
     def cancel_order(self, req: CancelRequest, gateway_name: str) -> None:
         """
         Send cancel order request to a specific gateway.
         """
         gateway: BaseGateway | None = self.get_gateway(gateway_name)
-        if gateway:
-            gateway.cancel_order(req)
+        if not gateway:
+            return
+
+        if self.risk_engine.active and not self.risk_engine.check_cancel(req):
+            return
+
+        gateway.cancel_order(req)
+
+    def send_orders(self, reqs: list[OrderRequest], gateway_name: str) -> list[str]:
+        """
+        Send a batch of new order requests to a specific gateway, return
+        vt_orderid of each request (empty string if failed).
+        """
+        gateway: BaseGateway | None = self.get_gateway(gateway_name)
+        if not gateway:
+            return [""] * len(reqs)
+
+        risk_engine: RiskEngine = self.risk_engine
+        if not risk_engine.active:
+            return gateway.send_orders(reqs)
+
+        # Only send requests passed risk check
+        reserved_ids: list[str] = risk_engine.reserve_orders(reqs, gateway_name)
+        passed: list[int] = [i for i, reserved_id in enumerate(reserved_ids) if reserved_id]
+        if not passed:
+            return [""] * len(reqs)
+
+        passed_reqs: list[OrderRequest] = [reqs[i] for i in passed]
+        passed_vt_orderids: list[str] = gateway.send_orders(passed_reqs)
+
+        vt_orderids: list[str] = [""] * len(reqs)
+        for i, req, vt_orderid in zip(passed, passed_reqs, passed_vt_orderids, strict=True):
+            vt_orderids[i] = vt_orderid
+            risk_engine.release_order(reserved_ids[i], req, vt_orderid, gateway_name)
+
+        return vt_orderids
+
+    def cancel_orders(self, reqs: list[CancelRequest], gateway_name: str) -> None:
+        """
+        Send a batch of cancel order requests to a specific gateway.
+        """
+        gateway: BaseGateway | None = self.get_gateway(gateway_name)
+        if not gateway:
+            return
+
+        if self.risk_engine.active:
+            reqs = [req for req in reqs if self.risk_engine.check_cancel(req)]
+
+        if reqs:
+            gateway.cancel_orders(reqs)
 
     def send_quote(self, req: QuoteRequest, gateway_name: str) -> str:
         """
@@ -325,6 +454,20 @@ class LogEngine(BaseEngine):
 class OmsEngine(BaseEngine):
     """
     Provides order management system function.
+
+    If retention is set in global setting, only the latest finished orders,
+    trades and quotes are kept in memory, and older ones are moved into
+    archive on disk. Archived data can still be loaded by get_order,
+    get_trade and get_quote, but not included in get_all_* results.
+    Archive is temporary and only available until OMS is closed.
+
+    If snapshot interval is set in global setting, state of OMS and offset
+    converters is saved periodically, with events since last snapshot saved
+    in journal. On restart the state saved today is restored before gateways
+    connect, and updated by data replayed from gateways. Restored active
+    orders, active quotes and positions not confirmed by gateway are removed
+    by reconcile_snapshot, which is called after reconcile delay since the
+    gateway is connected.
     """
 
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
@@ -336,16 +479,60 @@ class OmsEngine(BaseEngine):
         self.trades: dict[str, TradeData] = {}
         self.positions: dict[str, PositionData] = {}
         self.accounts: dict[str, AccountData] = {}
-        self.contracts: dict[str, ContractData] = {}
+        self.contract_registry: ContractRegistry = ContractRegistry()
+        self.contracts: dict[str, ContractData] = self.contract_registry.contracts
         self.quotes: dict[str, QuoteData] = {}
 
         self.active_orders: dict[str, OrderData] = {}
         self.active_quotes: dict[str, QuoteData] = {}
 
+        # Secondary indexes: vt_symbol/gateway_name -> {vt_id: data}
+        self.symbol_active_orders: dict[str, dict[str, OrderData]] = {}
+        self.gateway_active_orders: dict[str, dict[str, OrderData]] = {}
+        self.symbol_trades: dict[str, dict[str, TradeData]] = {}
+        self.symbol_positions: dict[str, dict[str, PositionData]] = {}
+
         self.offset_converters: dict[str, OffsetConverter] = {}
 
+        # Retention of finished data in memory, 0 for unlimited
+        self.retention_count: int = SETTINGS["oms.retention_count"]
+        self.retention_seconds: float = SETTINGS["oms.retention_minutes"] * 60
+        self.retention_active: bool = bool(self.retention_count or self.retention_seconds)
+
+        # Finished vt ids with monotonic time when finished
+        self.finished_orders: OrderedDict[str, float] = OrderedDict()
+        self.finished_trades: OrderedDict[str, float] = OrderedDict()
+        self.finished_quotes: OrderedDict[str, float] = OrderedDict()
+
+        self.order_archive: DataArchive = DataArchive("order")
+        self.trade_archive: DataArchive = DataArchive("trade")
+        self.quote_archive: DataArchive = DataArchive("quote")
+
+        # Snapshot and journal for fast restart
+        self.snapshot_interval: int = SETTINGS["oms.snapshot_interval"]
+        self.reconcile_delay: float = SETTINGS["oms.reconcile_delay"]
+        self.trading_day_hour: int = SETTINGS["oms.trading_day_hour"]
+        self.snapshot_count: int = 0
+        self.snapshot_store: SnapshotStore = SnapshotStore("oms")
+        self.journal_active: bool = False
+
+        self.restored_orders: set[str] = set()
+        self.restored_quotes: set[str] = set()
+        self.restored_positions: set[str] = set()
+        self.restored_trades: set[str] = set()
+
+        # Contracts cached from last run of today
+        self.contract_cache: bool = SETTINGS["oms.contract_cache"]
+        if self.contract_cache:
+            self.contract_registry.load("contract_cache.pkl")
+            for gateway_name in self.contract_registry.gateway_index:
+                self.offset_converters[gateway_name] = OffsetConverter(self)
+
         self.register_event()
 
+        if self.snapshot_interval:
+            self.restore_snapshot()
+
     def register_event(self) -> None:
         """"""
         self.event_engine.register(EVENT_TICK, self.process_tick_event)
@@ -356,6 +543,9 @@ class OmsEngine(BaseEngine):
         self.event_engine.register(EVENT_CONTRACT, self.process_contract_event)
         self.event_engine.register(EVENT_QUOTE, self.process_quote_event)
 
+        if self.snapshot_interval:
+            self.event_engine.register(EVENT_TIMER, self.process_timer_event)
+
     def process_tick_event(self, event: Event) -> None:
         """"""
         tick: TickData = event.data
@@ -366,12 +556,25 @@ class OmsEngine(BaseEngine):
         order: OrderData = event.data
         self.orders[order.vt_orderid] = order
 
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, order)
+            self.restored_orders.discard(order.vt_orderid)
+
         # If order is active, then update data in dict.
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
+            add_index(self.symbol_active_orders, order.vt_symbol, order.vt_orderid, order)
+            add_index(self.gateway_active_orders, order.gateway_name, order.vt_orderid, order)
         # Otherwise, pop inactive order from in dict
         elif order.vt_orderid in self.active_orders:
             self.active_orders.pop(order.vt_orderid)
+            remove_index(self.symbol_active_orders, order.vt_symbol, order.vt_orderid)
+            remove_index(self.gateway_active_orders, order.gateway_name, order.vt_orderid)
+
+        if self.retention_active and not order.is_active():
+            self.archive_finished(
+                self.finished_orders, order.vt_orderid, self.orders, self.order_archive
+            )
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(order.gateway_name, None)
@@ -381,17 +584,39 @@ class OmsEngine(BaseEngine):
     def process_trade_event(self, event: Event) -> None:
         """"""
         trade: TradeData = event.data
+
+        # Trade restored from snapshot is already included in restored
+        # offset converter, so it is not updated again when replayed by gateway
+        restored: bool = False
+        if self.restored_trades:
+            restored = trade.vt_tradeid in self.restored_trades
+            self.restored_trades.discard(trade.vt_tradeid)
+
         self.trades[trade.vt_tradeid] = trade
+        add_index(self.symbol_trades, trade.vt_symbol, trade.vt_tradeid, trade)
+
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, trade)
+
+        if self.retention_active:
+            self.archive_finished(
+                self.finished_trades, trade.vt_tradeid, self.trades, self.trade_archive, self.symbol_trades
+            )
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(trade.gateway_name, None)
-        if converter:
+        if converter and not restored:
             converter.update_trade(trade)
 
     def process_position_event(self, event: Event) -> None:
         """"""
         position: PositionData = event.data
         self.positions[position.vt_positionid] = position
+        add_index(self.symbol_positions, position.vt_symbol, position.vt_positionid, position)
+
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, position)
+            self.restored_positions.discard(position.vt_positionid)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(position.gateway_name, None)
@@ -403,10 +628,16 @@ class OmsEngine(BaseEngine):
         account: AccountData = event.data
         self.accounts[account.vt_accountid] = account
 
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, account)
+
     def process_contract_event(self, event: Event) -> None:
         """"""
         contract: ContractData = event.data
-        self.contracts[contract.vt_symbol] = contract
+        self.contract_registry.add(contract)
+
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, contract)
 
         # Initialize offset converter for each gateway
         if contract.gateway_name not in self.offset_converters:
@@ -417,6 +648,10 @@ class OmsEngine(BaseEngine):
         quote: QuoteData = event.data
         self.quotes[quote.vt_quoteid] = quote
 
+        if self.journal_active:
+            self.snapshot_store.write_journal(event.type, quote)
+            self.restored_quotes.discard(quote.vt_quoteid)
+
         # If quote is active, then update data in dict.
         if quote.is_active():
             self.active_quotes[quote.vt_quoteid] = quote
@@ -424,6 +659,240 @@ class OmsEngine(BaseEngine):
         elif quote.vt_quoteid in self.active_quotes:
             self.active_quotes.pop(quote.vt_quoteid)
 
+        if self.retention_active and not quote.is_active():
+            self.archive_finished(
+                self.finished_quotes, quote.vt_quoteid, self.quotes, self.quote_archive
+            )
+
+    def process_timer_event(self, event: Event) -> None:
+        """"""
+        self.snapshot_count += 1
+        if self.snapshot_count < self.snapshot_interval:
+            return
+        self.snapshot_count = 0
+
+        self.save_snapshot()
+
+    def save_snapshot(self) -> None:
+        """
+        Save snapshot of OMS and offset converter state, and start a new journal.
+
+        Dicts are copied here, and serialized in thread of snapshot store.
+        """
+        now: float = monotonic()
+
+        state: dict = {
+            "trading_day": get_trading_day(datetime.now(), self.trading_day_hour),
+            "orders": self.orders.copy(),
+            "trades": self.trades.copy(),
+            "positions": self.positions.copy(),
+            "accounts": self.accounts.copy(),
+            "contracts": self.contracts.copy(),
+            "quotes": self.quotes.copy(),
+            "holdings": {
+                gateway_name: {
+                    vt_symbol: holding.copy()
+                    for vt_symbol, holding in converter.holdings.items()
+                }
+                for gateway_name, converter in self.offset_converters.items()
+            },
+            # Monotonic time is not kept after restart, so age is saved
+            "finished": [
+                [(vt_id, now - finished_time) for vt_id, finished_time in finished.items()]
+                for finished in (self.finished_orders, self.finished_trades, self.finished_quotes)
+            ]
+        }
+        self.snapshot_store.save_snapshot(state)
+
+    def restore_snapshot(self) -> None:
+        """
+        Restore state from snapshot and replay events in journal.
+        """
+        state, records = self.snapshot_store.load()
+
+        # State of previous trading days is out of date, e.g. orders expired,
+        # while night session crashed after midnight is still restored
+        trading_day: date = get_trading_day(datetime.now(), self.trading_day_hour)
+        if state and state.get("trading_day", None) != trading_day:
+            state = None
+            records = []
+
+        if state:
+            self.orders.update(state["orders"])
+            self.trades.update(state["trades"])
+            self.positions.update(state["positions"])
+            self.accounts.update(state["accounts"])
+            for contract in state["contracts"].values():
+                self.contract_registry.add(contract)
+            self.quotes.update(state["quotes"])
+
+            for gateway_name, holdings in state["holdings"].items():
+                converter: OffsetConverter = OffsetConverter(self)
+                converter.holdings = holdings
+                self.offset_converters[gateway_name] = converter
+
+            now: float = monotonic()
+            for finished, ages in zip(
+                (self.finished_orders, self.finished_trades, self.finished_quotes),
+                state["finished"],
+                strict=True
+            ):
+                for vt_id, age in ages:
+                    finished[vt_id] = now - age
+
+            # Rebuild active data and secondary indexes
+            for order in self.orders.values():
+                if order.is_active():
+                    self.active_orders[order.vt_orderid] = order
+                    add_index(self.symbol_active_orders, order.vt_symbol, order.vt_orderid, order)
+                    add_index(self.gateway_active_orders, order.gateway_name, order.vt_orderid, order)
+
+            for trade in self.trades.values():
+                add_index(self.symbol_trades, trade.vt_symbol, trade.vt_tradeid, trade)
+
+            for position in self.positions.values():
+                add_index(self.symbol_positions, position.vt_symbol, position.vt_positionid, position)
+
+            for quote in self.quotes.values():
+                if quote.is_active():
+                    self.active_quotes[quote.vt_quoteid] = quote
+
+        handlers: dict[str, Callable[[Event], None]] = {
+            EVENT_ORDER: self.process_order_event,
+            EVENT_TRADE: self.process_trade_event,
+            EVENT_POSITION: self.process_position_event,
+            EVENT_ACCOUNT: self.process_account_event,
+            EVENT_CONTRACT: self.process_contract_event,
+            EVENT_QUOTE: self.process_quote_event,
+        }
+
+        for type, data in records:
+            handler: Callable[[Event], None] | None = handlers.get(type, None)
+            if handler:
+                handler(Event(type, data))
+
+        self.restored_orders = set(self.active_orders)
+        self.restored_quotes = set(self.active_quotes)
+        self.restored_positions = set(self.positions)
+        self.restored_trades = set(self.trades) | set(self.finished_trades)
+
+        # Merge journal into new snapshot before receiving new events
+        self.save_snapshot()
+        self.journal_active = True
+
+    def schedule_reconcile(self, gateway_name: str) -> None:
+        """
+        Reconcile restored data of gateway after reconcile delay, when
+        gateway is expected to have replayed its data.
+        """
+        if not self.snapshot_interval:
+            return
+
+        self.event_engine.call_later(
+            self.reconcile_delay,
+            partial(self.process_reconcile_event, gateway_name)
+        )
+
+    def process_reconcile_event(self, gateway_name: str, event: Event) -> None:
+        """"""
+        self.reconcile_snapshot(gateway_name)
+
+    def reconcile_snapshot(self, gateway_name: str = "") -> None:
+        """
+        Remove restored active orders, active quotes and positions not
+        confirmed by gateway since restart, of specific gateway or all.
+        Offset converter and risk engine are updated as if the orders
+        were cancelled and the positions were closed.
+        """
+        risk_engine: RiskEngine = self.main_engine.risk_engine
+
+        for vt_orderid in list(self.restored_orders):
+            order: OrderData | None = self.orders.get(vt_orderid, None)
+            if not order or (gateway_name and order.gateway_name != gateway_name):
+                continue
+            self.restored_orders.remove(vt_orderid)
+
+            if self.active_orders.pop(vt_orderid, None):
+                remove_index(self.symbol_active_orders, order.vt_symbol, vt_orderid)
+                remove_index(self.gateway_active_orders, order.gateway_name, vt_orderid)
+
+            converter: OffsetConverter | None = self.offset_converters.get(order.gateway_name, None)
+            if converter:
+                holding: PositionHolding | None = converter.holdings.get(order.vt_symbol, None)
+                if holding and holding.active_orders.pop(vt_orderid, None):
+                    holding.calculate_frozen()
+
+            cancelled: OrderData = copy(order)
+            cancelled.status = Status.CANCELLED
+            risk_engine.update_order(cancelled)
+
+        for vt_quoteid in list(self.restored_quotes):
+            quote: QuoteData | None = self.quotes.get(vt_quoteid, None)
+            if not quote or (gateway_name and quote.gateway_name != gateway_name):
+                continue
+            self.restored_quotes.remove(vt_quoteid)
+
+            self.active_quotes.pop(vt_quoteid, None)
+
+        for vt_positionid in list(self.restored_positions):
+            position: PositionData | None = self.positions.get(vt_positionid, None)
+            if not position or (gateway_name and position.gateway_name != gateway_name):
+                continue
+            self.restored_positions.remove(vt_positionid)
+
+            self.positions.pop(vt_positionid)
+            remove_index(self.symbol_positions, position.vt_symbol, vt_positionid)
+
+            closed: PositionData = copy(position)
+            closed.volume = 0
+            closed.yd_volume = 0
+            closed.frozen = 0
+
+            position_converter: OffsetConverter | None = self.offset_converters.get(position.gateway_name, None)
+            if position_converter:
+                position_converter.update_position(closed)
+
+            risk_engine.update_position(closed)
+
+        # Trades not replayed by gateway are no longer expected
+        for vt_tradeid in list(self.restored_trades):
+            if not gateway_name or vt_tradeid.startswith(gateway_name + "."):
+                self.restored_trades.remove(vt_tradeid)
+
+    def archive_finished(
+        self,
+        finished: OrderedDict[str, float],
+        vt_id: str,
+        data_map: dict[str, Any],
+        archive: DataArchive,
+        index: dict[str, dict[str, Any]] | None = None
+    ) -> None:
+        """
+        Record finished data, and move data out of retention into archive.
+        """
+        now: float = monotonic()
+
+        finished[vt_id] = now
+        finished.move_to_end(vt_id)
+
+        while finished:
+            first_id, finished_time = next(iter(finished.items()))
+
+            if (
+                (self.retention_count and len(finished) > self.retention_count)
+                or (self.retention_seconds and now - finished_time > self.retention_seconds)
+            ):
+                finished.popitem(last=False)
+
+                data: Any = data_map.pop(first_id, None)
+                if data:
+                    archive.put(first_id, data)
+
+                    if index is not None:
+                        remove_index(index, data.vt_symbol, first_id)
+            else:
+                break
+
     def get_tick(self, vt_symbol: str) -> TickData | None:
         """
         Get latest market tick data by vt_symbol.
@@ -434,13 +903,23 @@ class OmsEngine(BaseEngine):
         """
         Get latest order data by vt_orderid.
         """
-        return self.orders.get(vt_orderid, None)
+        order: OrderData | None = self.orders.get(vt_orderid, None)
+        if order:
+            return order
+
+        archived_order: OrderData | None = self.order_archive.get(vt_orderid)
+        return archived_order
 
     def get_trade(self, vt_tradeid: str) -> TradeData | None:
         """
         Get trade data by vt_tradeid.
         """
-        return self.trades.get(vt_tradeid, None)
+        trade: TradeData | None = self.trades.get(vt_tradeid, None)
+        if trade:
+            return trade
+
+        archived_trade: TradeData | None = self.trade_archive.get(vt_tradeid)
+        return archived_trade
 
     def get_position(self, vt_positionid: str) -> PositionData | None:
         """
@@ -464,7 +943,12 @@ class OmsEngine(BaseEngine):
         """
         Get latest quote data by vt_orderid.
         """
-        return self.quotes.get(vt_quoteid, None)
+        quote: QuoteData | None = self.quotes.get(vt_quoteid, None)
+        if quote:
+            return quote
+
+        archived_quote: QuoteData | None = self.quote_archive.get(vt_quoteid)
+        return archived_quote
 
     def get_all_ticks(self) -> list[TickData]:
         """
@@ -478,16 +962,20 @@ class OmsEngine(BaseEngine):
         """
         return list(self.orders.values())
 
-    def get_all_trades(self) -> list[TradeData]:
+    def get_all_trades(self, vt_symbol: str = "") -> list[TradeData]:
         """
-        Get all trade data.
+        Get all trade data, or only those of vt_symbol if specified.
         """
+        if vt_symbol:
+            return list(self.symbol_trades.get(vt_symbol, {}).values())
         return list(self.trades.values())
 
-    def get_all_positions(self) -> list[PositionData]:
+    def get_all_positions(self, vt_symbol: str = "") -> list[PositionData]:
         """
-        Get all position data.
+        Get all position data, or only those of vt_symbol if specified.
         """
+        if vt_symbol:
+            return list(self.symbol_positions.get(vt_symbol, {}).values())
         return list(self.positions.values())
 
     def get_all_accounts(self) -> list[AccountData]:
@@ -502,16 +990,51 @@ class OmsEngine(BaseEngine):
         """
         return list(self.contracts.values())
 
+    def query_contracts(
+        self,
+        exchange: Exchange | None = None,
+        product: Product | None = None,
+        gateway_name: str = "",
+        underlying: str = "",
+        expiry: date | None = None,
+        prefix: str = "",
+        keyword: str = ""
+    ) -> list[ContractData]:
+        """
+        Query contracts matching all specified conditions: exchange, product,
+        gateway, option underlying vt_symbol, option expiry date, vt_symbol
+        prefix and keyword contained in vt_symbol.
+        """
+        return self.contract_registry.query(
+            exchange, product, gateway_name, underlying, expiry, prefix, keyword
+        )
+
+    def get_option_chain(self, underlying: str, expiry: date | None = None) -> list[ContractData]:
+        """
+        Get options of underlying vt_symbol, sorted by expiry, strike and type.
+        """
+        return self.contract_registry.get_option_chain(underlying, expiry)
+
     def get_all_quotes(self) -> list[QuoteData]:
         """
         Get all quote data.
         """
         return list(self.quotes.values())
 
-    def get_all_active_orders(self) -> list[OrderData]:
+    def get_all_active_orders(self, vt_symbol: str = "", gateway_name: str = "") -> list[OrderData]:
         """
-        Get all active orders.
+        Get all active orders, or only those of vt_symbol and/or
+        gateway_name if specified.
         """
+        if vt_symbol:
+            orders: dict[str, OrderData] = self.symbol_active_orders.get(vt_symbol, {})
+
+            if gateway_name:
+                return [order for order in orders.values() if order.gateway_name == gateway_name]
+            return list(orders.values())
+        elif gateway_name:
+            return list(self.gateway_active_orders.get(gateway_name, {}).values())
+
         return list(self.active_orders.values())
 
     def get_all_active_quotes(self) -> list[QuoteData]:
@@ -528,6 +1051,35 @@ class OmsEngine(BaseEngine):
         if converter:
             converter.update_order_request(req, vt_orderid)
 
+    def update_order_requests(self, reqs: list[OrderRequest], vt_orderids: list[str], gateway_name: str) -> None:
+        """
+        Update a batch of order requests sent to offset converter.
+        """
+        converter: OffsetConverter | None = self.offset_converters.get(gateway_name, None)
+        if not converter:
+            return
+
+        for req, vt_orderid in zip(reqs, vt_orderids, strict=True):
+            if vt_orderid:
+                converter.update_order_request(req, vt_orderid)
+
+    def convert_order_requests(
+        self,
+        reqs: list[OrderRequest],
+        gateway_name: str,
+        lock: bool,
+        net: bool = False
+    ) -> list[list[OrderRequest]]:
+        """
+        Convert a batch of original order requests according to given mode,
+        return converted requests of each original one.
+        """
+        converter: OffsetConverter | None = self.offset_converters.get(gateway_name, None)
+        if not converter:
+            return [[req] for req in reqs]
+
+        return converter.convert_order_requests(reqs, lock, net)
+
     def convert_order_request(
         self,
         req: OrderRequest,
@@ -551,6 +1103,601 @@ class OmsEngine(BaseEngine):
         """
         return self.offset_converters.get(gateway_name, None)
 
+    def close(self) -> None:
+        """"""
+        if self.snapshot_interval:
+            self.save_snapshot()
+            self.snapshot_store.close()
+
+        if self.contract_cache:
+            self.contract_registry.save("contract_cache.pkl")
+
+        self.order_archive.close()
+        self.trade_archive.close()
+        self.quote_archive.close()
+
+
+class BarEngine(BaseEngine):
+    """
+    Provides bar generation from tick data shared by all strategies
+    and apps.
+
+    Ticks of each subscribed contract are aggregated only once, and
+    bars are published as events of type returned by subscribe_bar.
+    Bar objects are shared by all handlers and should not be modified.
+    """
+
+    def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
+        """"""
+        super().__init__(main_engine, event_engine, "bar")
+
+        self.generators: dict[str, BarGenerator] = {}
+        self.window_generators: dict[str, dict[str, BarGenerator]] = {}
+
+        # Event type -> number of subscriptions
+        self.subscription_counts: dict[str, int] = {}
+
+    def subscribe_bar(
+        self,
+        vt_symbol: str,
+        window: int = 1,
+        interval: Interval = Interval.MINUTE,
+        daily_end: time | None = None
+    ) -> str:
+        """
+        Start generating bars of the contract with window and interval,
+        return event type of the bar events.
+        """
+        if vt_symbol not in self.generators:
+            self.generators[vt_symbol] = BarGenerator(self.on_bar)
+            self.window_generators[vt_symbol] = {}
+
+            self.event_engine.register(EVENT_TICK + vt_symbol, self.process_tick_event)
+
+        event_type: str = self.get_event_type(vt_symbol, window, interval, daily_end)
+
+        generators: dict[str, BarGenerator] = self.window_generators[vt_symbol]
+        if (window, interval) != (1, Interval.MINUTE) and event_type not in generators:
+            put_bar: Callable[[BarData], None] = partial(self.put_bar, event_type)
+            generators[event_type] = BarGenerator(put_bar, window, put_bar, interval, daily_end)
+
+        self.subscription_counts[event_type] = self.subscription_counts.get(event_type, 0) + 1
+
+        return event_type
+
+    def unsubscribe_bar(
+        self,
+        vt_symbol: str,
+        window: int = 1,
+        interval: Interval = Interval.MINUTE,
+        daily_end: time | None = None
+    ) -> None:
+        """
+        Cancel one subscription made by subscribe_bar with same arguments.
+        Bar generation stops when all subscriptions are cancelled.
+        """
+        event_type: str = self.get_event_type(vt_symbol, window, interval, daily_end)
+
+        count: int = self.subscription_counts.get(event_type, 0)
+        if not count:
+            return
+        elif count > 1:
+            self.subscription_counts[event_type] = count - 1
+            return
+
+        self.subscription_counts.pop(event_type)
+        self.window_generators[vt_symbol].pop(event_type, None)
+
+        # Keep 1 minute generator while any bar of the contract subscribed
+        prefix: str = f"{EVENT_BAR}{vt_symbol}."
+        for subscribed in self.subscription_counts:
+            if subscribed.startswith(prefix):
+                return
+
+        self.event_engine.unregister(EVENT_TICK + vt_symbol, self.process_tick_event)
+        self.generators.pop(vt_symbol)
+        self.window_generators.pop(vt_symbol)
+
+    def get_event_type(
+        self,
+        vt_symbol: str,
+        window: int,
+        interval: Interval,
+        daily_end: time | None = None
+    ) -> str:
+        """
+        Get event type of bars, e.g. eBar.rb2501.SHFE.1m.5 for 5 minute bars,
+        and eBar.rb2501.SHFE.d.1.150000 for daily bars ending at 15:00.
+        """
+        event_type: str = f"{EVENT_BAR}{vt_symbol}.{interval.value}.{window}"
+
+        if daily_end:
+            event_type += daily_end.strftime(".%H%M%S")
+
+        return event_type
+
+    def process_tick_event(self, event: Event) -> None:
+        """"""
+        tick: TickData = event.data
+
+        # Generator may be removed by unsubscribe_bar in another thread
+        generator: BarGenerator | None = self.generators.get(tick.vt_symbol, None)
+        if generator:
+            generator.update_tick(tick)
+
+    def on_bar(self, bar: BarData) -> None:
+        """
+        Publish 1 minute bar and update it into window generators.
+        """
+        self.put_bar(self.get_event_type(bar.vt_symbol, 1, Interval.MINUTE), bar)
+
+        generators: dict[str, BarGenerator] | None = self.window_generators.get(bar.vt_symbol, None)
+        if not generators:
+            return
+
+        for generator in list(generators.values()):
+            generator.update_bar(bar)
+
+    def put_bar(self, event_type: str, bar: BarData) -> None:
+        """"""
+        self.event_engine.put(Event(event_type, bar))
+
+
+class ConflationEngine(BaseEngine):
+    """
+    Merges ticks of each contract into the latest one within conflation
+    window, for consumers which do not need every tick, e.g. UI monitors.
+
+    When timer of a window fires, latest tick of each contract updated
+    in the window is pushed as event of type returned by subscribe_tick,
+    and of the type plus vt_symbol if any handler listening.
+    """
+
+    def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
+        """"""
+        super().__init__(main_engine, event_engine, "conflation")
+
+        # Event type -> {vt_symbol: latest tick in window}
+        self.windows: dict[str, dict[str, TickData]] = {}
+
+    def subscribe_tick(self, window: float) -> str:
+        """
+        Start conflating ticks by window seconds, return event type of the
+        conflated ticks. EVENT_TICK is returned if window is 0.
+        """
+        if not window:
+            return EVENT_TICK
+
+        milliseconds: int = round(window * 1000)
+        event_type: str = f"{EVENT_CONFLATED_TICK}{milliseconds}."
+
+        if event_type not in self.windows:
+            if not self.windows:
+                self.event_engine.register(EVENT_TICK, self.process_tick_event)
+
+            self.windows[event_type] = {}
+
+            timer_type: str = self.event_engine.add_timer(f"conflation.{milliseconds}", window)
+            self.event_engine.register(timer_type, partial(self.process_timer_event, event_type))
+
+        return event_type
+
+    def process_tick_event(self, event: Event) -> None:
+        """"""
+        tick: TickData = event.data
+
+        for latest in self.windows.values():
+            latest[tick.vt_symbol] = tick
+
+    def process_timer_event(self, event_type: str, event: Event) -> None:
+        """"""
+        latest: dict[str, TickData] = self.windows[event_type]
+        if not latest:
+            return
+        self.windows[event_type] = {}
+
+        for vt_symbol, tick in latest.items():
+            self.event_engine.put(Event(event_type, tick))
+
+            if self.event_engine.is_subscribed(event_type, vt_symbol):
+                self.event_engine.put(Event(event_type + vt_symbol, tick))
+
+
+class RiskEngine(BaseEngine):
+    """
+    Provides pre-trade risk checks of order sending and cancelling:
+    order and cancel flow, order size, order notional, active order
+    notional of each gateway, net position of each contract and self
+    trade against own active orders. Limit set to 0 is not checked.
+
+    Flow is counted in sliding windows, while pending volume, prices
+    and notional of active orders and net positions are maintained
+    with order and position events, so that every check runs in
+    constant time no matter how many orders are active.
+
+    Orders are sent from strategy threads while order events are
+    processed in event thread, so state is guarded by a reentrant lock.
+    Order passed check is reserved as an active order until sent, so
+    that concurrent orders cannot exceed limits together.
+
+    Every order checked is counted in order flow, including rejected ones.
+    """
+
+    finished_limit: int = 10000
+
+    def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
+        """"""
+        super().__init__(main_engine, event_engine, "risk")
+
+        self.active: bool = SETTINGS["risk.active"]
+
+        self.flow_seconds: float = SETTINGS["risk.flow_seconds"]
+        self.order_flow_limit: int = SETTINGS["risk.order_flow_limit"]
+        self.cancel_flow_limit: int = SETTINGS["risk.cancel_flow_limit"]
+        self.order_size_limit: float = SETTINGS["risk.order_size_limit"]
+        self.order_notional_limit: float = SETTINGS["risk.order_notional_limit"]
+        self.active_notional_limit: float = SETTINGS["risk.active_notional_limit"]
+        self.position_limit: float = SETTINGS["risk.position_limit"]
+        self.self_trade_check: bool = SETTINGS["risk.self_trade_check"]
+
+        # Monotonic time of orders and cancels in flow window
+        self.order_times: deque[float] = deque()
+        self.cancel_times: deque[float] = deque()
+
+        # Active orders and their remaining volume
+        self.active_orders: dict[str, OrderData] = {}
+        self.order_remaining: dict[str, float] = {}
+
+        # Latest orders finished, whose request recorded later should be ignored
+        self.finished_orders: OrderedDict[str, None] = OrderedDict()
+        self.reserve_count: int = 0
+
+        # Aggregation of active orders: vt_symbol/gateway_name -> value
+        self.long_pending: dict[str, float] = {}
+        self.short_pending: dict[str, float] = {}
+        self.long_prices: dict[str, PriceLevels] = {}
+        self.short_prices: dict[str, PriceLevels] = {}
+        self.gateway_notionals: dict[str, float] = {}
+
+        # Signed position volume of each vt_positionid, and net of each vt_symbol
+        self.position_volumes: dict[str, float] = {}
+        self.net_positions: dict[str, float] = {}
+
+        self.lock: RLock = RLock()
+
+        if self.active:
+            self.register_event()
+
+            # Orders and positions may be restored by OmsEngine from snapshot
+            for order in main_engine.get_all_active_orders():
+                self.update_order(order)
+
+            for position in main_engine.get_all_positions():
+                self.update_position(position)
+
+    def register_event(self) -> None:
+        """"""
+        self.event_engine.register(EVENT_ORDER, self.process_order_event)
+        self.event_engine.register(EVENT_POSITION, self.process_position_event)
+
+    def process_order_event(self, event: Event) -> None:
+        """"""
+        order: OrderData = event.data
+        self.update_order(order)
+
+    def process_position_event(self, event: Event) -> None:
+        """"""
+        position: PositionData = event.data
+        self.update_position(position)
+
+    def update_position(self, position: PositionData) -> None:
+        """
+        Apply change of position volume to net position of contract.
+        """
+        volume: float = position.volume
+        if position.direction == Direction.SHORT:
+            volume = -volume
+
+        with self.lock:
+            previous: float = self.position_volumes.get(position.vt_positionid, 0)
+            self.position_volumes[position.vt_positionid] = volume
+
+            vt_symbol: str = position.vt_symbol
+            self.net_positions[vt_symbol] = self.net_positions.get(vt_symbol, 0) + volume - previous
+
+    def update_order_request(self, req: OrderRequest, vt_orderid: str, gateway_name: str) -> None:
+        """
+        Record order sent before receiving its order update from gateway.
+
+        Order update may be processed in event thread before this is
+        called, so request of order already finished is ignored.
+        """
+        with self.lock:
+            if vt_orderid in self.order_remaining or vt_orderid in self.finished_orders:
+                return
+
+            orderid: str = vt_orderid.split(".", 1)[1]
+            order: OrderData = req.create_order_data(orderid, gateway_name)
+            self.update_order(order)
+
+    def update_order(self, order: OrderData) -> None:
+        """
+        Apply change of remaining volume to aggregation of active orders.
+        """
+        with self.lock:
+            vt_orderid: str = order.vt_orderid
+            previous: float = self.order_remaining.get(vt_orderid, 0)
+
+            remaining: float = 0
+            if order.is_active():
+                remaining = order.volume - order.traded
+            else:
+                self.finished_orders[vt_orderid] = None
+                if len(self.finished_orders) > self.finished_limit:
+                    self.finished_orders.popitem(last=False)
+
+            if remaining == previous:
+                return
+
+            long: bool = order.direction == Direction.LONG
+            check_price: bool = order.type != OrderType.MARKET
+
+            if remaining:
+                self.order_remaining[vt_orderid] = remaining
+
+                if not previous:
+                    self.active_orders[vt_orderid] = order
+
+                    if check_price:
+                        prices: dict[str, PriceLevels] = self.long_prices if long else self.short_prices
+                        levels: PriceLevels | None = prices.get(order.vt_symbol, None)
+                        if not levels:
+                            levels = PriceLevels(long)
+                            prices[order.vt_symbol] = levels
+                        levels.add(order.price)
+            else:
+                self.order_remaining.pop(vt_orderid)
+
+                # Use the order recorded, in case that gateway modified price
+                order = self.active_orders.pop(vt_orderid)
+
+                if check_price:
+                    prices = self.long_prices if long else self.short_prices
+                    prices[order.vt_symbol].remove(order.price)
+
+            change: float = remaining - previous
+
+            pending: dict[str, float] = self.long_pending if long else self.short_pending
+            pending[order.vt_symbol] = pending.get(order.vt_symbol, 0) + change
+
+            notional: float = change * order.price * self.get_size(order.vt_symbol)
+            gateway_name: str = order.gateway_name
+            self.gateway_notionals[gateway_name] = self.gateway_notionals.get(gateway_name, 0) + notional
+
+    def check_order(self, req: OrderRequest, gateway_name: str) -> bool:
+        """
+        Check if order request is allowed to send.
+        """
+        with self.lock:
+            vt_symbol: str = req.vt_symbol
+            long: bool = req.direction == Direction.LONG
+
+            if self.order_flow_limit and not self.check_flow(self.order_times, self.order_flow_limit):
+                return self.reject(_("委托流控超限，{}秒内最多{}笔").format(
+                    self.flow_seconds, self.order_flow_limit)
+                )
+
+            if self.order_size_limit and req.volume > self.order_size_limit:
+                return self.reject(
+                    _("委托数量{}超过单笔上限{}").format(req.volume, self.order_size_limit)
+                )
+
+            notional: float = req.price * req.volume * self.get_size(vt_symbol)
+
+            if self.order_notional_limit and notional > self.order_notional_limit:
+                return self.reject(
+                    _("委托金额{}超过单笔上限{}").format(notional, self.order_notional_limit)
+                )
+
+            if self.active_notional_limit:
+                active_notional: float = self.gateway_notionals.get(gateway_name, 0) + notional
+                if active_notional > self.active_notional_limit:
+                    return self.reject(
+                        _("{}活动委托金额{}超过上限{}").format(
+                            gateway_name, active_notional, self.active_notional_limit
+                        )
+                    )
+
+            # Net position if all active orders of the same direction traded
+            if self.position_limit:
+                net_position: float = self.net_positions.get(vt_symbol, 0)
+                if long:
+                    net_position += self.long_pending.get(vt_symbol, 0) + req.volume
+                else:
+                    net_position -= self.short_pending.get(vt_symbol, 0) + req.volume
+
+                if abs(net_position) > self.position_limit:
+                    return self.reject(
+                        _("{}净持仓{}超过上限{}").format(vt_symbol, net_position, self.position_limit)
+                    )
+
+            # Check against best price of own active orders in opposite direction
+            if self.self_trade_check:
+                opposite: dict[str, PriceLevels] = self.short_prices if long else self.long_prices
+                levels: PriceLevels | None = opposite.get(vt_symbol, None)
+                best_price: float | None = levels.get_best() if levels else None
+
+                if best_price is not None:
+                    if req.type == OrderType.MARKET:
+                        crossed: bool = True
+                    elif long:
+                        crossed = req.price >= best_price
+                    else:
+                        crossed = req.price <= best_price
+
+                    if crossed:
+                        return self.reject(
+                            _("{}委托价格{}与自身活动委托{}存在自成交风险").format(
+                                vt_symbol, req.price, best_price
+                            )
+                        )
+
+            return True
+
+    def check_orders(self, reqs: list[OrderRequest], gateway_name: str) -> list[bool]:
+        """
+        Check a batch of order requests. Requests passed are counted as
+        active orders temporarily when checking later ones in the batch.
+        """
+        with self.lock:
+            results: list[bool] = []
+            temp_orders: list[OrderData] = []
+
+            for i, req in enumerate(reqs):
+                passed: bool = self.check_order(req, gateway_name)
+                results.append(passed)
+
+                if passed:
+                    order: OrderData = req.create_order_data(f"BATCH_{i}", gateway_name)
+                    self.update_order(order)
+                    temp_orders.append(order)
+
+            for order in temp_orders:
+                order.status = Status.CANCELLED
+                self.update_order(order)
+                self.finished_orders.pop(order.vt_orderid)
+
+            return results
+
+    def reserve_order(self, req: OrderRequest, gateway_name: str) -> str:
+        """
+        Check order request and record it as active order if passed,
+        return reserved id (empty string if rejected).
+        """
+        with self.lock:
+            if not self.check_order(req, gateway_name):
+                return ""
+
+            self.reserve_count += 1
+            order: OrderData = req.create_order_data(f"RESERVED_{self.reserve_count}", gateway_name)
+            self.update_order(order)
+            return order.vt_orderid
+
+    def reserve_orders(self, reqs: list[OrderRequest], gateway_name: str) -> list[str]:
+        """
+        Reserve a batch of order requests, return reserved id of each.
+        """
+        with self.lock:
+            return [self.reserve_order(req, gateway_name) for req in reqs]
+
+    def release_order(
+        self,
+        reserved_id: str,
+        req: OrderRequest,
+        vt_orderid: str,
+        gateway_name: str
+    ) -> None:
+        """
+        Replace reserved order with the order sent (if vt_orderid not empty).
+        """
+        with self.lock:
+            orderid: str = reserved_id.split(".", 1)[1]
+            order: OrderData = req.create_order_data(orderid, gateway_name)
+            order.status = Status.CANCELLED
+            self.update_order(order)
+            self.finished_orders.pop(reserved_id)
+
+            if vt_orderid:
+                self.update_order_request(req, vt_orderid, gateway_name)
+
+    def check_cancel(self, req: CancelRequest) -> bool:
+        """
+        Check if cancel request is allowed to send.
+        """
+        with self.lock:
+            if self.cancel_flow_limit and not self.check_flow(self.cancel_times, self.cancel_flow_limit):
+                return self.reject(_("撤单流控超限，{}秒内最多{}笔").format(
+                    self.flow_seconds, self.cancel_flow_limit)
+                )
+
+            return True
+
+    def check_flow(self, times: deque[float], limit: int) -> bool:
+        """
+        Check count in sliding window, and record new one if allowed.
+        """
+        now: float = monotonic()
+
+        while times and now - times[0] >= self.flow_seconds:
+            times.popleft()
+
+        if len(times) >= limit:
+            return False
+
+        times.append(now)
+        return True
+
+    def get_size(self, vt_symbol: str) -> float:
+        """"""
+        contract: ContractData | None = self.main_engine.get_contract(vt_symbol)
+        if contract:
+            return contract.size
+        return 1
+
+    def reject(self, msg: str) -> bool:
+        """"""
+        self.main_engine.write_log(_("风控拦截：{}").format(msg), "RISK")
+        return False
+
+
+class PriceLevels:
+    """
+    Count of active orders at each price, with best price kept on top
+    of heap. Prices no longer used are removed from heap lazily.
+    """
+
+    def __init__(self, highest: bool) -> None:
+        """"""
+        self.sign: int = -1 if highest else 1
+
+        self.counts: dict[float, int] = {}
+        self.heap: list[float] = []
+
+    def add(self, price: float) -> None:
+        """"""
+        count: int = self.counts.get(price, 0)
+        if not count:
+            heappush(self.heap, price * self.sign)
+        self.counts[price] = count + 1
+
+    def remove(self, price: float) -> None:
+        """"""
+        count: int = self.counts[price] - 1
+        if count:
+            self.counts[price] = count
+            return
+
+        self.counts.pop(price)
+
+        # Rebuild heap if too many unused prices left
+        if len(self.heap) > len(self.counts) * 2 + 100:
+            self.heap = [p * self.sign for p in self.counts]
+            heapify(self.heap)
+
+    def get_best(self) -> float | None:
+        """
+        Get highest price for long orders, lowest for short orders.
+        """
+        heap: list[float] = self.heap
+
+        while heap:
+            price: float = heap[0] * self.sign
+            if price in self.counts:
+                return price
+            heappop(heap)
+
+        return None
+
 
 class EmailEngine(BaseEngine):
     """
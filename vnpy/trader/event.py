@@ -2,7 +2,7 @@
 Event type string used in the trading platform.
 """
 
-from vnpy.event import EVENT_TIMER  # noqa
+from vnpy.event import EVENT_TIMER, EVENT_PROFILE  # noqa
 
 EVENT_TICK = "eTick."
 EVENT_TRADE = "eTrade."
@@ -11,4 +11,6 @@ EVENT_POSITION = "ePosition."
 EVENT_ACCOUNT = "eAccount."
 EVENT_QUOTE = "eQuote."
 EVENT_CONTRACT = "eContract."
+EVENT_BAR = "eBar."
+EVENT_CONFLATED_TICK = "eConflatedTick."
 EVENT_LOG = "eLog"
@@ -93,10 +93,17 @@ class BaseGateway(ABC):
     def on_tick(self, tick: TickData) -> None:
         """
         Tick event push.
-        Tick event of a specific vt_symbol is also pushed.
+        Tick event of a specific vt_symbol is also pushed if subscribed,
+        so handler of it should be registered before ticks arrive.
+
+        Other per-key events are always pushed, since they are rare and
+        handlers may be registered only after the key is known, e.g.
+        order update pushed inside send_order before vt_orderid returned.
         """
         self.on_event(EVENT_TICK, tick)
-        self.on_event(EVENT_TICK + tick.vt_symbol, tick)
+
+        if self.event_engine.is_subscribed(EVENT_TICK, tick.vt_symbol):
+            self.on_event(EVENT_TICK + tick.vt_symbol, tick)
 
     def on_trade(self, trade: TradeData) -> None:
         """
@@ -220,6 +227,27 @@ class BaseGateway(ABC):
         """
         pass
 
+    def send_orders(self, reqs: list[OrderRequest]) -> list[str]:
+        """
+        Send a batch of new orders to server.
+
+        Default implementation calls send_order for each request, gateway
+        with native batch order API can override this function.
+
+        :return list of vt_orderid in the same order as reqs, empty string for failed ones
+        """
+        return [self.send_order(req) for req in reqs]
+
+    def cancel_orders(self, reqs: list[CancelRequest]) -> None:
+        """
+        Cancel a batch of existing orders.
+
+        Default implementation calls cancel_order for each request, gateway
+        with native batch cancel API can override this function.
+        """
+        for req in reqs:
+            self.cancel_order(req)
+
     def send_quote(self, req: QuoteRequest) -> str:
         """
         Send a new two-sided quote to server.
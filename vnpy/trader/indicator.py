@@ -0,0 +1,313 @@
+"""
+Incremental technical indicators used by ArrayManager.
+
+Each indicator keeps O(1) running state which is seeded from the time
+series in ArrayManager when first requested after it is inited, and then
+updated with every new bar.
+
+SMA and STD are window based, so their values are the same as TA-Lib
+outputs calculated over the array manager window. EMA, ATR, RSI and MACD
+are recursive and seeded by TA-Lib itself (SMA seed of the first full
+window), so their values are the same as TA-Lib outputs calculated over
+the whole history starting from the seeding window. The difference to
+TA-Lib outputs calculated over the sliding window decays with the window
+size.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from math import nan, sqrt
+
+import numpy as np
+import talib
+
+
+# Recalculate window sums after number of updates to avoid float drift
+RESYNC_COUNT: int = 10_000
+
+# Same threshold as TA-Lib for zero value check
+ZERO_THRESHOLD: float = 0.00000001
+
+
+class IncrementalIndicator(ABC):
+    """
+    Indicator with running state updated by each new bar.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.inited: bool = False
+
+    @abstractmethod
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """
+        Initialize state from time series, inited is set if result is valid.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, high: float, low: float, close: float) -> None:
+        """
+        Update state with new bar data.
+        """
+        pass
+
+
+class SmaIndicator(IncrementalIndicator):
+    """
+    Simple moving average with running window sum.
+    """
+
+    def __init__(self, n: int) -> None:
+        """"""
+        super().__init__()
+
+        self.n: int = n
+        self.window: deque[float] = deque(maxlen=n)
+        self.total: float = 0
+        self.count: int = 0
+        self.value: float = nan
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """"""
+        if len(close) < self.n:
+            return
+
+        self.window.extend(close[-self.n:].tolist())
+        self.total = sum(self.window)
+        self.value = self.total / self.n
+        self.inited = True
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.total += close - self.window[0]
+        self.window.append(close)
+
+        self.count += 1
+        if self.count >= RESYNC_COUNT:
+            self.count = 0
+            self.total = sum(self.window)
+
+        self.value = self.total / self.n
+
+
+class StdIndicator(IncrementalIndicator):
+    """
+    Population standard deviation with windowed Welford algorithm.
+    """
+
+    def __init__(self, n: int) -> None:
+        """"""
+        super().__init__()
+
+        self.n: int = n
+        self.window: deque[float] = deque(maxlen=n)
+        self.mean: float = 0
+        self.m2: float = 0
+        self.count: int = 0
+        self.value: float = nan
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """"""
+        if len(close) < self.n:
+            return
+
+        self.window.extend(close[-self.n:].tolist())
+        self.resync()
+        self.inited = True
+
+    def resync(self) -> None:
+        """
+        Recalculate mean and sum of squared differences from window.
+        """
+        data: np.ndarray = np.array(self.window)
+        self.mean = float(data.mean())
+        self.m2 = float(((data - self.mean) ** 2).sum())
+        self.calculate_value()
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        old: float = self.window[0]
+        self.window.append(close)
+
+        self.count += 1
+        if self.count >= RESYNC_COUNT:
+            self.count = 0
+            self.resync()
+            return
+
+        delta: float = close - old
+        old_mean: float = self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (close - self.mean + old - old_mean)
+        self.calculate_value()
+
+    def calculate_value(self) -> None:
+        """"""
+        variance: float = self.m2 / self.n
+
+        if variance < ZERO_THRESHOLD:
+            self.value = 0
+        else:
+            self.value = sqrt(variance)
+
+
+class EmaIndicator(IncrementalIndicator):
+    """
+    Exponential moving average.
+    """
+
+    def __init__(self, n: int) -> None:
+        """"""
+        super().__init__()
+
+        self.k: float = 2 / (n + 1)
+        self.n: int = n
+        self.value: float = nan
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """"""
+        self.value = talib.EMA(close, self.n)[-1]
+        self.inited = not np.isnan(self.value)
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.value = (close - self.value) * self.k + self.value
+
+
+class AtrIndicator(IncrementalIndicator):
+    """
+    Average True Range with Wilder smoothing.
+    """
+
+    def __init__(self, n: int) -> None:
+        """"""
+        super().__init__()
+
+        self.n: int = n
+        self.pre_close: float = 0
+        self.value: float = nan
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """"""
+        self.value = talib.ATR(high, low, close, self.n)[-1]
+        self.pre_close = close[-1]
+        self.inited = not np.isnan(self.value)
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        true_range: float = max(high, self.pre_close) - min(low, self.pre_close)
+        self.pre_close = close
+
+        self.value = (self.value * (self.n - 1) + true_range) / self.n
+
+
+class RsiIndicator(IncrementalIndicator):
+    """
+    Relative Strength Index with Wilder smoothing.
+    """
+
+    def __init__(self, n: int) -> None:
+        """"""
+        super().__init__()
+
+        self.n: int = n
+        self.pre_close: float = 0
+        self.gain: float = 0
+        self.loss: float = 0
+        self.value: float = nan
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """
+        Calculate average gain and loss in the same way as TA-Lib.
+        """
+        n: int = self.n
+        if len(close) <= n:
+            return
+
+        diff: np.ndarray = np.diff(close)
+        self.gain = float(diff[:n].clip(min=0).sum()) / n
+        self.loss = float(-diff[:n].clip(max=0).sum()) / n
+
+        for change in diff[n:].tolist():
+            self.smooth(change)
+
+        self.pre_close = close[-1]
+        self.calculate_value()
+        self.inited = True
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.smooth(close - self.pre_close)
+        self.pre_close = close
+        self.calculate_value()
+
+    def smooth(self, change: float) -> None:
+        """"""
+        self.gain *= self.n - 1
+        self.loss *= self.n - 1
+
+        if change < 0:
+            self.loss -= change
+        else:
+            self.gain += change
+
+        self.gain /= self.n
+        self.loss /= self.n
+
+    def calculate_value(self) -> None:
+        """"""
+        total: float = self.gain + self.loss
+
+        if -ZERO_THRESHOLD < total < ZERO_THRESHOLD:
+            self.value = 0
+        else:
+            self.value = 100 * self.gain / total
+
+
+class MacdIndicator(IncrementalIndicator):
+    """
+    MACD with fast, slow and signal EMA.
+    """
+
+    def __init__(self, fast_period: int, slow_period: int, signal_period: int) -> None:
+        """"""
+        super().__init__()
+
+        self.fast_period: int = fast_period
+        self.slow_period: int = slow_period
+        self.signal_period: int = signal_period
+
+        self.fast_k: float = 2 / (fast_period + 1)
+        self.slow_k: float = 2 / (slow_period + 1)
+        self.signal_k: float = 2 / (signal_period + 1)
+
+        self.fast: float = nan
+        self.slow: float = nan
+        self.value: tuple[float, float, float] = (nan, nan, nan)
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """
+        Fast and slow EMA are restored from MACD and slow EMA of TA-Lib.
+        """
+        macd, signal, hist = talib.MACD(
+            close, self.fast_period, self.slow_period, self.signal_period
+        )
+        if np.isnan(hist[-1]) or self.fast_period > self.slow_period:
+            return
+
+        self.slow = talib.EMA(close, self.slow_period)[-1]
+        self.fast = macd[-1] + self.slow
+        self.value = (macd[-1], signal[-1], hist[-1])
+        self.inited = True
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """"""
+        self.fast = (close - self.fast) * self.fast_k + self.fast
+        self.slow = (close - self.slow) * self.slow_k + self.slow
+
+        macd: float = self.fast - self.slow
+        signal: float = self.value[1]
+        signal = (macd - signal) * self.signal_k + signal
+
+        self.value = (macd, signal, macd - signal)
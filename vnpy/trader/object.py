@@ -2,8 +2,12 @@
 Basic data structure used for general trading function in the trading platform.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime as Datetime
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, make_dataclass, MISSING, Field
+from datetime import datetime as Datetime, tzinfo as Tzinfo
+from typing import Any
+
+import numpy as np
 
 from .constant import Direction, Exchange, Interval, Offset, Status, Product, OptionType, OrderType
 
@@ -14,6 +18,25 @@ INFO: int = 20
 ACTIVE_STATUSES = set([Status.SUBMITTING, Status.NOTTRADED, Status.PARTTRADED])
 
 
+# Cache of vt_symbol strings, so that data objects of the same contract
+# share one string object instead of formatting a new one every time.
+VT_SYMBOL_CACHE: defaultdict[Exchange, dict[str, str]] = defaultdict(dict)
+
+
+def get_vt_symbol(symbol: str, exchange: Exchange) -> str:
+    """
+    Get cached vt_symbol string of symbol and exchange.
+    """
+    symbols: dict[str, str] = VT_SYMBOL_CACHE[exchange]
+
+    vt_symbol: str | None = symbols.get(symbol, None)
+    if vt_symbol is None:
+        vt_symbol = f"{symbol}.{exchange.value}"
+        symbols[symbol] = vt_symbol
+
+    return vt_symbol
+
+
 @dataclass
 class BaseData:
     """
@@ -81,7 +104,7 @@ class TickData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -105,7 +128,7 @@ class BarData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -131,7 +154,7 @@ class OrderData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
 
     def is_active(self) -> bool:
@@ -170,7 +193,7 @@ class TradeData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
         self.vt_tradeid: str = f"{self.gateway_name}.{self.tradeid}"
 
@@ -193,7 +216,7 @@ class PositionData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_positionid: str = f"{self.gateway_name}.{self.vt_symbol}.{self.direction.value}"
 
 
@@ -258,7 +281,7 @@ class ContractData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -284,7 +307,7 @@ class QuoteData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_quoteid: str = f"{self.gateway_name}.{self.quoteid}"
 
     def is_active(self) -> bool:
@@ -314,7 +337,7 @@ class SubscribeRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -334,7 +357,7 @@ class OrderRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_order_data(self, orderid: str, gateway_name: str) -> OrderData:
         """
@@ -367,7 +390,7 @@ class CancelRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -384,7 +407,7 @@ class HistoryRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -405,7 +428,7 @@ class QuoteRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_quote_data(self, quoteid: str, gateway_name: str) -> QuoteData:
         """
@@ -425,3 +448,425 @@ class QuoteRequest:
             gateway_name=gateway_name,
         )
         return quote
+
+
+def create_slots_class(data_class: type, name: str, extra_fields: list[str]) -> type:
+    """
+    Create a variant of data class using __slots__, which has the same
+    fields, methods and behaviours but costs less memory and construction
+    time. Fields generated in __post_init__ should be passed in extra_fields.
+
+    Notice: objects of slots class have no __dict__ and are not instances
+    of the original data class.
+    """
+    slots_fields: list[tuple[str, type, Field]] = []
+
+    for f in fields(data_class):
+        if f.default_factory is not MISSING:
+            new_field: Field = field(default_factory=f.default_factory, init=f.init)
+        else:
+            new_field = field(default=f.default, init=f.init)
+
+        slots_fields.append((f.name, f.type, new_field))      # type: ignore
+
+    for field_name in extra_fields:
+        slots_fields.append((field_name, str, field(init=False, repr=False, compare=False)))
+
+    namespace: dict = {
+        k: v for k, v in vars(data_class).items()
+        if callable(v) and (not k.startswith("__") or k == "__post_init__")
+    }
+    namespace["__doc__"] = data_class.__doc__
+
+    slots_class: type = make_dataclass(
+        name,
+        slots_fields,
+        namespace=namespace,
+        slots=True
+    )
+    slots_class.__module__ = __name__
+    return slots_class
+
+
+# Slots variants of data classes used in high frequency data paths
+SlotTickData = create_slots_class(TickData, "SlotTickData", ["vt_symbol"])
+SlotBarData = create_slots_class(BarData, "SlotBarData", ["vt_symbol"])
+SlotOrderData = create_slots_class(OrderData, "SlotOrderData", ["vt_symbol", "vt_orderid"])
+SlotTradeData = create_slots_class(TradeData, "SlotTradeData", ["vt_symbol", "vt_orderid", "vt_tradeid"])
+
+
+class BaseBatch:
+    """
+    Columnar container of data of one contract, each field is stored
+    as a contiguous NumPy array so that it can be converted to and from
+    Polars/Arrow without copying.
+
+    Datetime is stored as naive datetime64[us] of local time, with the
+    timezone kept in tzinfo. Row data objects are only created when
+    accessed by index or iteration.
+    """
+
+    data_class: type = BaseData
+    array_fields: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        datetime: np.ndarray | list[Datetime],
+        gateway_name: str = "",
+        tzinfo: Tzinfo | None = None,
+        **arrays: np.ndarray
+    ) -> None:
+        """
+        Missing fields are filled with zeros.
+        """
+        self.symbol: str = symbol
+        self.exchange: Exchange = exchange
+        self.gateway_name: str = gateway_name
+        self.tzinfo: Tzinfo | None = tzinfo
+        self.vt_symbol: str = get_vt_symbol(symbol, exchange)
+
+        self.datetime: np.ndarray = np.asarray(datetime, dtype="datetime64[us]")
+        count: int = len(self.datetime)
+
+        for name in self.array_fields:
+            array: np.ndarray | None = arrays.pop(name, None)
+
+            if array is None:
+                array = np.zeros(count)
+            else:
+                array = np.ascontiguousarray(array, dtype=np.float64)
+
+                if len(array) != count:
+                    raise ValueError(f"Length of {name} is {len(array)}, expected {count}")
+
+            setattr(self, name, array)
+
+        if arrays:
+            raise TypeError(f"Unknown fields: {list(arrays)}")
+
+    def __len__(self) -> int:
+        """"""
+        return len(self.datetime)
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Get data object of one row, or a new batch of a slice.
+        """
+        if isinstance(index, slice):
+            return self._create_batch(
+                self.datetime[index],
+                {name: getattr(self, name)[index] for name in self.array_fields}
+            )
+
+        dt: Datetime = self.datetime[index].item()
+        values: dict[str, float] = {
+            name: float(getattr(self, name)[index]) for name in self.array_fields
+        }
+        return self._create_data(dt, values)
+
+    def __iter__(self) -> Any:
+        """"""
+        return iter(self.to_data())
+
+    def _get_kwargs(self) -> dict:
+        """
+        Get keyword arguments except arrays for creating data or batch object.
+        """
+        return {
+            "symbol": self.symbol,
+            "exchange": self.exchange,
+            "gateway_name": self.gateway_name,
+        }
+
+    def _create_batch(self, datetime: np.ndarray, arrays: dict[str, np.ndarray]) -> Any:
+        """"""
+        kwargs: dict[str, Any] = self._get_kwargs()
+        kwargs.update(arrays)
+
+        return type(self)(datetime=datetime, tzinfo=self.tzinfo, **kwargs)
+
+    def _create_data(self, dt: Datetime, values: dict[str, float]) -> Any:
+        """"""
+        if self.tzinfo:
+            dt = dt.replace(tzinfo=self.tzinfo)
+
+        return self.data_class(datetime=dt, **self._get_kwargs(), **values)
+
+    def to_data(self) -> list:
+        """
+        Convert all rows into data objects.
+        """
+        dts: list[Datetime] = self.datetime.tolist()
+        if self.tzinfo:
+            dts = [dt.replace(tzinfo=self.tzinfo) for dt in dts]
+
+        columns: list[list[float]] = [getattr(self, name).tolist() for name in self.array_fields]
+        kwargs: dict = self._get_kwargs()
+
+        return [
+            self.data_class(datetime=dt, **kwargs, **dict(zip(self.array_fields, values, strict=True)))
+            for dt, *values in zip(dts, *columns, strict=True)
+        ]
+
+    @classmethod
+    def _from_data(cls, data: list, **kwargs: Any) -> Any:
+        """
+        Create batch from list of data objects of the same contract.
+        """
+        first: Any = data[0]
+        tzinfo: Tzinfo | None = first.datetime.tzinfo
+
+        for name in cls.array_fields:
+            kwargs[name] = np.fromiter((getattr(d, name) for d in data), dtype=np.float64, count=len(data))
+
+        return cls(
+            symbol=first.symbol,
+            exchange=first.exchange,
+            datetime=[d.datetime.replace(tzinfo=None) for d in data],
+            gateway_name=first.gateway_name,
+            tzinfo=tzinfo,
+            **kwargs
+        )
+
+    def to_polars(self) -> Any:
+        """
+        Convert into Polars DataFrame, with column names same as field names.
+        """
+        import polars as pl
+
+        columns: dict[str, np.ndarray] = {"datetime": self.datetime}
+        for name in self.array_fields:
+            columns[name] = getattr(self, name)
+
+        return pl.DataFrame(columns)
+
+    def to_arrow(self) -> Any:
+        """
+        Convert into Arrow Table, with column names same as field names.
+        """
+        import pyarrow as pa                                # type: ignore
+
+        names: list[str] = ["datetime", *self.array_fields]
+        arrays: list = [pa.array(self.datetime)]
+        arrays.extend(pa.array(getattr(self, name)) for name in self.array_fields)
+
+        return pa.Table.from_arrays(arrays, names=names)
+
+    @classmethod
+    def _get_columns(cls, df: Any, columns: dict[str, str] | None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Get NumPy arrays from DataFrame or Table, columns is the mapping
+        from field name to column name if they are different.
+        """
+        if not columns:
+            columns = {}
+
+        def get_array(name: str) -> np.ndarray:
+            column: Any = df[columns.get(name, name)]
+            if hasattr(column, "combine_chunks"):
+                column = column.combine_chunks()
+
+            array: np.ndarray = column.to_numpy()
+            return array
+
+        if hasattr(df, "column_names"):
+            names: list[str] = df.column_names
+        else:
+            names = df.columns
+        arrays: dict[str, np.ndarray] = {}
+
+        for name in cls.array_fields:
+            if columns.get(name, name) in names:
+                arrays[name] = get_array(name)
+
+        return get_array("datetime"), arrays
+
+
+class BarBatch(BaseBatch):
+    """
+    Columnar container of candlestick bar data of one contract.
+    """
+
+    data_class: type = BarData
+    array_fields: tuple[str, ...] = (
+        "open_price",
+        "high_price",
+        "low_price",
+        "close_price",
+        "volume",
+        "turnover",
+        "open_interest",
+    )
+
+    open_price: np.ndarray
+    high_price: np.ndarray
+    low_price: np.ndarray
+    close_price: np.ndarray
+    volume: np.ndarray
+    turnover: np.ndarray
+    open_interest: np.ndarray
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        datetime: np.ndarray | list[Datetime],
+        interval: Interval | None = None,
+        gateway_name: str = "",
+        tzinfo: Tzinfo | None = None,
+        **arrays: np.ndarray
+    ) -> None:
+        """"""
+        super().__init__(symbol, exchange, datetime, gateway_name, tzinfo, **arrays)
+
+        self.interval: Interval | None = interval
+
+    def _get_kwargs(self) -> dict:
+        """"""
+        kwargs: dict = super()._get_kwargs()
+        kwargs["interval"] = self.interval
+        return kwargs
+
+    def to_bars(self) -> list[BarData]:
+        """
+        Convert into list of bar data.
+        """
+        return self.to_data()
+
+    @classmethod
+    def from_bars(cls, bars: list[BarData]) -> "BarBatch":
+        """
+        Create batch from list of bar data.
+        """
+        batch: BarBatch = cls._from_data(bars, interval=bars[0].interval)
+        return batch
+
+    @classmethod
+    def from_polars(
+        cls,
+        df: Any,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval | None = None,
+        gateway_name: str = "",
+        tzinfo: Tzinfo | None = None,
+        columns: dict[str, str] | None = None
+    ) -> "BarBatch":
+        """
+        Create batch from Polars DataFrame or Arrow Table. Use columns to
+        map field names to different column names, e.g. {"open_price": "open"}.
+        """
+        datetime, arrays = cls._get_columns(df, columns)
+        return cls(symbol, exchange, datetime, interval, gateway_name, tzinfo, **arrays)
+
+    from_arrow = from_polars
+
+
+class TickBatch(BaseBatch):
+    """
+    Columnar container of tick data of one contract.
+
+    Only numeric fields are stored, name and localtime are not kept.
+    """
+
+    data_class: type = TickData
+    array_fields: tuple[str, ...] = (
+        "volume",
+        "turnover",
+        "open_interest",
+        "last_price",
+        "last_volume",
+        "limit_up",
+        "limit_down",
+        "open_price",
+        "high_price",
+        "low_price",
+        "pre_close",
+        "bid_price_1",
+        "bid_price_2",
+        "bid_price_3",
+        "bid_price_4",
+        "bid_price_5",
+        "ask_price_1",
+        "ask_price_2",
+        "ask_price_3",
+        "ask_price_4",
+        "ask_price_5",
+        "bid_volume_1",
+        "bid_volume_2",
+        "bid_volume_3",
+        "bid_volume_4",
+        "bid_volume_5",
+        "ask_volume_1",
+        "ask_volume_2",
+        "ask_volume_3",
+        "ask_volume_4",
+        "ask_volume_5",
+    )
+
+    volume: np.ndarray
+    turnover: np.ndarray
+    open_interest: np.ndarray
+    last_price: np.ndarray
+    last_volume: np.ndarray
+    limit_up: np.ndarray
+    limit_down: np.ndarray
+    open_price: np.ndarray
+    high_price: np.ndarray
+    low_price: np.ndarray
+    pre_close: np.ndarray
+    bid_price_1: np.ndarray
+    bid_price_2: np.ndarray
+    bid_price_3: np.ndarray
+    bid_price_4: np.ndarray
+    bid_price_5: np.ndarray
+    ask_price_1: np.ndarray
+    ask_price_2: np.ndarray
+    ask_price_3: np.ndarray
+    ask_price_4: np.ndarray
+    ask_price_5: np.ndarray
+    bid_volume_1: np.ndarray
+    bid_volume_2: np.ndarray
+    bid_volume_3: np.ndarray
+    bid_volume_4: np.ndarray
+    bid_volume_5: np.ndarray
+    ask_volume_1: np.ndarray
+    ask_volume_2: np.ndarray
+    ask_volume_3: np.ndarray
+    ask_volume_4: np.ndarray
+    ask_volume_5: np.ndarray
+
+    def to_ticks(self) -> list[TickData]:
+        """
+        Convert into list of tick data.
+        """
+        return self.to_data()
+
+    @classmethod
+    def from_ticks(cls, ticks: list[TickData]) -> "TickBatch":
+        """
+        Create batch from list of tick data.
+        """
+        batch: TickBatch = cls._from_data(ticks)
+        return batch
+
+    @classmethod
+    def from_polars(
+        cls,
+        df: Any,
+        symbol: str,
+        exchange: Exchange,
+        gateway_name: str = "",
+        tzinfo: Tzinfo | None = None,
+        columns: dict[str, str] | None = None
+    ) -> "TickBatch":
+        """
+        Create batch from Polars DataFrame or Arrow Table. Use columns to
+        map field names to different column names.
+        """
+        datetime, arrays = cls._get_columns(df, columns)
+        return cls(symbol, exchange, datetime, gateway_name, tzinfo, **arrays)
+
+    from_arrow = from_polars
@@ -0,0 +1,265 @@
+"""
+Contract registry with indexes for fast filtered queries.
+"""
+
+import pickle
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+
+from .constant import Exchange, Product
+from .object import ContractData
+from .utility import get_folder_path
+
+
+GRAM_SIZE: int = 3
+
+
+def get_grams(text: str) -> set[str]:
+    """
+    Get all substrings of gram size in text.
+    """
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class ContractRegistry:
+    """
+    Store of all contract data, indexed by exchange, product, gateway,
+    option underlying and option expiry date.
+
+    Symbol prefix queries run on a sorted vt_symbol column, which is
+    rebuilt lazily after new contracts are added. Keyword queries use an
+    index of 3-character substrings, and only keywords shorter than that
+    scan all vt_symbols.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.contracts: dict[str, ContractData] = {}
+
+        # Indexes: key -> set of vt_symbol
+        self.exchange_index: dict[Exchange, set[str]] = {}
+        self.product_index: dict[Product, set[str]] = {}
+        self.gateway_index: dict[str, set[str]] = {}
+        self.underlying_index: dict[str, set[str]] = {}
+        self.expiry_index: dict[date, set[str]] = {}
+
+        # Search indexes
+        self.sorted_symbols: list[str] = []
+        self.dirty: bool = False
+        self.gram_index: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """"""
+        return len(self.contracts)
+
+    def add(self, contract: ContractData) -> None:
+        """
+        Add new contract or replace old one with the same vt_symbol.
+        """
+        vt_symbol: str = contract.vt_symbol
+
+        old: ContractData | None = self.contracts.get(vt_symbol, None)
+        if old:
+            self.update_indexes(old, False)
+        else:
+            self.dirty = True
+
+            for gram in get_grams(vt_symbol):
+                self.gram_index.setdefault(gram, set()).add(vt_symbol)
+
+        self.contracts[vt_symbol] = contract
+        self.update_indexes(contract, True)
+
+    def update_indexes(self, contract: ContractData, add: bool) -> None:
+        """"""
+        keys: list[tuple[dict, object]] = [
+            (self.exchange_index, contract.exchange),
+            (self.product_index, contract.product),
+            (self.gateway_index, contract.gateway_name),
+        ]
+
+        if contract.option_underlying:
+            keys.append((self.underlying_index, contract.option_underlying))
+
+        if contract.option_expiry:
+            keys.append((self.expiry_index, contract.option_expiry.date()))
+
+        for index, key in keys:
+            if add:
+                index.setdefault(key, set()).add(contract.vt_symbol)
+            else:
+                vt_symbols: set[str] = index[key]
+                vt_symbols.discard(contract.vt_symbol)
+                if not vt_symbols:
+                    index.pop(key)
+
+    def get(self, vt_symbol: str) -> ContractData | None:
+        """
+        Get contract data by vt_symbol.
+        """
+        return self.contracts.get(vt_symbol, None)
+
+    def get_all(self) -> list[ContractData]:
+        """
+        Get all contract data.
+        """
+        return list(self.contracts.values())
+
+    def build_columns(self) -> None:
+        """
+        Rebuild sorted vt_symbol column for searching.
+        """
+        self.sorted_symbols = sorted(self.contracts)
+        self.dirty = False
+
+    def search_prefix(self, prefix: str) -> list[str]:
+        """
+        Get vt_symbols starting with prefix.
+        """
+        if self.dirty:
+            self.build_columns()
+
+        # Symbols with the prefix are sorted right after the prefix itself
+        start: int = bisect_left(self.sorted_symbols, prefix)
+        end: int = bisect_right(self.sorted_symbols, prefix + "\uffff", lo=start)
+        return self.sorted_symbols[start:end]
+
+    def search_keyword(self, keyword: str) -> list[str]:
+        """
+        Get vt_symbols containing keyword.
+        """
+        if len(keyword) < GRAM_SIZE:
+            if self.dirty:
+                self.build_columns()
+            return [vt_symbol for vt_symbol in self.sorted_symbols if keyword in vt_symbol]
+
+        # Symbols containing keyword contain all its grams as well
+        gram_sets: list[set[str]] = []
+        for gram in get_grams(keyword):
+            vt_symbols: set[str] | None = self.gram_index.get(gram, None)
+            if not vt_symbols:
+                return []
+            gram_sets.append(vt_symbols)
+
+        gram_sets.sort(key=len)
+        candidates: set[str] = gram_sets[0].intersection(*gram_sets[1:])
+
+        return sorted(vt_symbol for vt_symbol in candidates if keyword in vt_symbol)
+
+    def query(
+        self,
+        exchange: Exchange | None = None,
+        product: Product | None = None,
+        gateway_name: str = "",
+        underlying: str = "",
+        expiry: date | None = None,
+        prefix: str = "",
+        keyword: str = ""
+    ) -> list[ContractData]:
+        """
+        Query contracts matching all of the specified conditions, all
+        contracts are returned if no condition specified.
+        """
+        candidates: list[set[str]] = []
+        searched: list[str] = []
+
+        conditions: list[tuple[dict, object]] = [
+            (self.exchange_index, exchange),
+            (self.product_index, product),
+            (self.gateway_index, gateway_name),
+            (self.underlying_index, underlying),
+            (self.expiry_index, expiry),
+        ]
+        for index, key in conditions:
+            if key:
+                candidates.append(index.get(key, set()))
+
+        if prefix:
+            searched = self.search_prefix(prefix)
+
+        if keyword:
+            if prefix:
+                searched = [vt_symbol for vt_symbol in searched if keyword in vt_symbol]
+            else:
+                searched = self.search_keyword(keyword)
+
+        if not candidates and not (prefix or keyword):
+            return self.get_all()
+
+        # Search result is already sorted and needs no intersection
+        vt_symbols: list[str]
+        if not candidates:
+            vt_symbols = searched
+        else:
+            if prefix or keyword:
+                candidates.append(set(searched))
+
+            # Start intersection from the smallest set
+            candidates.sort(key=len)
+            vt_symbols = sorted(candidates[0].intersection(*candidates[1:]))
+
+        return [self.contracts[vt_symbol] for vt_symbol in vt_symbols]
+
+    def get_option_chain(self, underlying: str, expiry: date | None = None) -> list[ContractData]:
+        """
+        Get options of underlying vt_symbol, sorted by expiry, strike and type.
+        """
+        options: list[ContractData] = self.query(underlying=underlying, expiry=expiry)
+
+        # Use expiry date since timezone of expiry datetime may differ
+        options.sort(key=lambda c: (
+            c.option_expiry.date() if c.option_expiry else date.min,
+            c.option_strike or 0,
+            c.option_type.value if c.option_type else "")
+        )
+        return options
+
+    def get_option_expiries(self, underlying: str) -> list[date]:
+        """
+        Get all option expiry dates of underlying vt_symbol.
+        """
+        expiries: set[date] = set()
+
+        for vt_symbol in self.underlying_index.get(underlying, set()):
+            contract: ContractData = self.contracts[vt_symbol]
+            if contract.option_expiry:
+                expiries.add(contract.option_expiry.date())
+
+        return sorted(expiries)
+
+    def save(self, filename: str) -> None:
+        """
+        Save all contracts into cache file.
+        """
+        file_path: Path = get_folder_path("contract").joinpath(filename)
+        temp_path: Path = file_path.with_suffix(".tmp")
+
+        with open(temp_path, "wb") as f:
+            pickle.dump((date.today(), self.contracts), f, pickle.HIGHEST_PROTOCOL)
+
+        temp_path.replace(file_path)
+
+    def load(self, filename: str) -> int:
+        """
+        Load contracts from cache file saved today, return number of
+        contracts loaded.
+        """
+        file_path: Path = get_folder_path("contract").joinpath(filename)
+        if not file_path.exists():
+            return 0
+
+        try:
+            with open(file_path, "rb") as f:
+                cache_date, contracts = pickle.load(f)
+        except Exception:
+            return 0
+
+        # Contracts may be listed or expired every day
+        if cache_date != date.today():
+            return 0
+
+        for contract in contracts.values():
+            self.add(contract)
+
+        return len(contracts)
@@ -12,6 +12,8 @@ SETTINGS: dict = {
     "font.family": "微软雅黑",
     "font.size": 12,
 
+    "ui.tick_conflation": 0.05,
+
     "log.active": True,
     "log.level": CRITICAL,
     "log.console": True,
@@ -24,6 +26,23 @@ SETTINGS: dict = {
     "email.sender": "",
     "email.receiver": "",
 
+    "oms.retention_count": 0,
+    "oms.retention_minutes": 0,
+    "oms.snapshot_interval": 0,
+    "oms.reconcile_delay": 60,
+    "oms.trading_day_hour": 17,
+    "oms.contract_cache": False,
+
+    "risk.active": False,
+    "risk.flow_seconds": 1,
+    "risk.order_flow_limit": 50,
+    "risk.cancel_flow_limit": 50,
+    "risk.order_size_limit": 100,
+    "risk.order_notional_limit": 0,
+    "risk.active_notional_limit": 0,
+    "risk.position_limit": 0,
+    "risk.self_trade_check": True,
+
     "datafeed.name": "",
     "datafeed.username": "",
     "datafeed.password": "",
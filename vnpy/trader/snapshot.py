@@ -0,0 +1,158 @@
+"""
+Snapshot and journal of engine state for fast restart.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from collections.abc import Callable
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, BinaryIO
+
+from .logger import logger
+from .utility import TEMP_DIR
+
+
+class SnapshotStore:
+    """
+    Stores a full snapshot of state in one file, and a journal of
+    events received since the snapshot in another file.
+
+    Snapshot is written to a temp file first and then renamed, so that
+    a crash during saving never leaves a broken snapshot.
+
+    Serialization and file writing run in a background thread, so the
+    caller should pass state not modified afterwards. Journal is flushed
+    when there is no more record waiting to be written. Failed task is
+    logged without stopping the thread, and tasks put after close are
+    ignored.
+    """
+
+    def __init__(self, name: str) -> None:
+        """"""
+        # Folder is created when snapshot is first saved
+        self.folder_path: Path = TEMP_DIR.joinpath("snapshot")
+
+        self.snapshot_path: Path = self.folder_path.joinpath(f"{name}_snapshot.pkl")
+        self.journal_path: Path = self.folder_path.joinpath(f"{name}_journal.pkl")
+
+        self.journal: BinaryIO | None = None
+
+        # Thread is started when first task is put
+        self.queue: Queue = Queue()
+        self.thread: Thread | None = None
+        self.lock: Lock = Lock()
+        self.closed: bool = False
+
+    def load(self) -> tuple[Any, list[tuple[str, Any]]]:
+        """
+        Load snapshot state and journal records, state is None if no valid
+        snapshot. Journal records after a broken one (e.g. partially written
+        before crash) are dropped.
+        """
+        state: Any = None
+        records: list[tuple[str, Any]] = []
+
+        if not self.snapshot_path.exists():
+            return state, records
+
+        # Journal is useless without the snapshot it based on
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception:
+            return state, records
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                while True:
+                    try:
+                        records.append(pickle.load(f))
+                    except Exception:
+                        break
+
+        return state, records
+
+    def save_snapshot(self, state: Any) -> None:
+        """
+        Save snapshot state and start a new journal.
+        """
+        self.put_task(self.write_snapshot, state)
+
+    def write_journal(self, type: str, data: Any) -> None:
+        """
+        Append event record into journal.
+        """
+        self.put_task(self.write_record, (type, data))
+
+    def put_task(self, func: Callable[[Any], None], data: Any) -> None:
+        """"""
+        with self.lock:
+            if self.closed:
+                return
+
+            if not self.thread:
+                self.thread = Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+            self.queue.put((func, data))
+
+    def run(self) -> None:
+        """
+        Write snapshots and journal records in background thread.
+        """
+        while True:
+            task: tuple | None = self.queue.get()
+            if not task:
+                break
+
+            func, data = task
+            try:
+                func(data)
+
+                if self.journal and self.queue.empty():
+                    self.journal.flush()
+            except Exception:
+                logger.exception(f"Snapshot task {func.__name__} failed")
+
+        if self.journal:
+            self.journal.close()
+            self.journal = None
+
+    def write_snapshot(self, state: Any) -> None:
+        """"""
+        self.folder_path.mkdir(exist_ok=True)
+        temp_path: Path = self.snapshot_path.with_suffix(".tmp")
+
+        with open(temp_path, "wb") as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, self.snapshot_path)
+
+        if self.journal:
+            self.journal.close()
+        self.journal = open(self.journal_path, "wb")
+
+    def write_record(self, record: tuple[str, Any]) -> None:
+        """"""
+        if not self.journal:
+            self.journal = open(self.journal_path, "ab")
+
+        pickle.dump(record, self.journal, pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        """
+        Wait until all tasks written and then stop the thread.
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+
+            thread: Thread | None = self.thread
+            if thread:
+                self.queue.put(None)
+
+        if thread:
+            thread.join()
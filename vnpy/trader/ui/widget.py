@@ -430,6 +430,13 @@ class TickMonitor(BaseMonitor):
         "gateway_name": {"display": _("接口"), "cell": BaseCell, "update": False},
     }
 
+    def register_event(self) -> None:
+        """
+        Receive ticks conflated by window in setting.
+        """
+        self.event_type = self.main_engine.subscribe_conflated_tick(SETTINGS["ui.tick_conflation"])
+        super().register_event()
+
 
 class LogMonitor(BaseMonitor):
     """
@@ -856,7 +863,9 @@ class TradingWidget(QtWidgets.QWidget):
     def register_event(self) -> None:
         """"""
         self.signal_tick.connect(self.process_tick_event)
-        self.event_engine.register(EVENT_TICK, self.signal_tick.emit)
+
+        tick_type: str = self.main_engine.subscribe_conflated_tick(SETTINGS["ui.tick_conflation"])
+        self.event_engine.register(tick_type, self.signal_tick.emit)
 
     def process_tick_event(self, event: Event) -> None:
         """"""
@@ -1139,13 +1148,7 @@ class ContractManager(QtWidgets.QWidget):
         """
         flt: str = str(self.filter_line.text())
 
-        all_contracts: list[ContractData] = self.main_engine.get_all_contracts()
-        if flt:
-            contracts: list[ContractData] = [
-                contract for contract in all_contracts if flt in contract.vt_symbol
-            ]
-        else:
-            contracts = all_contracts
+        contracts: list[ContractData] = self.main_engine.query_contracts(keyword=flt)
 
         self.contract_table.clearContents()
         self.contract_table.setRowCount(len(contracts))
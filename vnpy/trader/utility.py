@@ -4,9 +4,12 @@ General utility functions.
 
 import json
 import sys
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from collections.abc import Callable
+from functools import wraps
+from inspect import Parameter, signature
+from typing import Any, TypeVar, cast
 from decimal import Decimal
 from math import floor, ceil
 
@@ -14,11 +17,24 @@ import numpy as np
 import talib
 from zoneinfo import ZoneInfo, available_timezones      # noqa
 
-from .object import BarData, TickData
+from .object import BarData, TickData, BarBatch, TickBatch, get_vt_symbol
+from .indicator import (
+    IncrementalIndicator,
+    SmaIndicator,
+    StdIndicator,
+    EmaIndicator,
+    AtrIndicator,
+    RsiIndicator,
+    MacdIndicator
+)
 from .constant import Exchange, Interval
 from .locale import _
 
 
+IndicatorType = TypeVar("IndicatorType", bound=IncrementalIndicator)
+FunctionType = TypeVar("FunctionType", bound=Callable)
+
+
 def extract_vt_symbol(vt_symbol: str) -> tuple[str, Exchange]:
     """
     :return: (symbol, exchange)
@@ -31,7 +47,7 @@ def generate_vt_symbol(symbol: str, exchange: Exchange) -> str:
     """
     return vt_symbol
     """
-    return f"{symbol}.{exchange.value}"
+    return get_vt_symbol(symbol, exchange)
 
 
 def _get_trader_dir(temp_name: str) -> tuple[Path, Path]:
@@ -146,6 +162,13 @@ def ceil_to(value: float, target: float) -> float:
     return result
 
 
+def get_day_seconds(t: time) -> float:
+    """
+    Get seconds since midnight of time.
+    """
+    return t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1_000_000
+
+
 def get_digits(value: float) -> int:
     """
     Get number of digits after decimal point.
@@ -162,6 +185,41 @@ def get_digits(value: float) -> int:
         return 0
 
 
+def reduce_bar_arrays(
+    arrays: dict[str, np.ndarray],
+    starts: np.ndarray,
+    count: int
+) -> dict[str, np.ndarray]:
+    """
+    Aggregate bar arrays by groups beginning at starts, and return the
+    first count groups.
+    """
+    if not count:
+        return {name: np.zeros(0) for name in arrays}
+
+    # Groups after the first count ones are also reduced as boundary
+    starts = starts[:count + 1]
+    ends: np.ndarray = np.append(starts[1:], len(arrays["close_price"]))[:count] - 1
+
+    return {
+        "open_price": arrays["open_price"][starts[:count]],
+        "high_price": np.maximum.reduceat(arrays["high_price"], starts)[:count],
+        "low_price": np.minimum.reduceat(arrays["low_price"], starts)[:count],
+        "close_price": arrays["close_price"][ends],
+        "volume": np.add.reduceat(arrays["volume"], starts)[:count],
+        "turnover": np.add.reduceat(arrays["turnover"], starts)[:count],
+        "open_interest": arrays["open_interest"][ends],
+    }
+
+
+def get_change(data: np.ndarray) -> np.ndarray:
+    """
+    Get non-negative change of cumulative tick data, 0 for the first tick.
+    """
+    change: np.ndarray = np.diff(data, prepend=data[:1])
+    return change.clip(min=0)
+
+
 class BarGenerator:
     """
     For:
@@ -170,6 +228,7 @@ class BarGenerator:
     Notice:
     1. for x minute bar, x must be able to divide 60: 2, 3, 5, 6, 10, 15, 20, 30
     2. for x hour bar, x can be any number
+    3. for other windows or trading sessions, use TimeBarGenerator
     """
 
     def __init__(
@@ -483,27 +542,614 @@ class BarGenerator:
         self.bar = None
         return bar
 
+    def generate_bars(self, ticks: TickBatch) -> BarBatch:
+        """
+        Generate 1 minute bars from tick batch in one go, which gives the
+        same bars as calling update_tick with each tick. The last minute
+        bar is not included as it is not finished yet.
+
+        Tick data in Polars DataFrame can be converted with TickBatch.from_polars.
+        The batch is processed independently of the streaming state.
+        """
+        # Filter tick data with 0 last price
+        mask: np.ndarray = ticks.last_price != 0
+        dt: np.ndarray = ticks.datetime[mask]
+        last_price: np.ndarray = ticks.last_price[mask]
+        high_price: np.ndarray = ticks.high_price[mask]
+        low_price: np.ndarray = ticks.low_price[mask]
+
+        # New minute bar starts when hour or minute changed
+        minutes: np.ndarray = dt.astype("datetime64[m]").astype(np.int64) % 1440
+        starts: np.ndarray = np.flatnonzero(np.diff(minutes, prepend=-1))
+        first: np.ndarray = np.zeros(len(dt), dtype=bool)
+        first[starts] = True
+
+        # Daily high/low only used when changed since last tick
+        high_change: np.ndarray = np.diff(high_price, prepend=np.inf) > 0
+        low_change: np.ndarray = np.diff(low_price, prepend=-np.inf) < 0
+
+        arrays: dict[str, np.ndarray] = {
+            "open_price": last_price,
+            "high_price": np.where(
+                high_change & ~first,
+                np.maximum(last_price, high_price),
+                last_price
+            ),
+            "low_price": np.where(
+                low_change & ~first,
+                np.minimum(last_price, low_price),
+                last_price
+            ),
+            "close_price": last_price,
+            "volume": get_change(ticks.volume[mask]),
+            "turnover": get_change(ticks.turnover[mask]),
+            "open_interest": ticks.open_interest[mask],
+        }
+
+        # Last minute bar is not finished
+        count: int = max(len(starts) - 1, 0)
+        ends: np.ndarray = starts[1:] - 1
+
+        return BarBatch(
+            ticks.symbol,
+            ticks.exchange,
+            dt[ends].astype("datetime64[m]"),
+            Interval.MINUTE,
+            ticks.gateway_name,
+            ticks.tzinfo,
+            **reduce_bar_arrays(arrays, starts, count)
+        )
+
+    def generate_window_bars(self, bars: BarBatch) -> BarBatch:
+        """
+        Generate x minute/x hour/daily bars from 1 minute bar batch in one
+        go, which gives the same bars as calling update_bar with each bar.
+        Bars not finished at the end of batch are not included.
+
+        Bar data in Polars DataFrame can be converted with BarBatch.from_polars.
+        The batch is processed independently of the streaming state.
+        """
+        dt: np.ndarray = bars.datetime
+        size: int = len(dt)
+
+        arrays: dict[str, np.ndarray] = {
+            name: getattr(bars, name) for name in BarBatch.array_fields
+        }
+
+        if self.interval == Interval.MINUTE:
+            # Window bar finished when minute + 1 can be divided by window
+            minutes: np.ndarray = dt.astype("datetime64[m]").astype(np.int64) % 60
+            ends: np.ndarray = np.flatnonzero((minutes + 1) % self.window == 0)
+            starts: np.ndarray = np.concatenate(([0], ends + 1))
+            starts = starts[starts < size]
+
+            window_dt: np.ndarray = dt[starts[:len(ends)]].astype("datetime64[m]")
+            window_arrays: dict[str, np.ndarray] = reduce_bar_arrays(arrays, starts, len(ends))
+
+        elif self.interval == Interval.HOUR:
+            window_dt, window_arrays = self.generate_hour_arrays(dt, arrays)
+
+            if self.window > 1:
+                starts = np.arange(0, len(window_dt), self.window)
+                count: int = len(window_dt) // self.window
+
+                window_dt = window_dt[starts[:count]]
+                window_arrays = reduce_bar_arrays(window_arrays, starts, count)
+
+        else:
+            # Daily bar finished when time of bar equals to daily end
+            daily_end: time = cast(time, self.daily_end)
+            end_delta: np.timedelta64 = np.timedelta64(
+                ((daily_end.hour * 60 + daily_end.minute) * 60 + daily_end.second) * 1_000_000
+                + daily_end.microsecond,
+                "us"
+            )
+
+            days: np.ndarray = dt.astype("datetime64[D]")
+            ends = np.flatnonzero(dt - days == end_delta)
+            starts = np.concatenate(([0], ends + 1))
+            starts = starts[starts < size]
+
+            window_dt = days[ends]
+            window_arrays = reduce_bar_arrays(arrays, starts, len(ends))
+
+        return BarBatch(
+            bars.symbol,
+            bars.exchange,
+            window_dt,
+            None,
+            bars.gateway_name,
+            bars.tzinfo,
+            **window_arrays
+        )
+
+    def generate_hour_arrays(
+        self,
+        dt: np.ndarray,
+        arrays: dict[str, np.ndarray]
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Aggregate 1 minute bar arrays into 1 hour bar arrays, with the
+        same rules as update_bar_hour_window.
+        """
+        size: int = len(dt)
+        if not size:
+            return dt, reduce_bar_arrays(arrays, np.array([], dtype=np.int64), 0)
+
+        index: np.ndarray = np.arange(size)
+        minutes: np.ndarray = dt.astype("datetime64[m]").astype(np.int64) % 60
+        hours: np.ndarray = dt.astype("datetime64[h]").astype(np.int64) % 24
+
+        # Bar of minute 59 finishes hour bar, unless it starts a new one
+        # because last hour bar was just finished. So in a run of minute
+        # 59 bars, every second bar finishes hour bar.
+        is_59: np.ndarray = minutes == 59
+        run_first: np.ndarray = is_59 & ~np.concatenate(([False], is_59[:-1]))
+        run_start: np.ndarray = np.maximum.accumulate(np.where(run_first, index, 0))
+        offset: np.ndarray = index - run_start
+        finished: np.ndarray = is_59 & ((offset % 2 == 0) == (run_start > 0))
+
+        # New hour bar starts after last hour bar finished, or when hour changed
+        pre_finished: np.ndarray = np.concatenate(([True], finished[:-1]))
+        hour_changed: np.ndarray = np.concatenate(([True], hours[1:] != hours[:-1]))
+        start_flags: np.ndarray = pre_finished | (~is_59 & hour_changed)
+        starts: np.ndarray = np.flatnonzero(start_flags)
+
+        # Last hour bar is only pushed if finished by minute 59 bar
+        count: int = len(starts) - 1 + int(finished[-1])
+
+        hour_dt: np.ndarray = dt[starts[:count]].astype("datetime64[h]")
+        return hour_dt, reduce_bar_arrays(arrays, starts, count)
+
+
+class BaseBarGenerator:
+    """
+    Base class of generators aggregating tick data or smaller bars
+    into bars, with the same aggregation rules as BarGenerator.
+    """
+
+    def __init__(self, on_bar: Callable) -> None:
+        """Constructor"""
+        self.on_bar: Callable = on_bar
+
+        self.bar: BarData | None = None
+        self.last_tick: TickData | None = None
+
+    def new_tick_bar(self, tick: TickData, dt: datetime) -> None:
+        """
+        Create new bar from tick data.
+        """
+        self.bar = BarData(
+            symbol=tick.symbol,
+            exchange=tick.exchange,
+            datetime=dt,
+            gateway_name=tick.gateway_name,
+            open_price=tick.last_price,
+            high_price=tick.last_price,
+            low_price=tick.last_price,
+            close_price=tick.last_price,
+            open_interest=tick.open_interest
+        )
+
+    def merge_tick(self, bar: BarData, tick: TickData) -> None:
+        """
+        Update tick data into existing bar.
+        """
+        bar.high_price = max(bar.high_price, tick.last_price)
+        if self.last_tick and tick.high_price > self.last_tick.high_price:
+            bar.high_price = max(bar.high_price, tick.high_price)
+
+        bar.low_price = min(bar.low_price, tick.last_price)
+        if self.last_tick and tick.low_price < self.last_tick.low_price:
+            bar.low_price = min(bar.low_price, tick.low_price)
+
+        bar.close_price = tick.last_price
+        bar.open_interest = tick.open_interest
+
+    def merge_tick_change(self, bar: BarData, tick: TickData) -> None:
+        """
+        Update volume and turnover change since last tick into bar.
+        """
+        if self.last_tick:
+            volume_change: float = tick.volume - self.last_tick.volume
+            bar.volume += max(volume_change, 0)
+
+            turnover_change: float = tick.turnover - self.last_tick.turnover
+            bar.turnover += max(turnover_change, 0)
+
+        self.last_tick = tick
+
+    def new_bar_bar(self, bar: BarData, dt: datetime) -> None:
+        """
+        Create new bar from smaller bar.
+        """
+        self.bar = BarData(
+            symbol=bar.symbol,
+            exchange=bar.exchange,
+            datetime=dt,
+            gateway_name=bar.gateway_name,
+            open_price=bar.open_price,
+            high_price=bar.high_price,
+            low_price=bar.low_price,
+            close_price=bar.close_price,
+            volume=bar.volume,
+            turnover=bar.turnover,
+            open_interest=bar.open_interest
+        )
+
+    def merge_bar(self, bar: BarData) -> None:
+        """
+        Update smaller bar into existing bar.
+        """
+        if not self.bar:
+            return
+
+        self.bar.high_price = max(self.bar.high_price, bar.high_price)
+        self.bar.low_price = min(self.bar.low_price, bar.low_price)
+        self.bar.close_price = bar.close_price
+        self.bar.volume += bar.volume
+        self.bar.turnover += bar.turnover
+        self.bar.open_interest = bar.open_interest
+
+    def generate(self) -> BarData | None:
+        """
+        Generate the bar data and call callback immediately.
+        """
+        bar: BarData | None = self.bar
+
+        if bar:
+            self.on_bar(bar)
+
+        self.bar = None
+        return bar
+
+
+class TimeBarGenerator(BaseBarGenerator):
+    """
+    For generating bars of any time window, e.g. 10 seconds, 7 minutes
+    or 90 minutes, from tick data or smaller bars.
+
+    Without sessions, windows are aligned to midnight of each day. With
+    trading sessions given as list of (start, end) times in trading day
+    order, e.g. [(time(21), time(23)), (time(9), time(10, 15)), ...],
+    windows are counted in trading time continuously across breaks, and
+    the last window is closed at end of the last session. Sessions can
+    cross midnight, and data outside sessions is ignored. Tick data at
+    the end time of a session is included in the last window.
+
+    Bar datetime is the start time of the window.
+    """
+
+    def __init__(
+        self,
+        on_bar: Callable,
+        window: timedelta,
+        sessions: list[tuple[time, time]] | None = None,
+        bar_period: timedelta = timedelta(minutes=1)
+    ) -> None:
+        """
+        bar_period is the length of bars passed into update_bar.
+        """
+        super().__init__(on_bar)
+
+        self.window: float = window.total_seconds()
+        self.bar_period: timedelta = bar_period
+
+        if not sessions:
+            sessions = [(time(0), time(0))]
+
+        # Session data: start of day seconds, length, trading offset, wall offset
+        self.sessions: list[tuple[float, float, float, float]] = []
+
+        trading_offset: float = 0
+        first_start: float = get_day_seconds(sessions[0][0])
+
+        for start, end in sessions:
+            start_seconds: float = get_day_seconds(start)
+            length: float = (get_day_seconds(end) - start_seconds) % 86400 or 86400
+            wall_offset: float = (start_seconds - first_start) % 86400
+
+            self.sessions.append((start_seconds, length, trading_offset, wall_offset))
+            trading_offset += length
+
+        self.total: float = trading_offset
+        self.last_index: int = ceil(self.total / self.window) - 1
+
+        self.start_dt: datetime | None = None
+        self.end_dt: datetime | None = None
+        self.valid_dt: datetime | None = None
+
+    def get_window(self, dt: datetime, inclusive: bool) -> tuple[datetime, datetime, datetime] | None:
+        """
+        Get start and end datetime of the window which dt belongs to, and
+        the datetime until which later data is still in the same window.
+        Return None if dt is out of trading sessions.
+
+        If inclusive, end time of session is also in the session, which
+        is used for tick data.
+        """
+        seconds: float = get_day_seconds(dt.time())
+
+        for start_seconds, length, trading_offset, wall_offset in self.sessions:
+            elapsed: float = (seconds - start_seconds) % 86400
+
+            if elapsed < length or (inclusive and elapsed == length):
+                offset: float = trading_offset + elapsed
+                wall: float = wall_offset + elapsed
+                session_end: float = wall_offset + length
+                break
+        else:
+            return None
+
+        # Data at end of session belongs to the window before
+        if elapsed == length:
+            index: int = ceil(offset / self.window) - 1
+        else:
+            index = int(offset // self.window)
+        index = min(index, self.last_index)
+        start_offset: float = index * self.window
+        end_offset: float = min(start_offset + self.window, self.total)
+
+        start_wall: float = self.get_wall_offset(start_offset, False)
+        end_wall: float = self.get_wall_offset(end_offset, True)
+
+        start_dt: datetime = dt - timedelta(seconds=wall - start_wall)
+        end_dt: datetime = dt + timedelta(seconds=end_wall - wall)
+        valid_dt: datetime = dt + timedelta(seconds=min(end_wall, session_end) - wall)
+        return start_dt, end_dt, valid_dt
+
+    def get_wall_offset(self, offset: float, end: bool) -> float:
+        """
+        Convert trading time offset to wall clock offset from start
+        of the first session.
+        """
+        for _start_seconds, length, trading_offset, wall_offset in self.sessions:
+            elapsed: float = offset - trading_offset
+
+            if (0 <= elapsed < length) or (end and elapsed == length):
+                return wall_offset + elapsed
+
+        return self.sessions[-1][3] + self.sessions[-1][1]
+
+    def check_window(self, dt: datetime, inclusive: bool) -> bool | None:
+        """
+        Check if dt belongs to a new window, and push finished bar if so.
+        Return None if dt is out of trading sessions.
+        """
+        # Fast path for data within current window and session
+        if self.bar and self.start_dt and self.valid_dt and self.start_dt <= dt < self.valid_dt:
+            return False
+
+        window: tuple[datetime, datetime, datetime] | None = self.get_window(dt, inclusive)
+        if not window:
+            return None
+
+        if self.bar and window[0] == self.start_dt:
+            return False
+
+        if self.bar:
+            self.generate()
+
+        self.start_dt, self.end_dt, self.valid_dt = window
+        return True
+
+    def update_tick(self, tick: TickData) -> None:
+        """
+        Update new tick data into generator.
+        """
+        # Filter tick data with 0 last price
+        if not tick.last_price:
+            return
+
+        new_window: bool | None = self.check_window(tick.datetime, True)
+        if new_window is None:
+            return
+
+        if new_window or not self.bar:
+            self.new_tick_bar(tick, cast(datetime, self.start_dt))
+        else:
+            self.merge_tick(self.bar, tick)
+
+        self.merge_tick_change(cast(BarData, self.bar), tick)
+
+    def update_bar(self, bar: BarData) -> None:
+        """
+        Update smaller bar data into generator, the window bar is pushed
+        immediately when the bar reaches end of window.
+        """
+        new_window: bool | None = self.check_window(bar.datetime, False)
+        if new_window is None:
+            return
+
+        if new_window or not self.bar:
+            self.new_bar_bar(bar, cast(datetime, self.start_dt))
+        else:
+            self.merge_bar(bar)
+
+        if self.end_dt and bar.datetime + self.bar_period >= self.end_dt:
+            self.generate()
+
+
+class VolumeBarGenerator(BaseBarGenerator):
+    """
+    For generating bars of fixed trading volume (or turnover) from tick
+    data or smaller bars. A bar is pushed as soon as its volume reaches
+    the threshold, excess volume is kept in the bar.
+
+    Bar datetime is the datetime of the first data in the bar.
+    """
+
+    def __init__(
+        self,
+        on_bar: Callable,
+        threshold: float,
+        turnover: bool = False
+    ) -> None:
+        """
+        Use turnover instead of volume as threshold if turnover is True.
+        """
+        super().__init__(on_bar)
+
+        self.threshold: float = threshold
+        self.turnover: bool = turnover
+
+    def update_tick(self, tick: TickData) -> None:
+        """
+        Update new tick data into generator.
+        """
+        # Filter tick data with 0 last price
+        if not tick.last_price:
+            return
+
+        if not self.bar:
+            self.new_tick_bar(tick, tick.datetime)
+        else:
+            self.merge_tick(self.bar, tick)
+
+        bar: BarData = cast(BarData, self.bar)
+        self.merge_tick_change(bar, tick)
+        self.check_threshold(bar)
+
+    def update_bar(self, bar: BarData) -> None:
+        """
+        Update smaller bar data into generator.
+        """
+        if not self.bar:
+            self.new_bar_bar(bar, bar.datetime)
+        else:
+            self.merge_bar(bar)
+
+        self.check_threshold(cast(BarData, self.bar))
+
+    def check_threshold(self, bar: BarData) -> None:
+        """
+        Push bar if volume or turnover reaches threshold.
+        """
+        if self.turnover:
+            value: float = bar.turnover
+        else:
+            value = bar.volume
+
+        if value >= self.threshold:
+            self.generate()
+
+
+def memoize(func: FunctionType) -> FunctionType:
+    """
+    Mark indicator function of ArrayManager, whose result is cached
+    until next bar is updated when cache is enabled.
+    """
+    func.memoized = True      # type: ignore
+    return func
+
+
+def create_cached_method(am: "ArrayManager", func: FunctionType) -> Callable:
+    """
+    Create method of indicator function bound to array manager, which
+    caches result with arguments as key.
+    """
+    name: str = func.__name__
+    cache_data: dict[tuple, Any] = am.cache_data
+
+    # Normalize arguments with defaults, so that sma(5), sma(n=5) and
+    # sma(5, False) share the same cache entry
+    parameters: list[Parameter] = list(signature(func).parameters.values())[1:]
+    names: tuple[str, ...] = tuple(p.name for p in parameters)
+    defaults: tuple = tuple(p.default for p in parameters)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        n: int = len(args)
+
+        if kwargs:
+            values: tuple = args + tuple(
+                kwargs.get(k, d) for k, d in zip(names[n:], defaults[n:], strict=True)
+            )
+
+            # Let function raise TypeError for invalid arguments
+            if not kwargs.keys() <= set(names[n:]) or Parameter.empty in values:
+                return func(am, *args, **kwargs)
+        else:
+            values = args + defaults[n:]
+
+        key: tuple = (name, values)
+
+        result: Any = cache_data.get(key, None)
+        if result is not None:
+            am.cache_hit += 1
+            return result
+
+        am.cache_miss += 1
+        result = func(am, *values)
+
+        # Cached arrays are shared by callers
+        if isinstance(result, np.ndarray):
+            result.flags.writeable = False
+        elif isinstance(result, tuple):
+            for item in result:
+                if isinstance(item, np.ndarray):
+                    item.flags.writeable = False
+
+        cache_data[key] = result
+        return result
+
+    return wrapper
+
 
 class ArrayManager:
     """
     For:
     1. time series container of bar data
     2. calculating technical indicator value
+
+    If incremental is enabled, latest values of SMA, EMA, STD, BOLL, ATR,
+    RSI and MACD are calculated with O(1) running state for each bar.
+
+    If cache is enabled, indicator results are cached until next bar is
+    updated, so repeated queries with same parameters are not calculated
+    again. Cached arrays are shared by callers and so are read-only.
+    Indicator functions are not wrapped if cache is not enabled.
+
+    Time series are stored in a ring buffer instead of arrays shifted in
+    place, which changes how the arrays can be used:
+    1. open_array, close_array and other *_array properties return
+       writable copies, which stay valid after update_bar but modifying
+       them no longer changes data in the array manager.
+    2. open, close and other properties return read-only views without
+       copying, which are used by indicators and only hold the latest
+       values in time order until next bar is updated.
     """
 
-    def __init__(self, size: int = 100) -> None:
+    def __init__(
+        self,
+        size: int = 100,
+        incremental: bool = False,
+        cache: bool = False
+    ) -> None:
         """Constructor"""
         self.count: int = 0
         self.size: int = size
         self.inited: bool = False
 
-        self.open_array: np.ndarray = np.zeros(size)
-        self.high_array: np.ndarray = np.zeros(size)
-        self.low_array: np.ndarray = np.zeros(size)
-        self.close_array: np.ndarray = np.zeros(size)
-        self.volume_array: np.ndarray = np.zeros(size)
-        self.turnover_array: np.ndarray = np.zeros(size)
-        self.open_interest_array: np.ndarray = np.zeros(size)
+        # Time series are stored in a ring buffer with doubled length,
+        # every value is written twice so that the latest size values
+        # are always available as a contiguous view.
+        self.buffer: np.ndarray = np.zeros((7, size * 2))
+        self.index: int = 0
+
+        self.incremental: bool = incremental
+        self.indicators: dict[tuple, IncrementalIndicator] = {}
+
+        self.cache: bool = cache
+        self.cache_data: dict[tuple, Any] = {}
+        self.cache_hit: int = 0
+        self.cache_miss: int = 0
+
+        if cache:
+            for name in dir(type(self)):
+                func: Any = getattr(type(self), name)
+                if getattr(func, "memoized", False):
+                    setattr(self, name, create_cached_method(self, func))
 
     def update_bar(self, bar: BarData) -> None:
         """
@@ -513,75 +1159,164 @@ class ArrayManager:
         if not self.inited and self.count >= self.size:
             self.inited = True
 
-        self.open_array[:-1] = self.open_array[1:]
-        self.high_array[:-1] = self.high_array[1:]
-        self.low_array[:-1] = self.low_array[1:]
-        self.close_array[:-1] = self.close_array[1:]
-        self.volume_array[:-1] = self.volume_array[1:]
-        self.turnover_array[:-1] = self.turnover_array[1:]
-        self.open_interest_array[:-1] = self.open_interest_array[1:]
-
-        self.open_array[-1] = bar.open_price
-        self.high_array[-1] = bar.high_price
-        self.low_array[-1] = bar.low_price
-        self.close_array[-1] = bar.close_price
-        self.volume_array[-1] = bar.volume
-        self.turnover_array[-1] = bar.turnover
-        self.open_interest_array[-1] = bar.open_interest
+        values: tuple[float, ...] = (
+            bar.open_price,
+            bar.high_price,
+            bar.low_price,
+            bar.close_price,
+            bar.volume,
+            bar.turnover,
+            bar.open_interest
+        )
+
+        ix: int = self.index
+        self.buffer[:, ix] = values
+        self.buffer[:, ix + self.size] = values
+
+        self.index = (ix + 1) % self.size
+
+        if self.cache_data:
+            self.cache_data.clear()
+
+        for indicator in self.indicators.values():
+            indicator.update(bar.high_price, bar.low_price, bar.close_price)
+
+    def get_indicator(self, indicator_class: type[IndicatorType], *args: int) -> IndicatorType | None:
+        """
+        Get incremental indicator, which is created and seeded from
+        current time series if not exists yet.
+
+        Return None if array manager is not inited, since seeding from
+        the zero padded window gives recursive indicators a wrong start,
+        or if there is not enough data for seeding.
+        """
+        if not self.inited:
+            return None
+
+        key: tuple = (indicator_class, *args)
+
+        indicator: IndicatorType | None = self.indicators.get(key, None)      # type: ignore
+        if indicator:
+            return indicator
+
+        indicator = indicator_class(*args)
+        indicator.seed(self.high, self.low, self.close)
+        if not indicator.inited:
+            return None
+
+        self.indicators[key] = indicator
+        return indicator
+
+    def get_array(self, row: int) -> np.ndarray:
+        """
+        Get writable copy of time series.
+        """
+        array: np.ndarray = self.buffer[row, self.index:self.index + self.size].copy()
+        return array
+
+    def get_view(self, row: int) -> np.ndarray:
+        """
+        Get read-only contiguous view of time series in ring buffer,
+        which is only valid until next bar is updated.
+        """
+        array: np.ndarray = self.buffer[row, self.index:self.index + self.size]
+        array.flags.writeable = False
+        return array
+
+    @property
+    def open_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(0)
+
+    @property
+    def high_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(1)
+
+    @property
+    def low_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(2)
+
+    @property
+    def close_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(3)
+
+    @property
+    def volume_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(4)
+
+    @property
+    def turnover_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(5)
+
+    @property
+    def open_interest_array(self) -> np.ndarray:
+        """"""
+        return self.get_array(6)
 
     @property
     def open(self) -> np.ndarray:
         """
         Get open price time series.
         """
-        return self.open_array
+        return self.get_view(0)
 
     @property
     def high(self) -> np.ndarray:
         """
         Get high price time series.
         """
-        return self.high_array
+        return self.get_view(1)
 
     @property
     def low(self) -> np.ndarray:
         """
         Get low price time series.
         """
-        return self.low_array
+        return self.get_view(2)
 
     @property
     def close(self) -> np.ndarray:
         """
         Get close price time series.
         """
-        return self.close_array
+        return self.get_view(3)
 
     @property
     def volume(self) -> np.ndarray:
         """
         Get trading volume time series.
         """
-        return self.volume_array
+        return self.get_view(4)
 
     @property
     def turnover(self) -> np.ndarray:
         """
         Get trading turnover time series.
         """
-        return self.turnover_array
+        return self.get_view(5)
 
     @property
     def open_interest(self) -> np.ndarray:
         """
         Get trading volume time series.
         """
-        return self.open_interest_array
+        return self.get_view(6)
 
+    @memoize
     def sma(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Simple moving average.
         """
+        if self.incremental and not array:
+            indicator: SmaIndicator | None = self.get_indicator(SmaIndicator, n)
+            if indicator:
+                return indicator.value
+
         result_array: np.ndarray = talib.SMA(self.close, n)
         if array:
             return result_array
@@ -589,10 +1324,16 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def ema(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Exponential moving average.
         """
+        if self.incremental and not array:
+            indicator: EmaIndicator | None = self.get_indicator(EmaIndicator, n)
+            if indicator:
+                return indicator.value
+
         result_array: np.ndarray = talib.EMA(self.close, n)
         if array:
             return result_array
@@ -600,6 +1341,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def kama(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         KAMA.
@@ -611,6 +1353,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def wma(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         WMA.
@@ -622,6 +1365,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def apo(
         self,
         fast_period: int,
@@ -639,6 +1383,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def cmo(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         CMO.
@@ -650,6 +1395,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def mom(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         MOM.
@@ -661,6 +1407,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def ppo(
         self,
         fast_period: int,
@@ -678,6 +1425,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def roc(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ROC.
@@ -689,6 +1437,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def rocr(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ROCR.
@@ -700,6 +1449,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def rocp(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ROCP.
@@ -711,6 +1461,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def rocr_100(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ROCR100.
@@ -722,6 +1473,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def trix(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         TRIX.
@@ -733,10 +1485,16 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def std(self, n: int, nbdev: int = 1, array: bool = False) -> float | np.ndarray:
         """
         Standard deviation.
         """
+        if self.incremental and not array:
+            indicator: StdIndicator | None = self.get_indicator(StdIndicator, n)
+            if indicator:
+                return indicator.value * nbdev
+
         result_array: np.ndarray = talib.STDDEV(self.close, n, nbdev)
         if array:
             return result_array
@@ -744,6 +1502,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def obv(self, array: bool = False) -> float | np.ndarray:
         """
         OBV.
@@ -755,6 +1514,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def cci(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Commodity Channel Index (CCI).
@@ -766,10 +1526,16 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def atr(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Average True Range (ATR).
         """
+        if self.incremental and not array:
+            indicator: AtrIndicator | None = self.get_indicator(AtrIndicator, n)
+            if indicator:
+                return indicator.value
+
         result_array: np.ndarray = talib.ATR(self.high, self.low, self.close, n)
         if array:
             return result_array
@@ -777,6 +1543,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def natr(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         NATR.
@@ -788,10 +1555,16 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def rsi(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Relative Strenght Index (RSI).
         """
+        if self.incremental and not array:
+            indicator: RsiIndicator | None = self.get_indicator(RsiIndicator, n)
+            if indicator:
+                return indicator.value
+
         result_array: np.ndarray = talib.RSI(self.close, n)
         if array:
             return result_array
@@ -799,6 +1572,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def macd(
         self,
         fast_period: int,
@@ -809,6 +1583,13 @@ class ArrayManager:
         """
         MACD.
         """
+        if self.incremental and not array:
+            indicator: MacdIndicator | None = self.get_indicator(
+                MacdIndicator, fast_period, slow_period, signal_period
+            )
+            if indicator:
+                return indicator.value
+
         macd, signal, hist = talib.MACD(
             self.close, fast_period, slow_period, signal_period
         )
@@ -816,6 +1597,7 @@ class ArrayManager:
             return macd, signal, hist
         return macd[-1], signal[-1], hist[-1]
 
+    @memoize
     def adx(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ADX.
@@ -827,6 +1609,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def adxr(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         ADXR.
@@ -838,6 +1621,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def dx(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         DX.
@@ -849,6 +1633,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def minus_di(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         MINUS_DI.
@@ -860,6 +1645,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def plus_di(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         PLUS_DI.
@@ -871,6 +1657,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def willr(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         WILLR.
@@ -882,6 +1669,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def ultosc(
         self,
         time_period1: int = 7,
@@ -899,6 +1687,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def trange(self, array: bool = False) -> float | np.ndarray:
         """
         TRANGE.
@@ -910,6 +1699,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def boll(
         self,
         n: int,
@@ -919,6 +1709,15 @@ class ArrayManager:
         """
         Bollinger Channel.
         """
+        if self.incremental and not array:
+            sma_indicator: SmaIndicator | None = self.get_indicator(SmaIndicator, n)
+            std_indicator: StdIndicator | None = self.get_indicator(StdIndicator, n)
+            if sma_indicator and std_indicator:
+                return (
+                    sma_indicator.value + std_indicator.value * dev,
+                    sma_indicator.value - std_indicator.value * dev
+                )
+
         mid_array: np.ndarray = talib.SMA(self.close, n)
         std_array: np.ndarray = talib.STDDEV(self.close, n, 1)
 
@@ -933,6 +1732,7 @@ class ArrayManager:
             down: float = mid - std * dev
             return up, down
 
+    @memoize
     def keltner(
         self,
         n: int,
@@ -956,6 +1756,7 @@ class ArrayManager:
             down: float = mid - atr * dev
             return up, down
 
+    @memoize
     def donchian(
         self, n: int, array: bool = False
     ) -> tuple[np.ndarray, np.ndarray] | tuple[float, float]:
@@ -969,6 +1770,7 @@ class ArrayManager:
             return up, down
         return up[-1], down[-1]
 
+    @memoize
     def aroon(
         self,
         n: int,
@@ -983,6 +1785,7 @@ class ArrayManager:
             return aroon_up, aroon_down
         return aroon_up[-1], aroon_down[-1]
 
+    @memoize
     def aroonosc(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Aroon Oscillator.
@@ -995,6 +1798,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def minus_dm(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         MINUS_DM.
@@ -1007,6 +1811,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def plus_dm(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         PLUS_DM.
@@ -1019,6 +1824,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def mfi(self, n: int, array: bool = False) -> float | np.ndarray:
         """
         Money Flow Index.
@@ -1030,6 +1836,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def ad(self, array: bool = False) -> float | np.ndarray:
         """
         AD.
@@ -1041,6 +1848,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def adosc(
         self,
         fast_period: int,
@@ -1057,6 +1865,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def bop(self, array: bool = False) -> float | np.ndarray:
         """
         BOP.
@@ -1069,6 +1878,7 @@ class ArrayManager:
         result_value: float = result_array[-1]
         return result_value
 
+    @memoize
     def stoch(
         self,
         fastk_period: int,
@@ -1095,6 +1905,7 @@ class ArrayManager:
             return k, d
         return k[-1], d[-1]
 
+    @memoize
     def sar(self, acceleration: float, maximum: float, array: bool = False) -> float | np.ndarray:
         """
         SAR.
@@ -1107,6 +1918,283 @@ class ArrayManager:
         return result_value
 
 
+class PanelArrayManager:
+    """
+    For:
+    1. time series container of bar data of multiple symbols
+    2. calculating technical indicator value of all symbols in one call
+
+    Time series are stored as 2D arrays with shape (symbols, size), and
+    indicator results are vectors over symbols in the order of vt_symbols,
+    or 2D arrays if array output is requested.
+
+    Same as ArrayManager, get_array returns writable copy while open,
+    close and other properties return read-only views of ring buffer.
+    """
+
+    def __init__(self, vt_symbols: list[str], size: int = 100) -> None:
+        """Constructor"""
+        self.vt_symbols: list[str] = vt_symbols
+        self.symbol_index: dict[str, int] = {
+            vt_symbol: ix for ix, vt_symbol in enumerate(vt_symbols)
+        }
+
+        self.count: int = 0
+        self.size: int = size
+        self.inited: bool = False
+
+        # Same doubled ring buffer layout as ArrayManager
+        self.buffer: np.ndarray = np.zeros((7, len(vt_symbols), size * 2))
+        self.index: int = 0
+
+    def update_bars(self, bars: dict[str, BarData]) -> None:
+        """
+        Update new bar data of symbols into panel array manager.
+
+        Symbols without new bar are forward filled with last close price
+        and zero volume.
+        """
+        self.count += 1
+        if not self.inited and self.count >= self.size:
+            self.inited = True
+
+        ix: int = self.index
+        values: np.ndarray = self.buffer[:, :, ix + self.size - 1].copy()
+        values[:3] = values[3]
+        values[4:6] = 0
+
+        for vt_symbol, bar in bars.items():
+            symbol_ix: int | None = self.symbol_index.get(vt_symbol, None)
+            if symbol_ix is None:
+                raise ValueError(_("合约{}不在PanelArrayManager的合约列表中").format(vt_symbol))
+
+            values[:, symbol_ix] = (
+                bar.open_price,
+                bar.high_price,
+                bar.low_price,
+                bar.close_price,
+                bar.volume,
+                bar.turnover,
+                bar.open_interest
+            )
+
+        self.buffer[:, :, ix] = values
+        self.buffer[:, :, ix + self.size] = values
+
+        self.index = (ix + 1) % self.size
+
+    def get_array(self, row: int) -> np.ndarray:
+        """
+        Get writable copy of time series of all symbols.
+        """
+        array: np.ndarray = self.buffer[row, :, self.index:self.index + self.size].copy()
+        return array
+
+    def get_view(self, row: int) -> np.ndarray:
+        """
+        Get read-only view of time series of all symbols in ring buffer,
+        which is only valid until next bars are updated.
+        """
+        array: np.ndarray = self.buffer[row, :, self.index:self.index + self.size]
+        array.flags.writeable = False
+        return array
+
+    @property
+    def open(self) -> np.ndarray:
+        """
+        Get open price time series.
+        """
+        return self.get_view(0)
+
+    @property
+    def high(self) -> np.ndarray:
+        """
+        Get high price time series.
+        """
+        return self.get_view(1)
+
+    @property
+    def low(self) -> np.ndarray:
+        """
+        Get low price time series.
+        """
+        return self.get_view(2)
+
+    @property
+    def close(self) -> np.ndarray:
+        """
+        Get close price time series.
+        """
+        return self.get_view(3)
+
+    @property
+    def volume(self) -> np.ndarray:
+        """
+        Get trading volume time series.
+        """
+        return self.get_view(4)
+
+    @property
+    def turnover(self) -> np.ndarray:
+        """
+        Get trading turnover time series.
+        """
+        return self.get_view(5)
+
+    @property
+    def open_interest(self) -> np.ndarray:
+        """
+        Get open interest time series.
+        """
+        return self.get_view(6)
+
+    def smooth(self, data: np.ndarray, n: int, k: float, array: bool) -> np.ndarray:
+        """
+        Recursive smoothing along time axis, seeded with average of first
+        n values in the same way as TA-Lib.
+
+        Value after t more steps is decay^t * (value + k * sum(x_j * decay^-j)),
+        which is calculated with cumsum in chunks short enough for decay^-j
+        not to overflow.
+        """
+        value: np.ndarray = data[:, :n].mean(axis=1)
+        rest: np.ndarray = data[:, n:]
+        count: int = rest.shape[1]
+        decay: float = 1 - k
+
+        if not array:
+            weights: np.ndarray = decay ** np.arange(count - 1, -1, -1)
+            last: np.ndarray = decay ** count * value + k * (rest @ weights)
+            return last
+
+        result: np.ndarray = np.full(data.shape, np.nan)
+        result[:, n - 1] = value
+
+        if decay <= 0:
+            result[:, n:] = rest
+            return result
+
+        chunk: int = max(int(50 / -np.log10(decay)), 1)
+
+        for start in range(0, count, chunk):
+            x: np.ndarray = rest[:, start:start + chunk]
+            steps: np.ndarray = np.arange(1, x.shape[1] + 1)
+
+            values: np.ndarray = decay ** steps * (
+                value[:, None] + k * np.cumsum(x * decay ** -steps, axis=1)
+            )
+            result[:, n + start:n + start + x.shape[1]] = values
+            value = values[:, -1]
+
+        return result
+
+    def rolling(self, data: np.ndarray, n: int) -> np.ndarray:
+        """
+        Get rolling windows along time axis with shape (symbols, size - n + 1, n).
+        """
+        return np.lib.stride_tricks.sliding_window_view(data, n, axis=1)
+
+    def pad(self, data: np.ndarray) -> np.ndarray:
+        """
+        Pad result with nan at the beginning to length of size.
+        """
+        result: np.ndarray = np.full((data.shape[0], self.size), np.nan)
+        result[:, self.size - data.shape[1]:] = data
+        return result
+
+    def sma(self, n: int, array: bool = False) -> np.ndarray:
+        """
+        Simple moving average.
+        """
+        if array:
+            return self.pad(self.rolling(self.close, n).mean(axis=2))
+
+        result: np.ndarray = self.close[:, -n:].mean(axis=1)
+        return result
+
+    def ema(self, n: int, array: bool = False) -> np.ndarray:
+        """
+        Exponential moving average.
+        """
+        return self.smooth(self.close, n, 2 / (n + 1), array)
+
+    def std(self, n: int, nbdev: int = 1, array: bool = False) -> np.ndarray:
+        """
+        Standard deviation.
+        """
+        if array:
+            variance: np.ndarray = self.pad(self.rolling(self.close, n).var(axis=2))
+        else:
+            variance = self.close[:, -n:].var(axis=1)
+
+        variance[variance < 0.00000001] = 0
+
+        result: np.ndarray = np.sqrt(variance) * nbdev
+        return result
+
+    def boll(
+        self,
+        n: int,
+        dev: float,
+        array: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Bollinger Channel.
+        """
+        mid: np.ndarray = self.sma(n, array)
+        std: np.ndarray = self.std(n, 1, array)
+
+        up: np.ndarray = mid + std * dev
+        down: np.ndarray = mid - std * dev
+        return up, down
+
+    def atr(self, n: int, array: bool = False) -> np.ndarray:
+        """
+        Average True Range (ATR).
+        """
+        pre_close: np.ndarray = self.close[:, :-1]
+        high: np.ndarray = np.maximum(self.high[:, 1:], pre_close)
+        low: np.ndarray = np.minimum(self.low[:, 1:], pre_close)
+
+        result: np.ndarray = self.smooth(high - low, n, 1 / n, array)
+        if array:
+            return self.pad(result)
+        return result
+
+    def rsi(self, n: int, array: bool = False) -> np.ndarray:
+        """
+        Relative Strenght Index (RSI).
+        """
+        diff: np.ndarray = np.diff(self.close, axis=1)
+        gain: np.ndarray = self.smooth(diff.clip(min=0), n, 1 / n, array)
+        loss: np.ndarray = self.smooth(-diff.clip(max=0), n, 1 / n, array)
+
+        total: np.ndarray = gain + loss
+        zero: np.ndarray = np.abs(total) < 0.00000001
+
+        result: np.ndarray = 100 * gain / np.where(zero, 1, total)
+        result[zero] = 0
+
+        if array:
+            return self.pad(result)
+        return result
+
+    def donchian(
+        self, n: int, array: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Donchian Channel.
+        """
+        if array:
+            up: np.ndarray = self.pad(self.rolling(self.high, n).max(axis=2))
+            down: np.ndarray = self.pad(self.rolling(self.low, n).min(axis=2))
+        else:
+            up = self.high[:, -n:].max(axis=1)
+            down = self.low[:, -n:].min(axis=1)
+
+        return up, down
+
+
 def virtual(func: Callable) -> Callable:
     """
     mark a function as "virtual", which means that this function can be override.